@@ -0,0 +1,20 @@
+"""Turumba slide decks built with python-pptx.
+
+Each deck module exposes its slides as functions (``SLIDES``) and a
+``build_*(output)`` entry point; ``decks.batch`` builds many decks in a
+process pool.
+"""
+
+__all__ = ["build_agentic", "build_overview"]
+
+
+def __getattr__(name):
+    # Deck modules are imported on first use, not with the package, so ``python -m decks.<module>``
+    # runs a module that is not already in sys.modules.
+    if name == "build_agentic":
+        from decks.agentic import build_agentic
+        return build_agentic
+    if name == "build_overview":
+        from decks.overview import build_overview
+        return build_overview
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
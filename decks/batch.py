@@ -0,0 +1,95 @@
+"""
+Build many decks in one go using a process pool.
+
+Jobs are DECK:OUTPUT pairs on the command line or a JSON list of
+{"deck": ..., "output": ...} objects. Each worker pays the interpreter and
+python-pptx import cost once and reuses the sized template for every deck it
+builds, so per-deck cost is just slide construction and serialization.
+
+Usage:
+    python -m decks.batch overview:build/overview.pptx agentic:build/agentic.pptx
+    python -m decks.batch --jobs jobs.json --workers 8
+"""
+
+import argparse
+import json
+import multiprocessing
+import time
+from pathlib import Path
+
+from decks.agentic import build_agentic
+from decks.helpers import new_presentation
+from decks.overview import build_overview
+
+
+BUILDERS = {
+    "overview": build_overview,
+    "agentic": build_agentic,
+}
+
+
+def parse_job(spec: str) -> tuple[str, str]:
+    deck, sep, output = spec.partition(":")
+    if not sep or deck not in BUILDERS or not output:
+        raise ValueError(f"expected DECK:OUTPUT with DECK in {', '.join(BUILDERS)}, got {spec!r}")
+    return deck, output
+
+
+def load_jobs(path: str) -> list[tuple[str, str]]:
+    with open(path, encoding="utf-8") as f:
+        return [parse_job(f"{job['deck']}:{job['output']}") for job in json.load(f)]
+
+
+def _init_worker() -> None:
+    new_presentation()  # build the cached template before the first job arrives
+
+
+def build_job(job: tuple[str, str]) -> dict:
+    deck, output = job
+    Path(output).parent.mkdir(parents=True, exist_ok=True)
+    started = time.perf_counter()
+    prs = BUILDERS[deck](output)
+    return {"deck": deck, "output": output, "slides": len(prs.slides), "seconds": time.perf_counter() - started}
+
+
+def build_all(jobs: list[tuple[str, str]], workers: int) -> list[dict]:
+    if workers <= 1:
+        _init_worker()
+        return [build_job(job) for job in jobs]
+    chunksize = max(1, len(jobs) // (workers * 4))
+    with multiprocessing.Pool(workers, initializer=_init_worker) as pool:
+        return list(pool.imap(build_job, jobs, chunksize=chunksize))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Build many Turumba decks in a process pool")
+    parser.add_argument("decks", nargs="*", help="DECK:OUTPUT pairs, e.g. overview:build/overview.pptx")
+    parser.add_argument("--jobs", type=str, default=None, help="JSON file with a list of {deck, output} jobs")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=multiprocessing.cpu_count(),
+        help="Worker processes (default: CPU count)",
+    )
+    args = parser.parse_args()
+
+    try:
+        jobs = [parse_job(spec) for spec in args.decks]
+        if args.jobs:
+            jobs += load_jobs(args.jobs)
+    except ValueError as exc:
+        parser.error(str(exc))
+    if not jobs:
+        parser.error("no jobs given")
+
+    print(f"Building {len(jobs)} decks with {args.workers} workers...")
+    started = time.perf_counter()
+    results = build_all(jobs, args.workers)
+    elapsed = time.perf_counter() - started
+    for result in results:
+        print(f"  {result['output']}: {result['slides']} slides in {result['seconds'] * 1000:.0f} ms")
+    print(f"Built {len(results)} decks in {elapsed:.2f}s ({len(results) / elapsed:.1f} decks/sec)")
+
+
+if __name__ == "__main__":
+    main()
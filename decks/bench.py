@@ -0,0 +1,364 @@
+"""
+Benchmark and profile the deck builders.
+
+Measures, for the current checkout:
+
+- every drawing helper and its ``add_*`` twin, in microseconds per call
+- every slide function of every deck, in milliseconds, with its shape count
+- each full deck build and ``prs.save``, with output size and peak memory
+
+Timings are the best of ``--repeat`` runs. Results are written as JSON and
+compared against the checked-in baseline (decks/bench_baseline.json); timings
+that got slower than ``--tolerance`` are flagged as regressions, and shape
+counts or output sizes that changed at all are reported. Raw timings are
+compared by default, so the baseline is best refreshed
+(``--update-baseline``) on the machine you compare on. Both runs also
+record a fixed lxml calibration workload, timed before every benchmark
+phase and summarized by its median. ``--normalize`` reports timings
+relative to it, for comparisons across machines. Either way, a timing
+counts as a regression (and fails ``--check``) only when it is slower in
+both the raw and the calibrated comparison, so neither a noisy calibration
+nor a busy machine alone can fail the check.
+
+Usage:
+    python -m decks.bench
+    python -m decks.bench --json build/bench.json --profile build/decks.prof
+    python -m decks.bench --check            # exit 1 on regressions
+    python -m decks.bench --normalize        # report timings relative to the calibration
+    python -m decks.bench --update-baseline
+"""
+
+import argparse
+import cProfile
+import gc
+import io
+import json
+import multiprocessing
+import platform
+import resource
+import statistics
+import sys
+import time
+from pathlib import Path
+
+import pptx
+from lxml import etree
+from pptx.util import Inches, Pt
+
+from decks import helpers
+from decks.helpers import blank, new_presentation
+from decks.incremental import DECKS, as_spec
+from decks.theme import ACCENT_BLUE, ACCENT_TEAL, DARK_CARD, GREEN, MED_GRAY, SECTION_BG
+
+BASELINE = Path(__file__).with_name("bench_baseline.json")
+CALLS_PER_SLIDE = 50
+CALIBRATION_ELEMENTS = 10000    # ~200 ms per calibration sample
+
+_L, _T, _W, _H = Inches(1), Inches(1), Inches(4), Inches(2.5)
+_ITEMS = ["Tenant-scoped queries", "Event outbox", ("Bold line", True), ("Teal line", False, ACCENT_TEAL)]
+
+HELPER_CASES = {
+    "set_bg": lambda s: helpers.set_bg(s),
+    "rect": lambda s: helpers.rect(s, _L, _T, _W, _H, DARK_CARD),
+    "rr": lambda s: helpers.rr(s, _L, _T, _W, _H, SECTION_BG, ACCENT_BLUE, Pt(1.5)),
+    "circle": lambda s: helpers.circle(s, _L, _T, Inches(.5), GREEN),
+    "txt": lambda s: helpers.txt(s, "Turumba Gateway", _L, _T, _W, Inches(.4), sz=15, clr=ACCENT_BLUE, bold=True),
+    "ml": lambda s: helpers.ml(s, _ITEMS, _L, _T, _W, _H, sz=12, bullet=True),
+    "card": lambda s: helpers.card(s, _L, _T, _W, _H, "Account API", _ITEMS),
+    "section": lambda s: helpers.section(s, 2, "Services", "What each one owns"),
+    "stitle": lambda s: helpers.stitle(s, "System Overview", "How requests flow"),
+    "set_slide_bg": lambda s: helpers.set_slide_bg(s, SECTION_BG),
+    "add_shape": lambda s: helpers.add_shape(s, _L, _T, _W, _H, SECTION_BG, ACCENT_BLUE, Pt(1.5)),
+    "add_rect": lambda s: helpers.add_rect(s, _L, _T, _W, _H, DARK_CARD),
+    "add_text": lambda s: helpers.add_text(s, "Turumba Gateway", _L, _T, _W, Inches(.4), font_size=16, bold=True),
+    "add_multiline": lambda s: helpers.add_multiline(s, _ITEMS, _L, _T, _W, _H, font_size=13, color=MED_GRAY),
+    "add_card": lambda s: helpers.add_card(s, _L, _T, _W, _H, "Account API", _ITEMS),
+    "slide_title": lambda s: helpers.slide_title(s, "System Overview", "How requests flow"),
+}
+
+
+# ── Memory ──
+
+def _reset_peak_rss() -> bool:
+    """Reset the kernel's high-water mark (VmHWM) so the next reading covers only what follows."""
+    try:
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")
+        return True
+    except OSError:
+        return False
+
+
+def _peak_rss_mb() -> float:
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+# ── Measurements ──
+
+def bench_helpers(calls: int, repeat: int) -> dict:
+    results = {}
+    for name, call in HELPER_CASES.items():
+        best = float("inf")
+        for _ in range(repeat):
+            prs = new_presentation()
+            slides = [blank(prs) for _ in range(-(-calls // CALLS_PER_SLIDE))]
+            started = time.perf_counter()
+            for i in range(calls):
+                call(slides[i // CALLS_PER_SLIDE])
+            best = min(best, time.perf_counter() - started)
+        results[name] = {"us_per_call": best / calls * 1e6}
+    return results
+
+
+def bench_slides(deck: str, repeat: int) -> dict:
+    results = {}
+    for spec in map(as_spec, DECKS[deck]):
+        best = float("inf")
+        shapes = 0
+        for _ in range(repeat):
+            slide = blank(new_presentation())
+            started = time.perf_counter()
+            spec.render(slide)
+            best = min(best, time.perf_counter() - started)
+            shapes = len(slide.shapes)
+        results[spec.build.__name__] = {"ms": best * 1e3, "shapes": shapes}
+    return results
+
+
+def _build(deck: str):
+    prs = new_presentation()
+    for spec in map(as_spec, DECKS[deck]):
+        spec.render(blank(prs))
+    return prs
+
+
+def bench_deck(deck: str, repeat: int) -> dict:
+    build_s = save_s = float("inf")
+    size = 0
+    for _ in range(repeat):
+        started = time.perf_counter()
+        prs = _build(deck)
+        built = time.perf_counter()
+        buffer = io.BytesIO()
+        prs.save(buffer)
+        build_s = min(build_s, built - started)
+        save_s = min(save_s, time.perf_counter() - built)
+        size = buffer.tell()
+
+    with multiprocessing.get_context("spawn").Pool(1) as pool:
+        peak, delta = pool.apply(_deck_memory, (deck,))
+    return {
+        "slides": len(prs.slides),
+        "shapes": sum(len(s.shapes) for s in prs.slides),
+        "build_ms": build_s * 1e3,
+        "save_ms": save_s * 1e3,
+        "bytes": size,
+        "peak_rss_mb": peak,
+        "peak_rss_delta_mb": delta,
+    }
+
+
+def _deck_memory(deck: str) -> tuple[float, float | None]:
+    """Peak RSS of one build and save, run in a fresh interpreter so earlier benchmarks don't mask it."""
+    new_presentation()
+    tracked = _reset_peak_rss()
+    before = _peak_rss_mb()
+    _build(deck).save(io.BytesIO())
+    peak = _peak_rss_mb()
+    return peak, (peak - before if tracked else None)
+
+
+def run(calls: int, repeat: int) -> dict:
+    new_presentation()  # read the template before anything is timed
+    gc.disable()  # as timeit does: collector pauses land on whichever call happens to trigger them
+    try:
+        return _run(calls, repeat)
+    finally:
+        gc.enable()
+
+
+def calibrate() -> float:
+    """Milliseconds for a fixed lxml workload, to scale timings across slower or busier machines."""
+    started = time.perf_counter()
+    for i in range(CALIBRATION_ELEMENTS):
+        root = etree.Element("sp", id=str(i))
+        for j in range(10):
+            etree.SubElement(root, "r", sz=str(j * 100)).text = "Turumba"
+        etree.tostring(root)
+    return (time.perf_counter() - started) * 1e3
+
+
+def _run(calls: int, repeat: int) -> dict:
+    # Calibration samples are interleaved with the phases, so drift during the run lands in both.
+    samples = [calibrate()]
+    helper_results = bench_helpers(calls, repeat)
+    slides, decks = {}, {}
+    for deck in DECKS:
+        samples.append(calibrate())
+        slides[deck] = bench_slides(deck, repeat)
+        samples.append(calibrate())
+        decks[deck] = bench_deck(deck, repeat)
+    samples.append(calibrate())
+    return {
+        "meta": {
+            "calibration_ms": statistics.median(samples),
+            "calibration_samples_ms": samples,
+            "calibration_elements": CALIBRATION_ELEMENTS,
+            "python": platform.python_version(),
+            "python_pptx": pptx.__version__,
+            "machine": platform.machine(),
+            "calls": calls,
+            "repeat": repeat,
+        },
+        "helpers": helper_results,
+        "slides": slides,
+        "decks": decks,
+    }
+
+
+def profile(path: str) -> None:
+    profiler = cProfile.Profile()
+    profiler.enable()
+    for deck in DECKS:
+        _build(deck).save(io.BytesIO())
+    profiler.disable()
+    profiler.dump_stats(path)
+
+
+# ── Baseline comparison ──
+
+TIMED = ("us_per_call", "ms", "build_ms", "save_ms")
+EXACT = ("shapes", "slides", "bytes")
+
+
+def _metrics(results: dict):
+    for name, row in results["helpers"].items():
+        yield f"helpers.{name}", row
+    for deck, rows in results["slides"].items():
+        for name, row in rows.items():
+            yield f"slides.{deck}.{name}", row
+    for deck, row in results["decks"].items():
+        yield f"decks.{deck}", row
+
+
+def calibration_scale(current: dict, baseline: dict) -> float:
+    """How much slower this run's machine was than the baseline's, by their calibration medians.
+
+    1.0 when the baseline has no calibration of the same workload to compare with.
+    """
+    base = baseline["meta"]
+    if not base.get("calibration_ms") or base.get("calibration_elements") != current["meta"].get("calibration_elements"):
+        return 1.0
+    return current["meta"]["calibration_ms"] / base["calibration_ms"]
+
+
+def compare(current: dict, baseline: dict, tolerance: float, normalize: bool = False) -> tuple[list[str], list[str]]:
+    """Return (regressions, notes) of ``current`` against ``baseline``.
+
+    Ratios are shown raw, or divided by ``calibration_scale`` with
+    ``normalize``. A timing is a regression only if it is slower than the
+    tolerance both raw and normalized; slower in just one is a note.
+    """
+    old = dict(_metrics(baseline))
+    scale = calibration_scale(current, baseline)
+    regressions, notes = [], []
+    for name, row in _metrics(current):
+        base = old.get(name)
+        if base is None:
+            notes.append(f"{name}: new")
+            continue
+        for key in TIMED:
+            if key in row and base.get(key):
+                raw = row[key] / base[key]
+                ratio = raw / scale if normalize else raw
+                line = f"{name}.{key}: {base[key]:.2f} -> {row[key]:.2f} ({ratio:.2f}x"
+                slower = (raw > 1 + tolerance, raw / scale > 1 + tolerance)
+                if all(slower):
+                    regressions.append(line + ")")
+                elif any(slower):
+                    notes.append(line + f", slower only {'raw' if slower[0] else 'normalized'})")
+                elif ratio < 1 - tolerance:
+                    notes.append(line + ", faster)")
+        for key in EXACT:
+            if key in row and key in base and row[key] != base[key]:
+                notes.append(f"{name}.{key}: {base[key]} -> {row[key]}")
+    return regressions, notes
+
+
+# ── Report ──
+
+def report(results: dict) -> None:
+    print("Helpers (us/call)")
+    for name, row in results["helpers"].items():
+        print(f"  {name:<14} {row['us_per_call']:>9.1f}")
+    for deck, rows in results["slides"].items():
+        print(f"\n{deck} slides (ms, shapes)")
+        for name, row in rows.items():
+            print(f"  {name:<36} {row['ms']:>7.2f} {row['shapes']:>5}")
+    print("\nDecks")
+    for deck, row in results["decks"].items():
+        delta = row["peak_rss_delta_mb"]
+        print(f"  {deck:<10} {row['slides']:>3} slides {row['shapes']:>5} shapes  build {row['build_ms']:>7.1f} ms  "
+              f"save {row['save_ms']:>6.1f} ms  {row['bytes'] / 1024:>6.0f} KiB  peak RSS {row['peak_rss_mb']:.0f} MB"
+              + (f" (+{delta:.1f} MB)" if delta is not None else ""))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the deck helpers, slides and serialization")
+    parser.add_argument("--calls", type=int, default=500, help="Calls per helper per run (default: 500)")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per measurement; the best is kept (default: 3)")
+    parser.add_argument("--json", type=str, default=None, help="Write results to this JSON file")
+    parser.add_argument("--profile", type=str, default=None, help="Write a cProfile dump of full deck builds here")
+    parser.add_argument("--baseline", type=str, default=str(BASELINE), help="Baseline JSON to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="Allowed slowdown before flagging (default: 0.25)")
+    parser.add_argument("--normalize", action="store_true",
+                        help="Report timings relative to the calibration workload (default: raw)")
+    parser.add_argument("--check", action="store_true", help="Exit with status 1 if any timing regressed")
+    parser.add_argument("--update-baseline", action="store_true", help="Overwrite the baseline with these results")
+    args = parser.parse_args()
+
+    results = run(args.calls, args.repeat)
+    report(results)
+
+    if args.json:
+        Path(args.json).parent.mkdir(parents=True, exist_ok=True)
+        Path(args.json).write_text(json.dumps(results, indent=2) + "\n")
+        print(f"\nResults written to: {args.json}")
+    if args.profile:
+        Path(args.profile).parent.mkdir(parents=True, exist_ok=True)
+        profile(args.profile)
+        print(f"Profile written to: {args.profile} (python -m pstats {args.profile})")
+
+    if args.update_baseline:
+        Path(args.baseline).write_text(json.dumps(results, indent=2) + "\n")
+        print(f"Baseline updated: {args.baseline}")
+        return
+
+    try:
+        baseline = json.loads(Path(args.baseline).read_text())
+    except FileNotFoundError:
+        print(f"\nNo baseline at {args.baseline}; run with --update-baseline to create one")
+        return
+    regressions, notes = compare(results, baseline, args.tolerance, args.normalize)
+    scale = calibration_scale(results, baseline)
+    print(f"\nAgainst {args.baseline} (tolerance {args.tolerance:.0%}, {'normalized' if args.normalize else 'raw'} "
+          f"timings, calibration {scale:.2f}x the baseline's):")
+    for line in notes:
+        print(f"  {line}")
+    for line in regressions:
+        print(f"  REGRESSION {line}")
+    if not regressions and not notes:
+        print("  no changes")
+    if regressions and args.check:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+Benchmark the text helpers with and without the paragraph style cache.
+
+Builds the same set of text boxes (a mix of ``txt`` and ``ml`` calls with the
+sizes, colors and fonts the decks use) once per mode, reports shapes/sec and
+checks that both modes serialize to identical slide XML.
+
+Usage:
+    python -m decks.bench_text
+    python -m decks.bench_text --shapes 20000 --repeat 5
+"""
+
+import argparse
+import time
+
+from lxml import etree
+from pptx.util import Inches
+
+from decks import helpers
+from decks.helpers import blank, ml, new_presentation, txt
+from decks.theme import ACCENT_BLUE, ACCENT_TEAL, GREEN, LIGHT_GRAY, MED_GRAY, ORANGE, WHITE
+
+STYLES = [
+    (30, WHITE, True, "Calibri Light"),
+    (16, MED_GRAY, False, "Calibri"),
+    (14, ACCENT_TEAL, True, "Calibri"),
+    (11, LIGHT_GRAY, False, "Calibri"),
+    (10, GREEN, True, "Calibri"),
+    (12, ORANGE, False, "Calibri"),
+    (15, ACCENT_BLUE, True, "Calibri"),
+]
+SHAPES_PER_SLIDE = 40
+
+
+def build(shapes: int, cached: bool):
+    helpers.STYLE_CACHE = cached
+    helpers._ppr_cache.clear()
+    prs = new_presentation()
+    slide = None
+    started = time.perf_counter()
+    for i in range(shapes):
+        if i % SHAPES_PER_SLIDE == 0:
+            slide = blank(prs)
+        sz, clr, bold, font = STYLES[i % len(STYLES)]
+        x, y = Inches(.5 + (i % 4) * 3), Inches(.5 + (i // 4 % 10) * .65)
+        if i % 3:
+            txt(slide, f"Label {i}", x, y, Inches(2.8), Inches(.4), sz=sz, clr=clr, bold=bold, font=font)
+        else:
+            ml(slide, [f"Line {i}", (f"Bold {i}", True), (f"Color {i}", False, clr)],
+               x, y, Inches(2.8), Inches(.6), sz=sz, bullet=True, font=font)
+    elapsed = time.perf_counter() - started
+    return prs, elapsed
+
+
+def slide_xml(prs) -> list[bytes]:
+    return [etree.tostring(slide._element) for slide in prs.slides]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark text helpers with and without the style cache")
+    parser.add_argument("--shapes", type=int, default=10000, help="Text boxes per run (default: 10000)")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per mode; the best is reported (default: 3)")
+    args = parser.parse_args()
+
+    results = {}
+    outputs = {}
+    try:
+        for cached in (False, True):
+            best = min(build(args.shapes, cached)[1] for _ in range(args.repeat))
+            results[cached] = args.shapes / best
+            outputs[cached] = slide_xml(build(min(args.shapes, 400), cached)[0])
+    finally:
+        helpers.STYLE_CACHE = True
+
+    print(f"  property-by-property: {results[False]:>10,.0f} shapes/sec")
+    print(f"  style cache:          {results[True]:>10,.0f} shapes/sec  ({results[True] / results[False]:.2f}x)")
+    print(f"  identical slide XML:  {outputs[False] == outputs[True]}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,227 @@
+"""
+Native pptx charts from string templates, for decks with many charts.
+
+``slide.shapes.add_chart`` builds each chart's XML through python-pptx's
+element classes, writes its data workbook with XlsxWriter, and looks up the
+next free part name by scanning the whole package - twice per chart. Styling
+the series afterwards walks the chart XML once per series. For a report with
+hundreds of charts and series that adds up.
+
+ChartWriter produces the same kind of chart - a chart part with an embedded
+workbook, so it stays editable in PowerPoint - in one pass per chart: the
+XML is joined from fragments prepared once per writer (theme text, axes,
+gridlines), series colors and per-point colors are written inline, the
+workbook is a five-member xlsx written directly, and part names come from
+counters. Category charts only: line, clustered column and clustered bar.
+
+    charts = ChartWriter(prs)
+    charts.add(slide, "line", ["Jan", "Feb"], [("p50", [12.0, 11.5], GREEN)], l, t, w, h)
+"""
+
+import io
+import re
+import zipfile
+from xml.sax.saxutils import escape
+
+from pptx.chart.xlsx import CategoryWorkbookWriter
+from pptx.opc.constants import CONTENT_TYPE as CT
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+from pptx.opc.packuri import PackURI
+from pptx.parts.chart import ChartPart
+from pptx.parts.embeddedpackage import EmbeddedXlsxPart
+
+from decks.theme import DARK_CARD, LIGHT_GRAY, WHITE
+
+KINDS = ("line", "column", "bar")
+_NS = ('xmlns:c="http://schemas.openxmlformats.org/drawingml/2006/chart" '
+       'xmlns:a="http://schemas.openxmlformats.org/drawingml/2006/main" '
+       'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships"')
+_NO_LINE = "<c:spPr><a:noFill/><a:ln><a:noFill/></a:ln></c:spPr>"
+
+
+def _fill(color) -> str:
+    return f'<a:solidFill><a:srgbClr val="{color}"/></a:solidFill>'
+
+
+def _tx_pr(size: int, color) -> str:
+    return (f'<c:txPr><a:bodyPr/><a:lstStyle/><a:p><a:pPr><a:defRPr sz="{size * 100}">{_fill(color)}'
+            f'<a:latin typeface="Calibri"/></a:defRPr></a:pPr><a:endParaRPr lang="en-US"/></a:p></c:txPr>')
+
+
+def _first_free(package, template: str) -> int:
+    return int(re.search(r"(\d+)\.\w+$", package.next_partname(template)).group(1))
+
+
+def _number(value) -> str:
+    return format(value, ".15g")
+
+
+class ChartWriter:
+    """Adds template-built charts to the slides of one presentation.
+
+    The writer numbers the chart and workbook parts it creates itself, so
+    charts in the presentation should all be added through it.
+    """
+
+    def __init__(self, prs, font_size=11, text_color=LIGHT_GRAY, grid_color=DARK_CARD, label_color=WHITE):
+        self.package = prs.part.package
+        self._next_chart = _first_free(self.package, ChartPart.partname_template)
+        self._next_xlsx = _first_free(self.package, EmbeddedXlsxPart.partname_template)
+        self.charts = 0
+        self._tx_pr = _tx_pr(font_size, text_color)
+        self._labels_tx_pr = _tx_pr(max(font_size - 1, 8), label_color)
+        self._grid = f'<c:spPr><a:ln w="9525">{_fill(grid_color)}</a:ln></c:spPr>'
+        self._columns = [CategoryWorkbookWriter._column_reference(n) for n in range(1, 64)]
+
+    def _column(self, n: int) -> str:
+        while n >= len(self._columns):
+            self._columns.append(CategoryWorkbookWriter._column_reference(len(self._columns) + 1))
+        return self._columns[n]
+
+    def add(self, slide, kind, categories, series, l, t, w, h, legend=False, labels=False,
+            number_format="General", point_colors=None):
+        """Add a ``kind`` chart of ``series`` - ``(name, values, color)`` tuples - to ``slide``.
+
+        ``point_colors``, one color (or None) per category, recolors the bars of
+        the first series individually; values may be None for gaps.
+        """
+        if kind not in KINDS:
+            raise ValueError(f"chart kind must be one of {', '.join(KINDS)}, got {kind!r}")
+        categories = [str(c) for c in categories]
+        blob = self.chart_xml(kind, categories, series, legend, labels, number_format, point_colors)
+        chart_part = ChartPart.load(PackURI(ChartPart.partname_template % self._next_chart), CT.DML_CHART,
+                                    self.package, blob)
+        xlsx_part = EmbeddedXlsxPart(PackURI(EmbeddedXlsxPart.partname_template % self._next_xlsx),
+                                     CT.SML_SHEET, self.package, self.workbook(categories, series))
+        self._next_chart += 1
+        self._next_xlsx += 1
+        chart_part.relate_to(xlsx_part, RT.PACKAGE)  # rId1, which chart_xml already points at
+        rId = slide.part.relate_to(chart_part, RT.CHART)
+        self.charts += 1
+        return slide.shapes._add_chart_graphicFrame(rId, l, t, w, h)
+
+    # ── Chart XML ──
+
+    def chart_xml(self, kind, categories, series, legend, labels, number_format, point_colors) -> bytes:
+        rows = len(categories) + 1
+        cat_cache = "".join(f'<c:pt idx="{i}"><c:v>{escape(c)}</c:v></c:pt>' for i, c in enumerate(categories))
+        cat = (f'<c:cat><c:strRef><c:f>Sheet1!$A$2:$A${rows}</c:f><c:strCache><c:ptCount val="{rows - 1}"/>'
+               f'{cat_cache}</c:strCache></c:strRef></c:cat>')
+        fmt = escape(number_format, {'"': "&quot;"})
+        d_lbls = ""
+        if labels:
+            d_lbls = (f'<c:dLbls><c:numFmt formatCode="{fmt}" sourceLinked="0"/>{_NO_LINE}{self._labels_tx_pr}'
+                      '<c:showLegendKey val="0"/><c:showVal val="1"/><c:showCatName val="0"/>'
+                      '<c:showSerName val="0"/><c:showPercent val="0"/><c:showBubbleSize val="0"/></c:dLbls>')
+
+        parts = []
+        for i, (name, values, color) in enumerate(series):
+            col = self._column(i + 1)
+            points = "".join(f'<c:pt idx="{j}"><c:v>{_number(v)}</c:v></c:pt>'
+                             for j, v in enumerate(values) if v is not None)
+            parts.append(
+                f'<c:ser><c:idx val="{i}"/><c:order val="{i}"/><c:tx><c:strRef><c:f>Sheet1!${col}$1</c:f>'
+                f'<c:strCache><c:ptCount val="1"/><c:pt idx="0"><c:v>{escape(name)}</c:v></c:pt></c:strCache>'
+                f'</c:strRef></c:tx>'
+            )
+            if kind == "line":
+                parts.append(f'<c:spPr><a:ln w="28575" cap="rnd">{_fill(color)}<a:round/></a:ln></c:spPr>'
+                             '<c:marker><c:symbol val="none"/></c:marker>')
+            else:
+                parts.append(f'<c:spPr>{_fill(color)}</c:spPr><c:invertIfNegative val="0"/>')
+                if point_colors and i == 0:
+                    parts.extend(f'<c:dPt><c:idx val="{j}"/><c:invertIfNegative val="0"/><c:bubble3D val="0"/>'
+                                 f'<c:spPr>{_fill(pc)}</c:spPr></c:dPt>'
+                                 for j, pc in enumerate(point_colors) if pc is not None)
+            parts.append(d_lbls)
+            parts.append(cat)
+            parts.append(f'<c:val><c:numRef><c:f>Sheet1!${col}$2:${col}${rows}</c:f><c:numCache>'
+                         f'<c:formatCode>General</c:formatCode><c:ptCount val="{rows - 1}"/>{points}'
+                         '</c:numCache></c:numRef></c:val>')
+            parts.append('<c:smooth val="0"/></c:ser>' if kind == "line" else "</c:ser>")
+        sers = "".join(parts)
+
+        if kind == "line":
+            plot = (f'<c:lineChart><c:grouping val="standard"/><c:varyColors val="0"/>{sers}'
+                    '<c:marker val="1"/><c:axId val="1001"/><c:axId val="1002"/></c:lineChart>')
+        else:
+            plot = (f'<c:barChart><c:barDir val="{"bar" if kind == "bar" else "col"}"/>'
+                    f'<c:grouping val="clustered"/><c:varyColors val="0"/>{sers}<c:gapWidth val="60"/>'
+                    '<c:axId val="1001"/><c:axId val="1002"/></c:barChart>')
+        cat_pos, val_pos = ("l", "b") if kind == "bar" else ("b", "l")
+        axes = (
+            f'<c:catAx><c:axId val="1001"/><c:scaling><c:orientation val="minMax"/></c:scaling>'
+            f'<c:delete val="0"/><c:axPos val="{cat_pos}"/><c:numFmt formatCode="General" sourceLinked="1"/>'
+            f'<c:majorTickMark val="none"/><c:minorTickMark val="none"/><c:tickLblPos val="low"/>{self._grid}'
+            '<c:crossAx val="1002"/><c:crosses val="autoZero"/><c:auto val="1"/><c:lblAlgn val="ctr"/>'
+            '<c:lblOffset val="100"/><c:noMultiLvlLbl val="0"/></c:catAx>'
+            f'<c:valAx><c:axId val="1002"/><c:scaling><c:orientation val="minMax"/></c:scaling>'
+            f'<c:delete val="0"/><c:axPos val="{val_pos}"/><c:majorGridlines>{self._grid}</c:majorGridlines>'
+            f'<c:numFmt formatCode="{fmt}" sourceLinked="0"/><c:majorTickMark val="none"/>'
+            '<c:minorTickMark val="none"/><c:tickLblPos val="nextTo"/><c:spPr><a:ln><a:noFill/></a:ln></c:spPr>'
+            '<c:crossAx val="1001"/><c:crosses val="autoZero"/><c:crossBetween val="between"/></c:valAx>'
+        )
+        legend_xml = ('<c:legend><c:legendPos val="b"/><c:overlay val="0"/></c:legend>' if legend else "")
+        return (
+            "<?xml version='1.0' encoding='UTF-8' standalone='yes'?>\n"
+            f'<c:chartSpace {_NS}><c:date1904 val="0"/><c:roundedCorners val="0"/><c:chart>'
+            f'<c:autoTitleDeleted val="1"/><c:plotArea><c:layout/>{plot}{axes}{_NO_LINE}</c:plotArea>'
+            f'{legend_xml}<c:plotVisOnly val="1"/><c:dispBlanksAs val="gap"/></c:chart>{_NO_LINE}{self._tx_pr}'
+            '<c:externalData r:id="rId1"><c:autoUpdate val="0"/></c:externalData></c:chartSpace>'
+        ).encode("utf-8")
+
+    # ── Workbook ──
+
+    def workbook(self, categories, series) -> bytes:
+        """The chart's data as a minimal xlsx, laid out the way python-pptx lays it out."""
+        def cell(ref, value):
+            if value is None:
+                return ""
+            if isinstance(value, str):
+                return f'<c r="{ref}" t="inlineStr"><is><t>{escape(value)}</t></is></c>'
+            return f'<c r="{ref}"><v>{_number(value)}</v></c>'
+
+        columns = [self._column(i + 1) for i in range(len(series))]
+        rows = ['<row r="1">' + "".join(cell(f"{c}1", name) for c, (name, _, _) in zip(columns, series)) + "</row>"]
+        for j, category in enumerate(categories):
+            r = j + 2
+            rows.append(f'<row r="{r}">' + cell(f"A{r}", category)
+                        + "".join(cell(f"{c}{r}", values[j] if j < len(values) else None)
+                                  for c, (_, values, _) in zip(columns, series)) + "</row>")
+        sheet = ('<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+                 '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+                 f'<sheetData>{"".join(rows)}</sheetData></worksheet>')
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED, compresslevel=1) as zf:
+            for name, blob in _WORKBOOK_PARTS:
+                zf.writestr(name, blob)
+            zf.writestr("xl/worksheets/sheet1.xml", sheet)
+        return buffer.getvalue()
+
+
+_WORKBOOK_PARTS = (
+    ("[Content_Types].xml",
+     '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+     '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+     '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+     '<Default Extension="xml" ContentType="application/xml"/>'
+     '<Override PartName="/xl/workbook.xml" '
+     'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+     '<Override PartName="/xl/worksheets/sheet1.xml" '
+     'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/></Types>'),
+    ("_rels/.rels",
+     '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+     '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+     '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/'
+     'officeDocument" Target="xl/workbook.xml"/></Relationships>'),
+    ("xl/workbook.xml",
+     '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+     '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+     'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+     '<sheets><sheet name="Sheet1" sheetId="1" r:id="rId1"/></sheets></workbook>'),
+    ("xl/_rels/workbook.xml.rels",
+     '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+     '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+     '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/'
+     'worksheet" Target="worksheets/sheet1.xml"/></Relationships>'),
+)
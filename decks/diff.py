@@ -0,0 +1,476 @@
+"""
+Structural diff of two saved decks.
+
+Each slide is first keyed by the CRC-32 and size the zip directory already
+stores for it and for its relationships, so slides with identical bytes in
+both decks are matched without being decompressed. The rest get a full key:
+their XML with shape ids and names blanked (python-pptx renumbers them
+whenever a shape is added earlier on the slide), plus what their
+relationships point at - the layout by name, other parts (pictures, charts)
+by their CRC. Matching ends of the two key sequences are taken off first,
+then single slides that differ at the same position between matching
+neighbours (changed in place); only the middle that remains is aligned with
+difflib, so repeated decks (a deck streamed N times, per-tenant copies) are
+not aligned one copy out of step. Slides whose key appears on both sides are
+unchanged (or moved), the rest are added, removed or changed.
+
+Only changed slides are parsed. Their shapes are flattened (group members
+included), aligned by kind and text, and compared field by field: text,
+position and size, preset geometry, fill and line color, text colors and
+font sizes, plus the slide background.
+
+``--check N`` diffs the overview deck repeated N times against a copy with
+one shape nudged on a few slides and two neighbouring slides swapped, and
+fails unless exactly those are reported.
+
+Usage:
+    python -m decks.diff build/old.pptx build/new.pptx
+    python -m decks.diff old.pptx new.pptx --json > diff.json
+    python -m decks.diff --check 150
+"""
+
+import argparse
+import difflib
+import hashlib
+import json
+import re
+import sys
+import tempfile
+import time
+import zipfile
+from pathlib import Path
+
+from lxml import etree
+
+from decks.optimize import NS, _q, _rels_name, _resolve
+
+RT_SLIDE = "http://schemas.openxmlformats.org/officeDocument/2006/relationships/slide"
+RT_NOTES_SLIDE = "http://schemas.openxmlformats.org/officeDocument/2006/relationships/notesSlide"
+RT_OFFICE_DOCUMENT = "http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument"
+EMU_PER_INCH = 914400
+
+_SHAPE_IDS = re.compile(rb'(<p:cNvPr) id="\d+" name="[^"]*"')
+_SHAPES = {"sp", "pic", "graphicFrame", "cxnSp", "grpSp", "contentPart"}
+
+
+class DeckIndex:
+    """A deck's slides in presentation order, keyed without reading them where possible.
+
+    ``quick_key`` comes straight from the zip directory (CRC and size of the
+    slide and of its relationships); ``key`` decompresses the slide and
+    normalizes it, and is only needed for slides whose quick key has no
+    match in the other deck.
+    """
+
+    def __init__(self, path):
+        self.path = str(path)
+        self._zf = zipfile.ZipFile(path)
+        self._infos = {info.filename: info for info in self._zf.infolist()}
+        root = self._rels("", "_rels/.rels")
+        presentation = self.presentation = next(target for kind, target, _ in root if kind == RT_OFFICE_DOCUMENT)
+        by_rid = {rid: target for kind, target, rid in self._rels(presentation, _rels_name(presentation))
+                  if kind == RT_SLIDE}
+        pres = etree.fromstring(self._zf.read(presentation))
+        id_list = pres.find("p:sldIdLst", NS)
+        self.slides = [by_rid[s.get(_q("r:id"))] for s in id_list] if id_list is not None else []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self._zf.close()
+
+    def __len__(self) -> int:
+        return len(self.slides)
+
+    def _crc(self, name: str) -> str:
+        info = self._infos.get(name)
+        return f"{info.CRC:08x}:{info.file_size}" if info is not None else "-"
+
+    def _rels(self, source: str, rels_name: str) -> list:
+        try:
+            blob = self._zf.read(rels_name)
+        except KeyError:
+            return []
+        rels = []
+        for rel in etree.fromstring(blob):
+            target = rel.get("Target")
+            if rel.get("TargetMode") != "External":
+                target = target.lstrip("/") if target.startswith("/") else _resolve(source, target)
+            rels.append((rel.get("Type"), target, rel.get("Id")))
+        return rels
+
+    def quick_key(self, index: int) -> str:
+        slide = self.slides[index]
+        return f"{self._crc(slide)}/{self._crc(_rels_name(slide))}"
+
+    def blob(self, index: int) -> bytes:
+        return self._zf.read(self.slides[index])
+
+    def key(self, index: int) -> str:
+        """Hash of the slide with shape ids and names blanked and its relationships resolved."""
+        slide = self.slides[index]
+        digest = hashlib.sha1(_SHAPE_IDS.sub(rb"\1", self.blob(index)))
+        for kind, target, rid in sorted(self._rels(slide, _rels_name(slide))):
+            if kind == RT_NOTES_SLIDE:
+                continue
+            # layouts by name; anything else by the CRC-32 in the zip directory
+            ident = target if target not in self._infos or "/slideLayouts/" in target else self._crc(target)
+            digest.update(f"{rid}|{kind}|{ident}\n".encode())
+        return digest.hexdigest()
+
+
+def slide_keys(old: DeckIndex, new: DeckIndex) -> tuple[list, list]:
+    """Comparable keys for both decks' slides: quick keys where they match across decks, full keys elsewhere."""
+    quick_old = [old.quick_key(i) for i in range(len(old))]
+    quick_new = [new.quick_key(j) for j in range(len(new))]
+    shared = set(quick_old) & set(quick_new)
+    return ([k if k in shared else old.key(i) for i, k in enumerate(quick_old)],
+            [k if k in shared else new.key(j) for j, k in enumerate(quick_new)])
+
+
+# ── Shapes ──
+
+def _inches(emu) -> float:
+    return round(int(emu) / EMU_PER_INCH, 2)
+
+
+def _color(fill_parent):
+    """The color under ``fill_parent``'s solidFill: "#RRGGBB", a scheme color name, or None."""
+    if fill_parent is None:
+        return None
+    fill = fill_parent.find("a:solidFill", NS)
+    if fill is None:
+        return "none" if fill_parent.find("a:noFill", NS) is not None else None
+    srgb = fill.find("a:srgbClr", NS)
+    if srgb is not None:
+        return "#" + srgb.get("val").upper()
+    scheme = fill.find("a:schemeClr", NS)
+    return scheme.get("val") if scheme is not None else None
+
+
+def _xfrm(shape):
+    for path in ("p:spPr/a:xfrm", "p:grpSpPr/a:xfrm", "p:xfrm"):
+        xfrm = shape.find(path, NS)
+        if xfrm is not None:
+            off, ext = xfrm.find("a:off", NS), xfrm.find("a:ext", NS)
+            if off is not None and ext is not None:
+                return (_inches(off.get("x")), _inches(off.get("y")), _inches(ext.get("cx")), _inches(ext.get("cy")))
+    return None
+
+
+def describe(shape, path="") -> dict:
+    """The comparable fields of one shape element."""
+    tag = etree.QName(shape).localname
+    c_nv_pr = next(shape.iter(_q("p:cNvPr")), None)
+    sp_pr = shape.find("p:spPr", NS)
+    prst = sp_pr.find("a:prstGeom", NS) if sp_pr is not None else None
+    line = sp_pr.find("a:ln", NS) if sp_pr is not None else None
+    body = shape.find("p:txBody", NS)
+    text, colors, sizes = "", (), ()
+    if body is not None:
+        text = "\n".join("".join(t.text or "" for t in p.iter(_q("a:t"))) for p in body.iter(_q("a:p")))
+        colors = tuple(sorted({"#" + c.get("val").upper() for c in body.iter(_q("a:srgbClr"))}))
+        sizes = tuple(sorted({int(el.get("sz")) / 100 for el in body.iter(_q("a:rPr"), _q("a:defRPr"), _q("a:endParaRPr"))
+                              if el.get("sz")}))
+    uri = shape.find("a:graphic/a:graphicData", {"a": NS["a"]}) if tag == "graphicFrame" else None
+    return {
+        "kind": tag if uri is None else uri.get("uri").rsplit("/", 1)[-1],
+        "name": path + (c_nv_pr.get("name", "") if c_nv_pr is not None else ""),
+        "text": text,
+        "geometry": _xfrm(shape),
+        "shape": prst.get("prst") if prst is not None else None,
+        "fill": _color(sp_pr),
+        "line": _color(line),
+        "text colors": colors,
+        "font sizes": sizes,
+    }
+
+
+def shapes(blob: bytes) -> list[dict]:
+    """Every shape on a slide, group members flattened in drawing order, plus the background."""
+    root = etree.fromstring(blob)
+    out = []
+    bg = root.find("p:cSld/p:bg", NS)
+    if bg is not None:
+        bg_pr = bg.find("p:bgPr", NS)
+        out.append({"kind": "background", "name": "background", "text": "", "geometry": None, "shape": None,
+                    "fill": _color(bg_pr) if bg_pr is not None else "theme", "line": None,
+                    "text colors": (), "font sizes": ()})
+
+    def walk(tree, path):
+        for child in tree:
+            if not isinstance(child.tag, str) or etree.QName(child).localname not in _SHAPES:
+                continue
+            out.append(describe(child, path))
+            if etree.QName(child).localname == "grpSp":
+                walk(child, out[-1]["name"] + "/")
+
+    sp_tree = root.find("p:cSld/p:spTree", NS)
+    if sp_tree is not None:
+        walk(sp_tree, "")
+    return out
+
+
+FIELDS = ("text", "geometry", "shape", "fill", "line", "text colors", "font sizes")
+
+
+def _changes(a: dict, b: dict) -> dict:
+    return {f: (a[f], b[f]) for f in FIELDS if a[f] != b[f]}
+
+
+def diff_shapes(old: list[dict], new: list[dict]) -> list[dict]:
+    """Shape-level differences between two versions of a slide.
+
+    Shapes are aligned on (kind, text); within a replaced run they are paired
+    in order, so an edited text box shows as one change rather than a removal
+    and an addition.
+    """
+    out = []
+    matcher = difflib.SequenceMatcher(None, [(s["kind"], s["text"]) for s in old],
+                                      [(s["kind"], s["text"]) for s in new], autojunk=False)
+    for op, i1, i2, j1, j2 in matcher.get_opcodes():
+        if op == "equal" or op == "replace":
+            pairs = list(zip(range(i1, i2), range(j1, j2)))
+            for i, j in pairs:
+                if old[i]["kind"] != new[j]["kind"]:
+                    out.append({"change": "removed", "shape": old[i]})
+                    out.append({"change": "added", "shape": new[j]})
+                    continue
+                changes = _changes(old[i], new[j])
+                if changes:
+                    out.append({"change": "changed", "shape": new[j], "fields": changes})
+            if op == "replace":
+                out.extend({"change": "removed", "shape": old[i]} for i in range(i1 + len(pairs), i2))
+                out.extend({"change": "added", "shape": new[j]} for j in range(j1 + len(pairs), j2))
+        elif op == "delete":
+            out.extend({"change": "removed", "shape": old[i]} for i in range(i1, i2))
+        else:
+            out.extend({"change": "added", "shape": new[j]} for j in range(j1, j2))
+    return out
+
+
+# ── Slides ──
+
+def diff_decks(old_path, new_path) -> dict:
+    """Added, removed, moved and changed slides (1-based numbers), with shape differences for changed ones."""
+    started = time.perf_counter()
+    with DeckIndex(old_path) as old, DeckIndex(new_path) as new:
+        result = _diff(old, new)
+    result["seconds"] = time.perf_counter() - started
+    return result
+
+
+def _pin_ends(old_keys: list, new_keys: list) -> tuple[int, list, int, int, int]:
+    """Unchanged count, slides changed in place, and the middle ``[lo:old_hi]`` / ``[lo:new_hi]`` left over.
+
+    Repeatedly takes matching slides off both ends, and a slide that differs at the same position
+    next to a match (or as the last pair left) when one of its two keys is absent from the other
+    deck, so it cannot have moved.
+    """
+    old_set, new_set = set(old_keys), set(new_keys)
+
+    def edited(i: int, j: int) -> bool:
+        return old_keys[i] not in new_set or new_keys[j] not in old_set
+
+    unchanged, changed = 0, []
+    lo, old_hi, new_hi = 0, len(old_keys), len(new_keys)
+    while lo < old_hi and lo < new_hi:
+        if old_keys[lo] == new_keys[lo]:
+            unchanged += 1
+            lo += 1
+        elif old_keys[old_hi - 1] == new_keys[new_hi - 1]:
+            unchanged += 1
+            old_hi -= 1
+            new_hi -= 1
+        elif edited(lo, lo) and (lo + 1 == old_hi == new_hi or (
+                lo + 1 < old_hi and lo + 1 < new_hi and old_keys[lo + 1] == new_keys[lo + 1])):
+            changed.append((lo, lo))
+            lo += 1
+        elif edited(old_hi - 1, new_hi - 1) and lo + 1 < old_hi and lo + 1 < new_hi and (
+                old_keys[old_hi - 2] == new_keys[new_hi - 2]):
+            old_hi -= 1
+            new_hi -= 1
+            changed.append((old_hi, new_hi))
+        else:
+            break
+    return unchanged, changed, lo, old_hi, new_hi
+
+
+def _diff(old: DeckIndex, new: DeckIndex) -> dict:
+    result = {"old": old.path, "new": new.path, "slides": (len(old), len(new)),
+              "unchanged": 0, "moved": [], "added": [], "removed": [], "changed": []}
+    removed, added, changed = [], [], []
+    old_keys, new_keys = slide_keys(old, new)
+    result["unchanged"], in_place, lo, old_hi, new_hi = _pin_ends(old_keys, new_keys)
+    matcher = difflib.SequenceMatcher(None, old_keys[lo:old_hi], new_keys[lo:new_hi], autojunk=False)
+    for op, i1, i2, j1, j2 in matcher.get_opcodes():
+        i1, i2, j1, j2 = i1 + lo, i2 + lo, j1 + lo, j2 + lo
+        if op == "equal":
+            result["unchanged"] += i2 - i1
+            continue
+        pairs = min(i2 - i1, j2 - j1) if op == "replace" else 0
+        changed.extend(zip(range(i1, i1 + pairs), range(j1, j1 + pairs)))
+        removed.extend(range(i1 + pairs, i2))
+        added.extend(range(j1 + pairs, j2))
+
+    # a slide that left one place in the middle and reappeared unchanged in another was moved
+    leaving = {}
+    for i in removed + [i for i, _ in changed]:
+        leaving.setdefault(old_keys[i], []).append(i)
+    moved_old, moved_new = set(), set()
+    for j in added + [j for _, j in changed]:
+        candidates = leaving.get(new_keys[j])
+        if candidates:
+            i = candidates.pop(0)
+            moved_old.add(i)
+            moved_new.add(j)
+            result["moved"].append((i + 1, j + 1))
+    result["moved"].sort()
+    result["removed"] = [i + 1 for i in removed if i not in moved_old]
+    result["added"] = [j + 1 for j in added if j not in moved_new]
+    for i, j in changed:
+        if i in moved_old or j in moved_new:
+            if i not in moved_old:
+                result["removed"].append(i + 1)
+            if j not in moved_new:
+                result["added"].append(j + 1)
+            continue
+        result["changed"].append({
+            "old": i + 1,
+            "new": j + 1,
+            "shapes": diff_shapes(shapes(old.blob(i)), shapes(new.blob(j))),
+        })
+    for i, j in in_place:
+        result["changed"].append({
+            "old": i + 1,
+            "new": j + 1,
+            "shapes": diff_shapes(shapes(old.blob(i)), shapes(new.blob(j))),
+        })
+    result["changed"].sort(key=lambda c: c["new"])
+    result["removed"].sort()
+    result["added"].sort()
+    return result
+
+
+def _label(shape: dict) -> str:
+    text = shape["text"].split("\n", 1)[0]
+    text = f' "{text[:40]}{"…" if len(text) > 40 else ""}"' if text else ""
+    return f"{shape['kind']} {shape['name']}{text}"
+
+
+def _value(field, value):
+    if field == "geometry" and value:
+        return "{}, {} {}x{} in".format(*value)
+    if field == "text":
+        return json.dumps(value, ensure_ascii=False)
+    if isinstance(value, tuple):
+        return ", ".join(map(str, value)) or "-"
+    return "-" if value is None else str(value)
+
+
+def format_report(result: dict) -> str:
+    lines = [f"{result['old']} ({result['slides'][0]} slides) -> {result['new']} ({result['slides'][1]} slides)"]
+    lines.append(f"{result['unchanged']} unchanged, {len(result['changed'])} changed, {len(result['added'])} added, "
+                 f"{len(result['removed'])} removed, {len(result['moved'])} moved")
+    for i, j in result["moved"]:
+        lines.append(f"  moved   slide {i} -> {j}")
+    for i in result["removed"]:
+        lines.append(f"  removed slide {i}")
+    for j in result["added"]:
+        lines.append(f"  added   slide {j}")
+    for slide in result["changed"]:
+        where = str(slide["new"]) if slide["old"] == slide["new"] else f"{slide['old']} -> {slide['new']}"
+        lines.append(f"  changed slide {where}")
+        for entry in slide["shapes"]:
+            lines.append(f"    {entry['change']:<8}{_label(entry['shape'])}")
+            for field, (a, b) in entry.get("fields", {}).items():
+                lines.append(f"        {field}: {_value(field, a)} -> {_value(field, b)}")
+        if not slide["shapes"]:
+            lines.append("    (markup or relationships only)")
+    return "\n".join(lines)
+
+
+# ── Self-check ──
+
+_OFFSET_X = re.compile(rb'<a:off x="(\d+)"')
+
+
+def _edited_copy(source: Path, target: Path, nudge: set[int], swap: int) -> None:
+    """Copy a deck, moving the first shape on slides ``nudge`` right by 0.05 in and swapping slides
+    ``swap`` and ``swap + 1`` (all 0-based)."""
+    with DeckIndex(source) as index, zipfile.ZipFile(target, "w", zipfile.ZIP_DEFLATED) as out:
+        nudged = {index.slides[i] for i in nudge}
+        for info in index._zf.infolist():
+            blob = index._zf.read(info)
+            if info.filename in nudged:
+                blob = _OFFSET_X.sub(lambda m: b'<a:off x="%d"' % (int(m[1]) + EMU_PER_INCH // 20), blob, 1)
+            elif info.filename == index.presentation:
+                pres = etree.fromstring(blob)
+                id_list = pres.find("p:sldIdLst", NS)
+                id_list.insert(swap, id_list[swap + 1])
+                blob = etree.tostring(pres, xml_declaration=True, encoding="UTF-8", standalone=True)
+            out.writestr(info, blob)
+
+
+def check_repeated(repeat: int) -> list[str]:
+    """Diff the overview deck repeated ``repeat`` times against an edited copy; return what went wrong."""
+    from decks.overview import SLIDES
+    from decks.streaming import build_streaming
+
+    count = len(SLIDES) * repeat
+    nudge = {1, count // 2 + 1, count - 2}          # early, mid-deck and next to the end, 0-based
+    swap = 4
+    with tempfile.TemporaryDirectory() as tmp:
+        old, new = Path(tmp) / "old.pptx", Path(tmp) / "new.pptx"
+        build_streaming(list(SLIDES) * repeat, old)
+        _edited_copy(old, new, nudge, swap)
+        result = diff_decks(old, new)
+    problems = []
+    got = {(c["old"], c["new"]) for c in result["changed"]}
+    if got != {(i + 1, i + 1) for i in nudge}:
+        problems.append(f"changed {sorted(got)}, expected slides {sorted(i + 1 for i in nudge)} in place")
+    if any(not c["shapes"] for c in result["changed"]):
+        problems.append("a changed slide reports no shape differences")
+    if result["added"] or result["removed"]:
+        problems.append(f"added {result['added']}, removed {result['removed']}, expected none")
+    if len(result["moved"]) != 1 or not set(result["moved"][0]) <= {swap + 1, swap + 2}:
+        moved = ", ".join(f"{i}->{j}" for i, j in result["moved"][:5]) + (", ..." if len(result["moved"]) > 5 else "")
+        problems.append(f"{len(result['moved'])} moved ({moved}), expected slide {swap + 1} <-> {swap + 2}")
+    if result["unchanged"] != count - len(nudge) - 1:
+        problems.append(f"{result['unchanged']} unchanged, expected {count - len(nudge) - 1}")
+    print(format_report(result).split("\n", 2)[1])
+    print(f"Compared {count} slides in {result['seconds'] * 1000:.0f} ms")
+    return problems
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Show which slides and shapes differ between two decks")
+    parser.add_argument("old", nargs="?", help="Original .pptx")
+    parser.add_argument("new", nargs="?", help="Changed .pptx")
+    parser.add_argument("--json", action="store_true", help="Print the diff as JSON")
+    parser.add_argument("--check", type=int, default=None, metavar="N",
+                        help="Check the diff on the overview deck repeated N times, with known edits")
+    args = parser.parse_args()
+
+    if args.check is not None:
+        problems = check_repeated(args.check)
+        for problem in problems:
+            print(f"FAIL: {problem}")
+        if not problems:
+            print("All edits reported")
+        sys.exit(1 if problems else 0)
+    if not (args.old and args.new):
+        parser.error("old and new decks are required (or --check N)")
+    result = diff_decks(args.old, args.new)
+    if args.json:
+        print(json.dumps(result, indent=1, ensure_ascii=False))
+    else:
+        print(format_report(result))
+        print(f"Compared in {result['seconds'] * 1000:.0f} ms")
+    different = result["changed"] or result["added"] or result["removed"] or result["moved"]
+    sys.exit(1 if different else 0)
+
+
+if __name__ == "__main__":
+    main()
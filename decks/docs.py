@@ -0,0 +1,708 @@
+"""
+Convert the markdown docs into Turumba-styled decks.
+
+Each document becomes one deck. ``#`` is the title slide (with the first
+paragraph as its subtitle), every ``##`` that has ``###`` subsections opens
+with a ``section`` slide, and each heading's content goes onto ``stitle``
+slides: paragraphs and unlabelled lists as ``ml`` text, lists introduced by a
+``####`` heading or a bold "Label:" line as ``card``s (side by side when
+several follow each other), tables as a header row and wrapped cells, and
+code blocks in a monospace panel sized to their longest line. Text is
+measured with decks.textfit, so content that does not fit one slide carries
+over onto "(cont.)" slides instead of running off the bottom; long lists,
+tables and code blocks are split between items, rows and lines.
+
+Documents are converted in a process pool, largest first. A manifest in the
+cache directory records the hash of each document together with the hash
+of the converter, helpers and theme it was built with; documents whose hash
+has not changed and whose deck is still on disk are skipped.
+
+Usage:
+    python -m decks.docs                                    # docs/ -> build/docs/
+    python -m decks.docs docs/realtime docs/WHAT_IS_TURUMBA.md --output build/docs --workers 4
+    python -m decks.docs --force
+"""
+
+import argparse
+import hashlib
+import json
+import multiprocessing
+import re
+import time
+from pathlib import Path
+
+import pptx
+from pptx.enum.text import PP_ALIGN
+from pptx.util import Inches, Pt
+
+from decks import helpers, textfit, theme
+from decks.helpers import blank, card, ml, new_presentation, rect, rr, section, set_bg, stitle, txt
+from decks.incremental import _write_atomic
+from decks.textfit import EMU_PER_PT, H_INSET, LINE_HEIGHT, wrap
+from decks.theme import (
+    ACCENT_BLUE, ACCENT_TEAL, DARK_CARD, LIGHT_GRAY, MED_GRAY, SECTION_BG, SLIDE_HEIGHT, WHITE,
+)
+
+DEFAULT_CACHE_DIR = ".docs_cache"
+DEFAULT_OUTPUT = "build/docs"
+
+LEFT = Inches(.6)
+WIDTH = Inches(12.13)
+TOP = Inches(1.65)
+TOP_WITH_SUBTITLE = Inches(1.8)
+BOTTOM = SLIDE_HEIGHT - Inches(.45)
+GAP = Inches(.15)
+V_INSET = Inches(.05)           # python-pptx text box top/bottom inset
+
+BODY_SIZE = 14
+CARD_SIZE = 12
+TABLE_SIZE = 11
+CODE_SIZE = 11
+MIN_CODE_SIZE = 7
+CODE_FONT = "Consolas"
+CODE_ADVANCE = 0.6              # em per character of a monospace font
+MAX_CARD_COLUMNS = 3
+SUBTITLE_CHARS = 180
+
+
+# ── Parsing ──
+
+_HEADING = re.compile(r"^(#{1,6})\s+(.*?)\s*#*\s*$")
+_FENCE = re.compile(r"^\s*(```|~~~)\s*([\w+-]*)")
+_ITEM = re.compile(r"^(\s*)([-*+]|\d+[.)])\s+(.*)$")
+_RULE = re.compile(r"^\s*([-*_])(\s*\1){2,}\s*$")
+_TABLE_RULE = re.compile(r"^\s*\|?\s*:?-+:?\s*(\|\s*:?-+:?\s*)*\|?\s*$")
+_CHECKBOX = re.compile(r"^\[([ xX])\]\s+")
+_IMAGE = re.compile(r"!\[([^\]]*)\]\([^)]*\)")
+_LINK = re.compile(r"\[([^\]]+)\]\([^)]*\)")
+_EMPHASIS = re.compile(r"(\*\*|__)(.+?)\1|(?<![\w*])\*(?!\s)(.+?)(?<!\s)\*(?![\w*])")
+_TAG = re.compile(r"<[^>]+>")
+
+
+def inline(text: str) -> str:
+    """Markdown inline markup to plain text: links and images to their text, no emphasis, code or tags."""
+    text = _IMAGE.sub(r"\1", text)
+    text = _LINK.sub(r"\1", text)
+    text = _EMPHASIS.sub(lambda m: m.group(2) or m.group(3), text)
+    text = _TAG.sub(" ", text.replace("`", ""))
+    return " ".join(text.split())
+
+
+def _cells(line: str) -> list[str]:
+    line = line.strip()
+    if line.startswith("|"):
+        line = line[1:]
+    if line.endswith("|") and not line.endswith("\\|"):
+        line = line[:-1]
+    return [inline(cell.replace("\\|", "|")) for cell in re.split(r"(?<!\\)\|", line)]
+
+
+def _is_label(text: str) -> bool:
+    """A paragraph that only introduces what follows: "**Channel Management:**" or "Supported types:"."""
+    raw = text.strip()
+    return len(raw) < 90 and (raw.endswith(":") or raw.endswith(":**") or
+                              (raw.startswith("**") and raw.endswith("**") and raw.count("**") == 2))
+
+
+def parse(source: str) -> list[tuple]:
+    """Split markdown into blocks.
+
+    ``("heading", level, text)``, ``("para", text, is_label)``,
+    ``("list", ((level, marker, text), ...))``, ``("table", header, rows)``,
+    ``("code", language, lines)`` and ``("quote", text)``.
+    """
+    lines = source.splitlines()
+    blocks = []
+    i = 0
+    if lines and lines[0].strip() == "---":           # YAML front matter
+        end = next((j for j in range(1, len(lines)) if lines[j].strip() == "---"), None)
+        if end is not None:
+            i = end + 1
+    while i < len(lines):
+        line = lines[i]
+        stripped = line.strip()
+        if not stripped or _RULE.match(line) or stripped.startswith("<!--"):
+            if stripped.startswith("<!--"):
+                while i < len(lines) and "-->" not in lines[i]:
+                    i += 1
+            i += 1
+            continue
+
+        fence = _FENCE.match(line)
+        if fence:
+            marker, language, code = fence.group(1), fence.group(2), []
+            i += 1
+            while i < len(lines) and not lines[i].strip().startswith(marker):
+                code.append(lines[i].rstrip().expandtabs(4))
+                i += 1
+            i += 1
+            while code and not code[-1].strip():
+                code.pop()
+            if code:
+                indent = min(len(c) - len(c.lstrip()) for c in code if c.strip())
+                blocks.append(("code", language, tuple(c[indent:] for c in code)))
+            continue
+
+        heading = _HEADING.match(line)
+        if heading:
+            text = inline(heading.group(2))
+            if text:
+                blocks.append(("heading", len(heading.group(1)), text))
+            i += 1
+            continue
+
+        if stripped.startswith("|") and i + 1 < len(lines) and _TABLE_RULE.match(lines[i + 1]):
+            header = _cells(line)
+            rows = []
+            i += 2
+            while i < len(lines) and lines[i].strip().startswith("|"):
+                row = _cells(lines[i])
+                rows.append(tuple((row + [""] * len(header))[:len(header)]))
+                i += 1
+            blocks.append(("table", tuple(header), tuple(rows)))
+            continue
+
+        if _ITEM.match(line):
+            items, indents = [], []
+            while i < len(lines):
+                item = _ITEM.match(lines[i])
+                if item:
+                    indent = len(item.group(1).expandtabs(4))
+                    while indents and indent < indents[-1]:
+                        indents.pop()
+                    if not indents or indent > indents[-1]:
+                        indents.append(indent)
+                    text = item.group(3)
+                    marker = "" if item.group(2) in "-*+" else item.group(2)
+                    box = _CHECKBOX.match(text)
+                    if box:
+                        marker, text = ("☑" if box.group(1) != " " else "☐"), text[box.end():]
+                    items.append([len(indents) - 1, marker, text])
+                elif lines[i].strip() and (lines[i][:1].isspace() or not blocks_start(lines[i])):
+                    items[-1][2] += " " + lines[i].strip()       # lazy or indented continuation
+                elif not lines[i].strip() and i + 1 < len(lines) and (
+                        _ITEM.match(lines[i + 1]) or lines[i + 1][:2] == "  "):
+                    pass                                        # loose list: blank line between items
+                else:
+                    break
+                i += 1
+            blocks.append(("list", tuple((level, marker, inline(text)) for level, marker, text in items)))
+            continue
+
+        if stripped.startswith(">"):
+            quote = []
+            while i < len(lines) and lines[i].strip().startswith(">"):
+                quote.append(lines[i].strip()[1:].strip())
+                i += 1
+            text = inline(" ".join(quote))
+            if text:
+                blocks.append(("quote", text))
+            continue
+
+        paragraph = [stripped]
+        i += 1
+        while i < len(lines) and lines[i].strip() and not blocks_start(lines[i]):
+            paragraph.append(lines[i].strip())
+            i += 1
+        raw = " ".join(paragraph)
+        text = inline(raw)
+        if text:
+            blocks.append(("para", text, _is_label(raw)))
+    return blocks
+
+
+def blocks_start(line: str) -> bool:
+    """Whether ``line`` opens a block other than a paragraph."""
+    stripped = line.strip()
+    return bool(_HEADING.match(line) or _FENCE.match(line) or _ITEM.match(line) or _RULE.match(line)
+                or stripped.startswith("|") or stripped.startswith(">"))
+
+
+def outline(blocks: list[tuple], fallback_title: str) -> dict:
+    """Group blocks under their headings: title, intro and ``##`` sections with their ``###`` topics."""
+    doc = {"title": None, "intro": [], "sections": []}
+    current = doc["intro"]
+    for block in blocks:
+        if block[0] == "heading":
+            level, text = block[1], block[2]
+            if level == 1 and doc["title"] is None and not doc["sections"]:
+                doc["title"] = text
+                continue
+            if level <= 2:
+                doc["sections"].append({"title": text, "blocks": [], "topics": []})
+                current = doc["sections"][-1]["blocks"]
+                continue
+            if level == 3 and doc["sections"]:
+                doc["sections"][-1]["topics"].append({"title": text, "blocks": []})
+                current = doc["sections"][-1]["topics"][-1]["blocks"]
+                continue
+        current.append(block)
+    doc["title"] = doc["title"] or fallback_title
+    return doc
+
+
+# ── Measuring ──
+
+def _pt(emu) -> float:
+    return emu / EMU_PER_PT
+
+
+def text_height(lines, width, sz, sp=1.4, font="Calibri") -> int:
+    """Height in EMU that ml() needs for ``lines`` ((text, bold, color) tuples) in a ``width`` box."""
+    inner = int(width) - 2 * H_INSET
+    count = sum(len(wrap(text, font, bold, sz, inner)) for text, bold, _ in lines)
+    points = count * sz * LINE_HEIGHT + max(len(lines) - 1, 0) * sz * (sp - 1)
+    return int(points * EMU_PER_PT) + 2 * V_INSET
+
+
+def _list_lines(items, clr=LIGHT_GRAY) -> list[tuple]:
+    lines = []
+    for level, marker, text in items:
+        bullet = f"{marker}  " if marker else ("•  " if level == 0 else "–  ")
+        lines.append(("     " * level + bullet + text, False, clr))
+    return lines
+
+
+class Piece:
+    """One laid-out element of a content slide: its kind, its data, and how to measure and split it."""
+
+    __slots__ = ("kind", "data")
+
+    def __init__(self, kind, data):
+        self.kind = kind
+        self.data = data
+
+    def height(self, width) -> int:
+        kind, data = self.kind, self.data
+        if kind == "text":
+            return text_height(data, width, BODY_SIZE)
+        if kind == "quote":
+            return text_height(data, width - Inches(.25), BODY_SIZE, sp=1.2)
+        if kind == "card":
+            title, lines = data
+            return Inches(.7) + (text_height(lines, width - Inches(.4), CARD_SIZE, sp=1.35) if lines else 0)
+        if kind == "table":
+            header, rows = data
+            return sum(_row_height(row, _column_widths(header, rows, width), i == 0)
+                       for i, row in enumerate((header,) + rows)) + Inches(.2)
+        if kind == "code":
+            _language, lines = data
+            sz = _code_size(lines, width)
+            return int(len(lines) * sz * LINE_HEIGHT * EMU_PER_PT) + Inches(.3) + 2 * V_INSET
+        raise ValueError(kind)
+
+    def split(self, room, width):
+        """Split into a part at most ``room`` EMU tall and the rest; ``(None, self)`` if nothing fits."""
+        kind, data = self.kind, self.data
+        if kind in ("text", "quote") and len(data) == 1:
+            return None, self                                 # one paragraph: never split mid-sentence
+        if kind in ("text", "quote"):
+            return self._split_lines(data, lambda part: Piece(kind, part), room, width)
+        if kind == "card":
+            title, lines = data
+            return self._split_lines(lines, lambda part: Piece("card", (title, part)), room, width)
+        if kind == "table":
+            header, rows = data
+            return self._split_lines(rows, lambda part: Piece("table", (header, part)), room, width)
+        if kind == "code":
+            language, lines = data
+            sz = _code_size(lines, width)
+            fit = int((room - Inches(.3) - 2 * V_INSET) / EMU_PER_PT / (sz * LINE_HEIGHT))
+            if fit < 3:
+                return None, self
+            return Piece("code", (language, lines[:fit])), Piece("code", (language, lines[fit:]))
+        raise ValueError(kind)
+
+    @staticmethod
+    def _split_lines(items, make, room, width):
+        lo, hi = 0, len(items)                                # largest prefix that fits
+        while lo < hi:
+            mid = (lo + hi + 1) // 2
+            if make(items[:mid]).height(width) <= room:
+                lo = mid
+            else:
+                hi = mid - 1
+        if lo == 0:
+            return None, make(items)
+        if lo == len(items):
+            return make(items), None
+        return make(items[:lo]), make(items[lo:])
+
+
+def _column_widths(header, rows, width) -> tuple:
+    longest = [max([len(header[c])] + [len(r[c]) for r in rows]) for c in range(len(header))]
+    weights = [min(max(n, 8), 60) for n in longest]
+    inner = int(width) - Inches(.3)
+    return tuple(int(inner * w / sum(weights)) for w in weights)
+
+
+def _row_height(row, widths, is_header) -> int:
+    lines = max(len(wrap(cell or " ", "Calibri", is_header, TABLE_SIZE, int(w) - 2 * H_INSET))
+                for cell, w in zip(row, widths))
+    return int(lines * TABLE_SIZE * LINE_HEIGHT * EMU_PER_PT) + 2 * V_INSET + Inches(.06)
+
+
+def _code_size(lines, width) -> int:
+    longest = max((len(line) for line in lines), default=1) or 1
+    fitting = _pt(int(width) - Inches(.4) - 2 * H_INSET) / (longest * CODE_ADVANCE)
+    return max(MIN_CODE_SIZE, min(CODE_SIZE, int(fitting)))
+
+
+def pieces(blocks) -> list:
+    """Turn a heading's blocks into pieces; runs of consecutive cards become one ``("cards", [...])`` row."""
+    out = []
+    label = None
+    for block in blocks:
+        kind = block[0]
+        if kind == "heading":                                 # #### and deeper: card titles
+            if label is not None:
+                out.append(Piece("text", ((label, True, WHITE),)))
+            label = block[2]
+            continue
+        if kind == "para" and block[2] and label is None:
+            label = block[1].rstrip(":")
+            continue
+        if label is not None and kind in ("list", "para"):
+            lines = _list_lines(block[1]) if kind == "list" else [(block[1], False, LIGHT_GRAY)]
+            if out and out[-1].kind == "card" and out[-1].data[0] == label:
+                lines = list(out[-1].data[1]) + lines
+                out.pop()
+            out.append(Piece("card", (label, tuple(lines))))
+            if kind == "list":
+                label = None
+            continue
+        if label is not None:
+            out.append(Piece("text", ((label, True, WHITE),)))
+            label = None
+        if kind == "para":
+            if out and out[-1].kind == "text" and not out[-1].data[-1][1]:
+                out[-1] = Piece("text", out[-1].data + ((block[1], False, LIGHT_GRAY),))
+            else:
+                out.append(Piece("text", ((block[1], False, LIGHT_GRAY),)))
+        elif kind == "list":
+            lines = tuple(_list_lines(block[1]))
+            if out and out[-1].kind == "text":
+                out[-1] = Piece("text", out[-1].data + lines)
+            else:
+                out.append(Piece("text", lines))
+        elif kind == "quote":
+            out.append(Piece("quote", ((block[1], False, MED_GRAY),)))
+        elif kind == "table":
+            out.append(Piece("table", (block[1], block[2])))
+        elif kind == "code":
+            out.append(Piece("code", (block[1], block[2])))
+    if label is not None:
+        out.append(Piece("text", ((label, True, WHITE),)))
+    return out
+
+
+# ── Layout ──
+
+def _card_rows(items, room):
+    """Lay consecutive cards out side by side, up to MAX_CARD_COLUMNS a row, where they fit a slide."""
+    out, run = [], []
+    for piece in items + [None]:
+        if piece is not None and piece.kind == "card":
+            run.append(piece)
+            continue
+        while run:
+            columns = min(len(run), MAX_CARD_COLUMNS)
+            while columns > 1:
+                width = (WIDTH - GAP * (columns - 1)) // columns
+                if max(card.height(width) for card in run[:columns]) <= room:
+                    break
+                columns -= 1
+            out.append(run[:columns] if columns > 1 else run[0])
+            run = run[columns:]
+        if piece is not None:
+            out.append(piece)
+    return out
+
+
+def paginate(items, top) -> list[list]:
+    """Place pieces (or rows of cards) top to bottom, starting new pages and splitting pieces as needed.
+
+    Returns pages of ``(kind, data, left, top, width, height)`` placements.
+    """
+    room = BOTTOM - top
+    pages, page, y = [], [], top
+    queue = list(_card_rows(items, room))
+    while queue:
+        item = queue.pop(0)
+        if isinstance(item, list):                            # a row of cards
+            width = (WIDTH - GAP * (len(item) - 1)) // len(item)
+            height = max(card.height(width) for card in item)
+            if y + height > BOTTOM and page:
+                pages.append(page)
+                page, y = [], top
+            for n, card_piece in enumerate(item):
+                page.append((card_piece.kind, card_piece.data, LEFT + n * (width + GAP), y, width, height))
+            y += height + GAP
+            continue
+        height = item.height(WIDTH)
+        if y + height > BOTTOM:
+            head, tail = item.split(BOTTOM - y, WIDTH)
+            if head is None and page:
+                pages.append(page)
+                page, y = [], top
+                queue.insert(0, item)
+                continue
+            if head is None:                                  # taller than an empty page and unsplittable
+                head, tail = item, None
+            if tail is not None:
+                queue.insert(0, tail)
+            item, height = head, min(head.height(WIDTH), BOTTOM - y)
+        page.append((item.kind, item.data, LEFT, y, WIDTH, height))
+        y += height + GAP
+        if y >= BOTTOM and queue:
+            pages.append(page)
+            page, y = [], top
+    if page:
+        pages.append(page)
+    return pages
+
+
+def plan(doc: dict, source: str) -> list[tuple]:
+    """The deck as a list of ``(slide function, args)``."""
+    slides = []
+    intro = list(doc["intro"])
+    subtitle = ""
+    if intro and intro[0][0] == "para" and not intro[0][2]:
+        subtitle = intro.pop(0)[1]
+        if len(subtitle) > SUBTITLE_CHARS:
+            subtitle = subtitle[:SUBTITLE_CHARS].rsplit(" ", 1)[0] + "…"
+    slides.append((title_slide, (doc["title"], subtitle, source)))
+
+    def content(title, parent, blocks):
+        top = TOP_WITH_SUBTITLE if parent else TOP
+        pages = paginate(pieces(blocks), top)
+        for n, page in enumerate(pages):
+            heading = title if n == 0 else f"{title} (cont.)"
+            slides.append((content_slide, (heading, parent, tuple(page))))
+
+    content("Overview", doc["title"], intro)
+    number = 0
+    for sec in doc["sections"]:
+        if sec["topics"]:
+            number += 1
+            lead = sec["blocks"][0][1] if sec["blocks"] and sec["blocks"][0][0] == "para" else ""
+            if len(lead) > SUBTITLE_CHARS // 2:
+                lead = ""
+            slides.append((section, (number, sec["title"], lead)))
+            rest = sec["blocks"][1:] if lead else sec["blocks"]
+            content(sec["title"], "", rest)
+            for topic in sec["topics"]:
+                content(topic["title"], sec["title"], topic["blocks"])
+        else:
+            content(sec["title"], "", sec["blocks"])
+    return slides
+
+
+# ── Slides ──
+
+def title_slide(s, title, subtitle, source):
+    set_bg(s)
+    rect(s, Inches(0), Inches(0), Inches(.15), Inches(7.5), ACCENT_BLUE)
+    rect(s, Inches(0), Inches(4.4), Inches(13.333), Pt(2), DARK_CARD)
+    txt(s, title, Inches(1), Inches(1.6), Inches(11), Inches(1.2),
+        sz=44, clr=WHITE, bold=True, font="Calibri Light", fit=True)
+    if subtitle:
+        txt(s, subtitle, Inches(1), Inches(2.9), Inches(11), Inches(1.2), sz=20, clr=ACCENT_TEAL,
+            font="Calibri Light", fit=True)
+    txt(s, source, Inches(1), Inches(6.5), Inches(11), Inches(.3), sz=14, clr=MED_GRAY)
+
+
+def content_slide(s, title, subtitle, placements):
+    stitle(s, title, subtitle)
+    for kind, data, l, t, w, h in placements:
+        DRAW[kind](s, data, l, t, w, h)
+
+
+def _draw_text(s, lines, l, t, w, h):
+    ml(s, list(lines), l, t, w, h, sz=BODY_SIZE)
+
+
+def _draw_quote(s, lines, l, t, w, h):
+    rect(s, l, t + V_INSET, Pt(3), h - 2 * V_INSET, ACCENT_TEAL)
+    ml(s, list(lines), l + Inches(.25), t, w - Inches(.25), h, sz=BODY_SIZE, sp=1.2)
+
+
+def _draw_card(s, data, l, t, w, h):
+    title, lines = data
+    card(s, l, t, w, h, title, None, fit=True)
+    if lines:
+        ml(s, list(lines), l + Inches(.2), t + Inches(.58), w - Inches(.4), h - Inches(.7), sz=CARD_SIZE, sp=1.35)
+
+
+def _draw_table(s, data, l, t, w, h):
+    header, rows = data
+    widths = _column_widths(header, rows, w)
+    rr(s, l, t, w, h, SECTION_BG, DARK_CARD, Pt(1))
+    y = t + Inches(.1)
+    for i, row in enumerate((header,) + rows):
+        row_h = _row_height(row, widths, i == 0)
+        if i and i % 2 == 0:
+            rect(s, l + Inches(.1), y, w - Inches(.2), row_h, DARK_CARD)
+        x = l + Inches(.15)
+        for c, (cell, cw) in enumerate(zip(row, widths)):
+            clr = ACCENT_BLUE if i == 0 else (WHITE if c == 0 else LIGHT_GRAY)
+            txt(s, cell, x, y + Inches(.03), cw, row_h, sz=TABLE_SIZE, clr=clr, bold=i == 0)
+            x += cw
+        if i == 0:
+            rect(s, l + Inches(.1), y + row_h, w - Inches(.2), Pt(1.5), ACCENT_BLUE)
+        y += row_h
+
+
+def _draw_code(s, data, l, t, w, h):
+    language, lines = data
+    rr(s, l, t, w, h, DARK_CARD, SECTION_BG, Pt(1))
+    if language:
+        txt(s, language, l + w - Inches(1.7), t + Inches(.05), Inches(1.6), Inches(.3),
+            sz=10, clr=MED_GRAY, align=PP_ALIGN.RIGHT)
+    ml(s, list(lines), l + Inches(.2), t + Inches(.15), w - Inches(.4), h - Inches(.3),
+       sz=_code_size(lines, w), clr=LIGHT_GRAY, sp=1.0, font=CODE_FONT)
+
+
+DRAW = {"text": _draw_text, "quote": _draw_quote, "card": _draw_card, "table": _draw_table, "code": _draw_code}
+
+
+# ── Conversion ──
+
+_version = None
+
+
+def converter_version() -> str:
+    """Hash of the code a deck depends on: this module, the helpers, theme, text fitting and python-pptx."""
+    global _version
+    if _version is None:
+        digest = hashlib.sha256(pptx.__version__.encode())
+        for module in (helpers, theme, textfit):
+            digest.update(Path(module.__file__).read_bytes())
+        digest.update(Path(__file__).read_bytes())
+        _version = digest.hexdigest()
+    return _version
+
+
+def doc_key(data: bytes) -> str:
+    return hashlib.sha256(converter_version().encode() + data).hexdigest()
+
+
+def convert(source, output, label=None, prs=None):
+    """Convert one markdown file into a deck at ``output``; returns the presentation."""
+    source = Path(source)
+    doc = outline(parse(source.read_text(encoding="utf-8")), source.stem.replace("_", " ").replace("-", " "))
+    prs = prs or new_presentation()
+    for build, args in plan(doc, label or str(source)):
+        build(blank(prs), *args)
+    if output:
+        Path(output).parent.mkdir(parents=True, exist_ok=True)
+        prs.save(output)
+    return prs
+
+
+def find_docs(paths) -> list[tuple[Path, Path]]:
+    """``(markdown file, path relative to where it was found)`` for every file or directory given."""
+    docs = []
+    for path in map(Path, paths):
+        if path.is_dir():
+            docs.extend((doc, doc.relative_to(path)) for doc in sorted(path.rglob("*.md")))
+        elif path.suffix.lower() == ".md":
+            docs.append((path, Path(path.name)))
+        else:
+            raise ValueError(f"{path} is neither a directory nor a .md file")
+    return docs
+
+
+def _init_worker() -> None:
+    new_presentation()      # read the template once per worker
+    converter_version()
+
+
+def convert_job(job: tuple[str, str, str]) -> dict:
+    source, output, key = job
+    started = time.perf_counter()
+    prs = convert(source, output)
+    return {"source": source, "output": output, "key": key, "slides": len(prs.slides),
+            "seconds": time.perf_counter() - started}
+
+
+def convert_all(paths, output_dir=DEFAULT_OUTPUT, cache_dir=DEFAULT_CACHE_DIR, workers=None, force=False) -> dict:
+    """Convert every document under ``paths`` whose content changed since its deck was last built."""
+    started = time.perf_counter()
+    output_dir, cache = Path(output_dir), Path(cache_dir)
+    cache.mkdir(parents=True, exist_ok=True)
+    manifest_path = cache / "manifest.json"
+    try:
+        manifest = json.loads(manifest_path.read_text())
+    except (FileNotFoundError, ValueError):
+        manifest = {}
+
+    jobs, skipped = [], 0
+    for doc, relative in find_docs(paths):
+        output = output_dir / relative.with_suffix(".pptx")
+        key = doc_key(doc.read_bytes())
+        entry = manifest.get(str(output))
+        if not force and entry and entry["key"] == key and output.exists():
+            skipped += 1
+            continue
+        jobs.append((str(doc), str(output), key))
+    jobs.sort(key=lambda job: -Path(job[0]).stat().st_size)  # biggest first keeps the pool busy to the end
+
+    workers = max(1, min(workers or multiprocessing.cpu_count(), len(jobs)))
+    results, failed = [], []
+    if workers == 1:
+        _init_worker()
+        outcomes = map(_safe_convert, jobs)
+        for result in outcomes:
+            (failed if "error" in result else results).append(result)
+    else:
+        with multiprocessing.Pool(workers, initializer=_init_worker) as pool:
+            for result in pool.imap_unordered(_safe_convert, jobs):
+                (failed if "error" in result else results).append(result)
+
+    for result in results:
+        manifest[result["output"]] = {"source": result["source"], "key": result["key"], "slides": result["slides"]}
+    _write_atomic(manifest_path, json.dumps(manifest, indent=1, sort_keys=True).encode())
+    return {"converted": results, "failed": failed, "skipped": skipped,
+            "seconds": time.perf_counter() - started}
+
+
+def _safe_convert(job) -> dict:
+    try:
+        return convert_job(job)
+    except Exception as exc:        # one malformed document should not stop the rest
+        return {"source": job[0], "output": job[1], "error": f"{type(exc).__name__}: {exc}"}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Convert markdown docs into Turumba-styled decks")
+    parser.add_argument("paths", nargs="*", default=["docs"], help="Markdown files or directories (default: docs)")
+    parser.add_argument("--output", type=str, default=DEFAULT_OUTPUT, help=f"Output directory (default: {DEFAULT_OUTPUT})")
+    parser.add_argument(
+        "--cache-dir",
+        type=str,
+        default=DEFAULT_CACHE_DIR,
+        help=f"Directory for the conversion manifest (default: {DEFAULT_CACHE_DIR})",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=multiprocessing.cpu_count(),
+        help="Worker processes (default: CPU count)",
+    )
+    parser.add_argument("--force", action="store_true", help="Convert every document, changed or not")
+    args = parser.parse_args()
+
+    try:
+        stats = convert_all(args.paths, args.output, args.cache_dir, args.workers, args.force)
+    except ValueError as exc:
+        parser.error(str(exc))
+    slides = sum(r["slides"] for r in stats["converted"])
+    print(f"Converted {len(stats['converted'])} documents ({slides} slides), "
+          f"skipped {stats['skipped']} unchanged, in {stats['seconds']:.2f} s -> {args.output}")
+    for failure in stats["failed"]:
+        print(f"  failed: {failure['source']}: {failure['error']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,349 @@
+"""
+Export slide thumbnails (PNG) and PDFs through a pool of headless LibreOffice instances.
+
+Each slide is cut out of the deck as a one-slide package - the slide, its
+layout, master, theme, media and charts, nothing else - and keyed by a hash
+of everything that affects how it looks: its own XML, the parts it reaches
+through relationships (recursively), the presentation's slide size and text
+defaults, and the LibreOffice version and export settings. Speaker notes and
+chart workbooks are not part of the key. Rendered files live in the cache under that key, so
+re-exporting a rebuilt deck only converts the slides whose content changed.
+
+Missing slides are split across ``workers`` LibreOffice processes, each with
+its own profile directory (instances sharing a profile block on its lock),
+and every process converts its whole batch in one invocation so LibreOffice
+starts once per worker, not once per slide. The deck PDF is the per-slide
+PDFs joined with pypdf when it is installed; without it the whole deck is
+converted in one go, cached under the combined key of its slides.
+
+Usage:
+    python -m decks.export build/overview.pptx --output build/review
+    python -m decks.export build/agentic.pptx --output build/review --format png --width 960 --workers 4
+"""
+
+import argparse
+import hashlib
+import importlib.util
+import multiprocessing
+import os
+import re
+import shutil
+import subprocess
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from copy import deepcopy
+from pathlib import Path
+
+from lxml import etree
+
+from decks.optimize import CONTENT_TYPES, NS, _q, _rels_name, _resolve, _xml, read_parts, write_parts
+
+DEFAULT_CACHE_DIR = ".export_cache"
+EXPORT_VERSION = "1"
+FORMATS = ("png", "pdf")
+SOFFICE_TIMEOUT = 600           # seconds per batch
+
+RT_OFFICE_DOCUMENT = "http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument"
+RT_SLIDE = "http://schemas.openxmlformats.org/officeDocument/2006/relationships/slide"
+RT_SLIDE_LAYOUT = "http://schemas.openxmlformats.org/officeDocument/2006/relationships/slideLayout"
+RT_NOTES_SLIDE = "http://schemas.openxmlformats.org/officeDocument/2006/relationships/notesSlide"
+RT_PACKAGE = "http://schemas.openxmlformats.org/officeDocument/2006/relationships/package"
+
+_SLIDE_NUMBER = re.compile(rb'type="slidenum"')
+
+
+class ExportError(Exception):
+    pass
+
+
+def soffice_binary() -> str:
+    """The LibreOffice executable: $SOFFICE, or soffice/libreoffice on PATH."""
+    binary = os.environ.get("SOFFICE") or shutil.which("soffice") or shutil.which("libreoffice")
+    if not binary:
+        raise ExportError("LibreOffice not found; install it or point $SOFFICE at the soffice binary")
+    return binary
+
+
+def soffice_version(binary: str) -> str:
+    result = subprocess.run([binary, "--headless", "--version"], capture_output=True, text=True, timeout=60)
+    return result.stdout.strip()
+
+
+# ── Slides as one-slide packages ──
+
+class Deck:
+    """A saved deck's parts, with its relationship graph parsed once."""
+
+    def __init__(self, path):
+        self.parts = read_parts(path)
+        self.rels = {}          # part -> [(type, target part or external URL, external)]
+        for name in self.parts:
+            if not name.endswith(".rels"):
+                self.rels[name] = self._parse_rels(name, _rels_name(name))
+        self.rels[""] = self._parse_rels("", "_rels/.rels")
+
+        self.presentation = next(t for kind, t, _ in self.rels[""] if kind == RT_OFFICE_DOCUMENT)
+        pres = etree.fromstring(self.parts[self.presentation])
+        self._slide_rids = {_resolve(self.presentation, rel.get("Target")): rel.get("Id")
+                            for rel in etree.fromstring(self.parts[_rels_name(self.presentation)])
+                            if rel.get("Type") == RT_SLIDE}
+        by_rid = {rid: slide for slide, rid in self._slide_rids.items()}
+        id_list = pres.find("p:sldIdLst", NS)
+        self.slides = [by_rid[s.get(_q("r:id"))] for s in id_list] if id_list is not None else []
+        self._pres = pres
+
+        context = deepcopy(pres)    # what every slide's rendering depends on: size, text defaults
+        for el in context.findall("p:sldIdLst", NS):
+            context.remove(el)
+        self._context = etree.tostring(context, method="c14n")
+        self._digests = {}
+
+    def _parse_rels(self, source: str, rels_name: str) -> list:
+        blob = self.parts.get(rels_name)
+        if blob is None:
+            return []
+        rels = []
+        for rel in sorted(etree.fromstring(blob), key=lambda r: r.get("Id")):
+            external = rel.get("TargetMode") == "External"
+            target = rel.get("Target")
+            if not external:
+                target = target.lstrip("/") if target.startswith("/") else _resolve(source, target)
+            rels.append((rel.get("Type"), target, external))
+        return rels
+
+    def _followed(self, part: str):
+        """Relationships that affect how ``part`` renders.
+
+        Not notes, not a master's list of its layouts, and not a chart's embedded
+        workbook: charts draw from the values cached in the chart XML, and the
+        workbook carries a fresh timestamp on every build.
+        """
+        is_master = "/slideMasters/" in part
+        for kind, target, external in self.rels.get(part, ()):
+            if kind in (RT_NOTES_SLIDE, RT_PACKAGE) or (is_master and kind == RT_SLIDE_LAYOUT):
+                continue
+            yield kind, target, external
+
+    def digest(self, part: str, _visiting=None) -> bytes:
+        cached = self._digests.get(part)
+        if cached is not None:
+            return cached
+        visiting = _visiting or set()
+        visiting.add(part)
+        h = hashlib.sha256(self.parts[part])
+        for kind, target, external in self._followed(part):
+            h.update(kind.encode())
+            if external or target in visiting:
+                h.update(target.encode())
+            else:
+                h.update(self.digest(target, visiting))
+        visiting.discard(part)
+        self._digests[part] = h.digest()
+        return self._digests[part]
+
+    def slide_key(self, index: int, settings: str) -> str:
+        slide = self.slides[index]
+        h = hashlib.sha256(settings.encode())
+        h.update(self._context)
+        h.update(self.digest(slide))
+        if _SLIDE_NUMBER.search(self.parts[slide]):
+            h.update(str(index + 1).encode())
+        return h.hexdigest()
+
+    def _reachable(self, roots, skip=()) -> set:
+        seen, stack = set(), list(roots)
+        while stack:
+            part = stack.pop()
+            if part in seen or part in skip or part not in self.parts:
+                continue
+            seen.add(part)
+            stack.extend(t for _, t, external in self.rels.get(part, ()) if not external)
+        return seen
+
+    def single_slide(self, index: int) -> dict:
+        """Parts of a package holding only slide ``index``."""
+        slide = self.slides[index]
+        others = set(self.slides) - {slide}
+        roots = [t for _, t, external in self.rels[""] if not external]
+        keep = self._reachable(roots, skip=others)
+
+        pres = deepcopy(self._pres)
+        id_list = pres.find("p:sldIdLst", NS)
+        for sld_id in list(id_list):
+            if sld_id.get(_q("r:id")) != self._slide_rids[slide]:
+                id_list.remove(sld_id)
+        pres_rels = etree.fromstring(self.parts[_rels_name(self.presentation)])
+        for rel in list(pres_rels):
+            if rel.get("Type") == RT_SLIDE and _resolve(self.presentation, rel.get("Target")) != slide:
+                pres_rels.remove(rel)
+
+        types = etree.fromstring(self.parts[CONTENT_TYPES])
+        for override in types.findall("ct:Override", NS):
+            if override.get("PartName").lstrip("/") not in keep:
+                types.remove(override)
+
+        parts = {CONTENT_TYPES: _xml(types), "_rels/.rels": self.parts["_rels/.rels"]}
+        for name in keep:
+            parts[name] = self.parts[name]
+            rels_name = _rels_name(name)
+            if rels_name in self.parts:
+                parts[rels_name] = self.parts[rels_name]
+        parts[self.presentation] = _xml(pres)
+        parts[_rels_name(self.presentation)] = _xml(pres_rels)
+        return parts
+
+    def size(self) -> tuple[int, int]:
+        sld_sz = self._pres.find("p:sldSz", NS)
+        return int(sld_sz.get("cx")), int(sld_sz.get("cy"))
+
+
+# ── LibreOffice pool ──
+
+def _filter(fmt: str, width: int, height: int) -> str:
+    if fmt == "png":
+        return ('png:impress_png_Export:{"PixelWidth":{"type":"long","value":"%d"},'
+                '"PixelHeight":{"type":"long","value":"%d"}}' % (width, height))
+    return "pdf:impress_pdf_Export"
+
+
+def convert(binary: str, profile: Path, files: list, fmt: str, outdir: Path, width: int, height: int) -> None:
+    """Convert ``files`` to ``fmt`` in ``outdir`` with one LibreOffice process using ``profile``."""
+    command = [
+        binary, f"-env:UserInstallation={profile.resolve().as_uri()}",
+        "--headless", "--norestore", "--nologo", "--nolockcheck",
+        "--convert-to", _filter(fmt, width, height), "--outdir", str(outdir), *map(str, files),
+    ]
+    try:
+        result = subprocess.run(command, capture_output=True, text=True, timeout=SOFFICE_TIMEOUT)
+    except subprocess.TimeoutExpired as exc:
+        raise ExportError(f"LibreOffice timed out after {SOFFICE_TIMEOUT}s converting {len(files)} files") from exc
+    missing = [f for f in files if not (outdir / f"{Path(f).stem}.{fmt}").exists()]
+    if result.returncode or missing:
+        raise ExportError(f"LibreOffice failed on {len(missing)} of {len(files)} files "
+                          f"(exit {result.returncode}): {result.stderr.strip()[-500:]}")
+
+
+def _render_batch(binary, profile, deck, batch, formats, cache, width, height) -> None:
+    profile.mkdir(parents=True, exist_ok=True)
+    with tempfile.TemporaryDirectory(dir=cache) as tmp:
+        tmp = Path(tmp)
+        files = []
+        for index, key in batch:
+            path = tmp / f"{key}.pptx"
+            write_parts(deck.single_slide(index), path, level=1)
+            files.append(path)
+        for fmt in formats:
+            convert(binary, profile, files, fmt, tmp, width, height)
+            for path in files:
+                os.replace(tmp / f"{path.stem}.{fmt}", cache / f"{path.stem}.{fmt}")
+
+
+def _render_whole(binary, profile, deck_path, target, width, height) -> None:
+    profile.mkdir(parents=True, exist_ok=True)
+    with tempfile.TemporaryDirectory(dir=target.parent) as tmp:
+        source = Path(tmp) / f"{target.stem}.pptx"
+        shutil.copyfile(deck_path, source)
+        convert(binary, profile, [source], "pdf", Path(tmp), width, height)
+        os.replace(Path(tmp) / f"{target.stem}.pdf", target)
+
+
+def _has_pypdf() -> bool:
+    return importlib.util.find_spec("pypdf") is not None
+
+
+def _join_pdfs(paths, output) -> None:
+    from pypdf import PdfWriter  # optional: without it the deck PDF is converted whole
+
+    writer = PdfWriter()
+    for path in paths:
+        writer.append(str(path))
+    with open(output, "wb") as f:
+        writer.write(f)
+
+
+def export(deck_path, output, formats=FORMATS, cache_dir=DEFAULT_CACHE_DIR, workers=None, width=1280) -> dict:
+    """Write ``<stem>-NN.png`` thumbnails and/or ``<stem>.pdf`` for ``deck_path`` into ``output``.
+
+    Returns stats: slides, how many were rendered and how many came from the cache.
+    """
+    started = time.perf_counter()
+    binary = soffice_binary()
+    cache = Path(cache_dir)
+    cache.mkdir(parents=True, exist_ok=True)
+    output = Path(output)
+    output.mkdir(parents=True, exist_ok=True)
+    workers = workers or multiprocessing.cpu_count()
+
+    deck = Deck(deck_path)
+    cx, cy = deck.size()
+    height = round(width * cy / cx)
+    settings = f"{EXPORT_VERSION}|{soffice_version(binary)}|{width}x{height}"
+    keys = [deck.slide_key(i, settings) for i in range(len(deck.slides))]
+
+    slide_formats = tuple(f for f in formats if f == "png" or (f == "pdf" and _has_pypdf()))
+    missing = [(i, key) for i, key in enumerate(keys)
+               if slide_formats and not all((cache / f"{key}.{fmt}").exists() for fmt in slide_formats)]
+    jobs = [missing[n::workers] for n in range(workers) if missing[n::workers]]
+
+    deck_pdf = whole = None
+    if "pdf" in formats and "pdf" not in slide_formats:
+        deck_pdf = cache / f"{hashlib.sha256(''.join(keys).encode()).hexdigest()}.pdf"
+        whole = not deck_pdf.exists()
+
+    with ThreadPoolExecutor(max(1, len(jobs))) as pool:
+        futures = [pool.submit(_render_batch, binary, cache / "profiles" / str(n), deck, batch,
+                               slide_formats, cache, width, height) for n, batch in enumerate(jobs)]
+        if whole:
+            futures.append(pool.submit(_render_whole, binary, cache / "profiles" / str(len(jobs)),
+                                       deck_path, deck_pdf, width, height))
+        for future in futures:
+            future.result()
+
+    stem = Path(deck_path).stem
+    if "png" in formats:
+        digits = max(2, len(str(len(keys))))
+        for i, key in enumerate(keys):
+            shutil.copyfile(cache / f"{key}.png", output / f"{stem}-{i + 1:0{digits}d}.png")
+    if "pdf" in formats:
+        if deck_pdf is not None:
+            shutil.copyfile(deck_pdf, output / f"{stem}.pdf")
+        else:
+            _join_pdfs([cache / f"{key}.pdf" for key in keys], output / f"{stem}.pdf")
+
+    rendered = len(keys) if whole else len(missing)
+    return {"slides": len(keys), "rendered": rendered, "cached": len(keys) - rendered,
+            "workers": len(jobs), "seconds": time.perf_counter() - started}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Export slide thumbnails and PDFs with headless LibreOffice")
+    parser.add_argument("decks", nargs="+", help="Decks (.pptx) to export")
+    parser.add_argument("--output", type=str, required=True, help="Directory for the PNGs and PDFs")
+    parser.add_argument("--format", nargs="+", choices=FORMATS, default=list(FORMATS), help="What to export")
+    parser.add_argument("--width", type=int, default=1280, help="Thumbnail width in pixels (default: 1280)")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=multiprocessing.cpu_count(),
+        help="LibreOffice instances (default: CPU count)",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        type=str,
+        default=DEFAULT_CACHE_DIR,
+        help=f"Rendered slide cache directory (default: {DEFAULT_CACHE_DIR})",
+    )
+    args = parser.parse_args()
+
+    try:
+        for deck in args.decks:
+            stats = export(deck, args.output, args.format, args.cache_dir, args.workers, args.width)
+            print(f"{deck}: {stats['slides']} slides, rendered {stats['rendered']} on {stats['workers']} "
+                  f"LibreOffice instances, {stats['cached']} from cache in {stats['seconds']:.1f}s")
+    except ExportError as exc:
+        parser.exit(1, f"export failed: {exc}\n")
+
+
+if __name__ == "__main__":
+    main()
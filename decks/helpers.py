@@ -0,0 +1,185 @@
+"""Slide-building helpers shared by the Turumba decks.
+
+The short names (``txt``, ``ml``, ``card``, ``rr`` ...) are the ones the overview
+deck has always used; the ``add_*`` twins keep the agentic deck's names and
+defaults and delegate to the same primitives.
+"""
+
+from copy import deepcopy
+from io import BytesIO
+
+from pptx import Presentation
+from pptx.api import _default_pptx_path
+from pptx.oxml import parse_xml
+from pptx.oxml.ns import nsdecls
+from pptx.text.text import _Paragraph
+from pptx.util import Inches, Pt
+from pptx.enum.text import PP_ALIGN
+from pptx.enum.shapes import MSO_SHAPE
+
+from decks.textfit import fit_lines, fit_size
+from decks.theme import (
+    ACCENT_BLUE, DARK_BG, MED_GRAY, SECTION_BG, SLIDE_HEIGHT, SLIDE_WIDTH, WHITE,
+)
+
+_template = None
+
+# Text helpers clone a pre-built <a:pPr> per distinct style instead of setting
+# size, color, bold, font and alignment one lxml lookup at a time.
+STYLE_CACHE = True
+_ppr_cache = {}
+
+
+def new_presentation():
+    """Return an empty 16:9 presentation.
+
+    python-pptx's default template is read once per process and kept in memory,
+    so batch workers that build many decks never go back to disk for it.
+    """
+    global _template
+    if _template is None:
+        with open(_default_pptx_path(), "rb") as f:
+            _template = f.read()
+    prs = Presentation(BytesIO(_template))
+    prs.slide_width  = SLIDE_WIDTH
+    prs.slide_height = SLIDE_HEIGHT
+    return prs
+
+def blank(prs):
+    return prs.slides.add_slide(prs.slide_layouts[6])
+
+
+# ── Paragraph styles ──
+
+def _apply_style(p, sz, clr, bold, font, align=None, space_after=None):
+    p.font.size = Pt(sz); p.font.color.rgb = clr; p.font.bold = bold
+    p.font.name = font
+    if align is not None:
+        p.alignment = align
+    if space_after is not None:
+        p.space_after = space_after
+
+def _style(p, sz, clr, bold, font, align=None, space_after=None):
+    if not STYLE_CACHE:
+        _apply_style(p, sz, clr, bold, font, align, space_after)
+        return
+    key = (sz, clr, bold, font, align, space_after)
+    ppr = _ppr_cache.get(key)
+    if ppr is None:
+        scratch = _Paragraph(parse_xml(f"<a:p {nsdecls('a')}/>"), None)
+        _apply_style(scratch, sz, clr, bold, font, align, space_after)
+        ppr = _ppr_cache[key] = scratch._p.pPr
+    p._p.insert(0, deepcopy(ppr))
+
+
+# ── Helpers ──
+
+def set_bg(slide, color=DARK_BG):
+    slide.background.fill.solid()
+    slide.background.fill.fore_color.rgb = color
+
+def rect(slide, l, t, w, h, fill, border=None, bw=None):
+    s = slide.shapes.add_shape(MSO_SHAPE.RECTANGLE, l, t, w, h)
+    s.fill.solid(); s.fill.fore_color.rgb = fill
+    if border:
+        s.line.color.rgb = border; s.line.width = bw or Pt(1)
+    else:
+        s.line.fill.background()
+    return s
+
+def rr(slide, l, t, w, h, fill, border=None, bw=None):
+    s = slide.shapes.add_shape(MSO_SHAPE.ROUNDED_RECTANGLE, l, t, w, h)
+    s.fill.solid(); s.fill.fore_color.rgb = fill
+    if border:
+        s.line.color.rgb = border; s.line.width = bw or Pt(1)
+    else:
+        s.line.fill.background()
+    return s
+
+def circle(slide, l, t, size, fill):
+    s = slide.shapes.add_shape(MSO_SHAPE.OVAL, l, t, size, size)
+    s.fill.solid(); s.fill.fore_color.rgb = fill; s.line.fill.background()
+    return s
+
+def txt(slide, text, l, t, w, h, sz=18, clr=WHITE, bold=False, align=PP_ALIGN.LEFT, font="Calibri", fit=False):
+    if fit:
+        sz = fit_size(text, w, h, sz, font=font, bold=bold)
+    tb = slide.shapes.add_textbox(l, t, w, h)
+    tf = tb.text_frame; tf.word_wrap = True
+    p = tf.paragraphs[0]; p.text = text
+    _style(p, sz, clr, bold, font, align=align)
+    return tb
+
+def ml(slide, lines, l, t, w, h, sz=14, clr=WHITE, sp=1.4, bullet=False, font="Calibri", fit=False):
+    lines = [(line, False, clr) if isinstance(line, str) else
+             (line[0], line[1] if len(line)>1 else False, line[2] if len(line)>2 else clr) for line in lines]
+    if fit:
+        sz = fit_lines(tuple((("\u2022  " if bullet else "") + text, bld) for text, bld, _ in lines),
+                       int(w), int(h), sz, font=font, spacing=sp)
+    tb = slide.shapes.add_textbox(l, t, w, h)
+    tf = tb.text_frame; tf.word_wrap = True
+    for i, (text, bld, c) in enumerate(lines):
+        p = tf.paragraphs[0] if i == 0 else tf.add_paragraph()
+        p.text = ("\u2022  " if bullet else "") + text
+        _style(p, sz, c, bld, font, space_after=Pt(sz * (sp - 1)))
+    return tb
+
+def card(slide, l, t, w, h, title, items, accent=ACCENT_BLUE, tsz=15, isz=12, fit=False):
+    rr(slide, l, t, w, h, SECTION_BG, accent, Pt(1.5))
+    txt(slide, title, l+Inches(.2), t+Inches(.12), w-Inches(.4), Inches(.35), sz=tsz, clr=accent, bold=True, fit=fit)
+    rect(slide, l+Inches(.2), t+Inches(.48), w-Inches(.4), Pt(1.5), accent)
+    if items:
+        ml(slide, items, l+Inches(.2), t+Inches(.58), w-Inches(.4), h-Inches(.7), sz=isz, bullet=True, sp=1.35, fit=fit)
+
+def section(slide, num, title, subtitle=""):
+    set_bg(slide)
+    rect(slide, Inches(0), Inches(3.2), Inches(13.333), Inches(1.1), SECTION_BG)
+    rect(slide, Inches(0), Inches(3.2), Inches(.15), Inches(1.1), ACCENT_BLUE)
+    txt(slide, f"0{num}" if num<10 else str(num), Inches(.6), Inches(2.2), Inches(2), Inches(.8),
+        sz=48, clr=ACCENT_BLUE, bold=True, font="Calibri Light")
+    txt(slide, title, Inches(.6), Inches(3.25), Inches(12), Inches(.7),
+        sz=36, clr=WHITE, bold=True, font="Calibri Light")
+    if subtitle:
+        txt(slide, subtitle, Inches(.6), Inches(4.4), Inches(10), Inches(.5), sz=18, clr=MED_GRAY)
+
+def stitle(slide, title, subtitle=""):
+    set_bg(slide)
+    rect(slide, Inches(.6), Inches(.5), Inches(1.5), Pt(3), ACCENT_BLUE)
+    txt(slide, title, Inches(.6), Inches(.6), Inches(11), Inches(.6),
+        sz=30, clr=WHITE, bold=True, font="Calibri Light")
+    if subtitle:
+        txt(slide, subtitle, Inches(.6), Inches(1.15), Inches(11), Inches(.4), sz=16, clr=MED_GRAY)
+
+
+# ── add_* twins (agentic deck names and defaults) ──
+
+def set_slide_bg(slide, color):
+    set_bg(slide, color)
+
+def add_shape(slide, left, top, width, height, fill_color, border_color=None, border_width=None):
+    return rr(slide, left, top, width, height, fill_color, border_color, border_width)
+
+def add_rect(slide, left, top, width, height, fill_color):
+    return rect(slide, left, top, width, height, fill_color)
+
+def add_text(slide, text, left, top, width, height, font_size=18, color=WHITE, bold=False, alignment=PP_ALIGN.LEFT, font_name="Calibri", fit=False):
+    return txt(slide, text, left, top, width, height, sz=font_size, clr=color, bold=bold, align=alignment, font=font_name, fit=fit)
+
+def add_multiline(slide, lines, left, top, width, height, font_size=16, color=WHITE, line_spacing=1.5, bullet=False, font_name="Calibri", fit=False):
+    """lines: list of (text, bold, color) or just strings"""
+    return ml(slide, lines, left, top, width, height, sz=font_size, clr=color, sp=line_spacing, bullet=bullet, font=font_name, fit=fit)
+
+def add_card(slide, left, top, width, height, title, items, accent=ACCENT_BLUE, title_size=16, item_size=13, fit=False):
+    add_shape(slide, left, top, width, height, SECTION_BG, accent, Pt(1.5))
+    # Title
+    add_text(slide, title, left + Inches(0.25), top + Inches(0.15), width - Inches(0.5), Inches(0.4),
+             font_size=title_size, color=accent, bold=True, fit=fit)
+    # Separator line
+    add_rect(slide, left + Inches(0.25), top + Inches(0.55), width - Inches(0.5), Pt(1.5), accent)
+    # Items
+    if items:
+        add_multiline(slide, items, left + Inches(0.25), top + Inches(0.65), width - Inches(0.5),
+                       height - Inches(0.85), font_size=item_size, bullet=True, line_spacing=1.4, fit=fit)
+
+def slide_title(slide, title, subtitle=""):
+    stitle(slide, title, subtitle)
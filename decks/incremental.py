@@ -0,0 +1,177 @@
+"""
+Incremental deck builds keyed by per-slide content hashes.
+
+Every slide is described by a spec: the function that draws it plus the
+arguments it is called with. A spec's key hashes the function's source, its
+arguments and the render version (helpers, theme and python-pptx version), so
+editing one slide function - or the data behind one slide of a generated
+report - changes exactly one key. Rendered slide XML is cached on disk under
+that key; on rebuild, unchanged slides are copied from the cache and only
+changed ones are drawn again.
+
+Slides that own relationships beyond their layout (pictures, charts) are
+always re-rendered, since their parts are not cached.
+
+Usage:
+    python -m decks.incremental overview --output build/overview.pptx
+    python -m decks.incremental agentic --output build/agentic.pptx --cache-dir .deck_cache
+"""
+
+import argparse
+import hashlib
+import inspect
+import marshal
+import os
+import tempfile
+import time
+from pathlib import Path
+
+import pptx
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+from pptx.oxml import parse_xml
+
+from decks import agentic, helpers, overview, textfit, theme
+from decks.helpers import blank, new_presentation
+
+DECKS = {
+    "overview": overview.SLIDES,
+    "agentic": agentic.SLIDES,
+}
+
+DEFAULT_CACHE_DIR = ".deck_cache"
+
+_render_version = None
+_source_hashes = {}
+
+
+class SlideSpec:
+    """A slide function and the arguments it is drawn with: ``build(slide, *args, **kwargs)``."""
+
+    __slots__ = ("build", "args", "kwargs")
+
+    def __init__(self, build, *args, **kwargs):
+        self.build = build
+        self.args = args
+        self.kwargs = kwargs
+
+    def render(self, slide):
+        self.build(slide, *self.args, **self.kwargs)
+
+
+def as_spec(slide) -> SlideSpec:
+    return slide if isinstance(slide, SlideSpec) else SlideSpec(slide)
+
+
+def render_version() -> str:
+    """Hash of everything every slide depends on: the helpers, text fitting, the theme and python-pptx."""
+    global _render_version
+    if _render_version is None:
+        digest = hashlib.sha256(pptx.__version__.encode())
+        for module in (helpers, textfit, theme):
+            digest.update(Path(module.__file__).read_bytes())
+        _render_version = digest.hexdigest()
+    return _render_version
+
+
+def _source_hash(build) -> str:
+    cached = _source_hashes.get(build)
+    if cached is None:
+        try:
+            source = inspect.getsource(build).encode()
+        except (OSError, TypeError):
+            source = marshal.dumps(build.__code__)  # defined without a source file (REPL, exec)
+        name = f"{build.__module__}.{build.__qualname__}".encode()
+        cached = _source_hashes[build] = hashlib.sha256(name + source).hexdigest()
+    return cached
+
+
+def spec_key(spec: SlideSpec) -> str:
+    digest = hashlib.sha256(render_version().encode())
+    digest.update(_source_hash(spec.build).encode())
+    digest.update(repr(spec.args).encode())
+    digest.update(repr(sorted(spec.kwargs.items())).encode())
+    return digest.hexdigest()
+
+
+def load_slide_xml(slide, blob: bytes):
+    """Replace a freshly added slide's XML with a previously rendered part blob."""
+    part = slide.part
+    part._element = parse_xml(blob)
+    part.__dict__.pop("slide", None)  # drop python-pptx's lazily cached Slide proxy of the old element
+    return part.slide
+
+
+def _cacheable(slide) -> bool:
+    return all(rel.reltype == RT.SLIDE_LAYOUT for rel in slide.part.rels.values())
+
+
+def _write_atomic(path: Path, blob: bytes) -> None:
+    fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    with os.fdopen(fd, "wb") as f:
+        f.write(blob)
+    os.replace(tmp, path)
+
+
+def build_incremental(slides, output=None, cache_dir=DEFAULT_CACHE_DIR, prs=None, prune=True):
+    """Build ``slides`` (functions or SlideSpecs), reusing cached XML for unchanged slides.
+
+    Returns ``(prs, stats)`` where stats counts rendered and reused slides.
+    """
+    cache = Path(cache_dir)
+    cache.mkdir(parents=True, exist_ok=True)
+    prs = prs or new_presentation()
+    stats = {"rendered": 0, "reused": 0, "uncacheable": 0}
+    keys = set()
+    started = time.perf_counter()
+
+    for spec in map(as_spec, slides):
+        key = spec_key(spec)
+        keys.add(key)
+        path = cache / f"{key}.xml"
+        slide = blank(prs)
+        try:
+            blob = path.read_bytes()
+        except FileNotFoundError:
+            blob = None
+        if blob is not None:
+            load_slide_xml(slide, blob)
+            stats["reused"] += 1
+            continue
+        spec.render(slide)
+        stats["rendered"] += 1
+        if _cacheable(slide):
+            _write_atomic(path, slide.part.blob)
+        else:
+            stats["uncacheable"] += 1
+
+    if prune:
+        for stale in cache.glob("*.xml"):
+            if stale.stem not in keys:
+                stale.unlink(missing_ok=True)
+    if output:
+        prs.save(output)
+    stats["seconds"] = time.perf_counter() - started
+    return prs, stats
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Rebuild a deck, re-rendering only slides whose content changed")
+    parser.add_argument("deck", choices=sorted(DECKS), help="Deck to build")
+    parser.add_argument("--output", type=str, required=True, help="Output .pptx path")
+    parser.add_argument(
+        "--cache-dir",
+        type=str,
+        default=DEFAULT_CACHE_DIR,
+        help=f"Rendered slide cache directory (default: {DEFAULT_CACHE_DIR})",
+    )
+    args = parser.parse_args()
+
+    Path(args.output).parent.mkdir(parents=True, exist_ok=True)
+    _, stats = build_incremental(DECKS[args.deck], args.output, Path(args.cache_dir) / args.deck)
+    print(f"Presentation saved to: {args.output}")
+    print(f"Rendered {stats['rendered']} slides, reused {stats['reused']} from cache "
+          f"in {stats['seconds'] * 1000:.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,380 @@
+"""
+Shrink a generated .pptx without changing how it looks.
+
+Works on any saved deck, at the package level:
+
+- Backgrounds. When every slide on a layout sets its own background, the
+  most common one becomes the layout's background and is dropped from the
+  slides that used it.
+- Decorations. Text-free shapes (accent bars, section bands) that repeat at
+  the same position on at least ``min_slides`` slides are moved into a copy
+  of the slide's layout, and those slides are pointed at it - when the saving
+  on the slides outweighs the new layout part. A shape only moves if every
+  shape below it that it overlaps moves too, so stacking order is unchanged.
+  Shapes and backgrounds that refer to the slide's relationships (picture
+  fills, hyperlinks) stay where they are.
+- Media. Binary parts (images, media) with identical bytes are collapsed into
+  one part and every relationship is repointed at it.
+- Compression. The zip is rewritten at ``level`` (0-9).
+
+Usage:
+    python -m decks.optimize docs/presentations/Turumba_2.0_Overview.pptx -o build/overview.min.pptx
+    python -m decks.optimize deck.pptx -o deck.min.pptx --level 6 --min-slides 3
+"""
+
+import argparse
+import hashlib
+import posixpath
+import re
+import time
+import zipfile
+import zlib
+from collections import Counter, defaultdict
+from copy import deepcopy
+from pathlib import Path
+
+from lxml import etree
+
+NS = {
+    "a": "http://schemas.openxmlformats.org/drawingml/2006/main",
+    "p": "http://schemas.openxmlformats.org/presentationml/2006/main",
+    "r": "http://schemas.openxmlformats.org/officeDocument/2006/relationships",
+    "rel": "http://schemas.openxmlformats.org/package/2006/relationships",
+    "ct": "http://schemas.openxmlformats.org/package/2006/content-types",
+}
+RT_SLIDE_LAYOUT = "http://schemas.openxmlformats.org/officeDocument/2006/relationships/slideLayout"
+CT_SLIDE_LAYOUT = "application/vnd.openxmlformats-officedocument.presentationml.slideLayout+xml"
+CONTENT_TYPES = "[Content_Types].xml"
+ZIP_ENTRY_OVERHEAD = 100        # local header + central directory record, roughly, per member
+LAYOUT_REGISTRATION = 250       # master rel, sldLayoutId and content-type override for a new layout
+
+_SLIDE = re.compile(r"^ppt/slides/slide\d+\.xml$")
+
+
+def _q(tag: str) -> str:
+    prefix, name = tag.split(":")
+    return f"{{{NS[prefix]}}}{name}"
+
+
+def _xml(element) -> bytes:
+    return etree.tostring(element, xml_declaration=True, encoding="UTF-8", standalone=True)
+
+
+def _rels_name(partname: str) -> str:
+    folder, name = posixpath.split(partname)
+    return posixpath.join(folder, "_rels", name + ".rels")
+
+
+def _resolve(source: str, target: str) -> str:
+    return posixpath.normpath(posixpath.join(posixpath.dirname(source), target))
+
+
+def _source_of(rels_name: str) -> str:
+    folder, name = posixpath.split(rels_name)
+    return posixpath.join(posixpath.dirname(folder), name[: -len(".rels")])
+
+
+# ── Backgrounds and decorations ──
+
+def _signature(shape) -> bytes:
+    """Shape XML without its per-slide id and name."""
+    clone = deepcopy(shape)
+    for c_nv_pr in clone.iter(_q("p:cNvPr")):
+        c_nv_pr.attrib.pop("id", None)
+        c_nv_pr.attrib.pop("name", None)
+    return etree.tostring(clone, method="c14n")
+
+
+def _bbox(shape):
+    off = shape.find(".//a:xfrm/a:off", NS)
+    ext = shape.find(".//a:xfrm/a:ext", NS)
+    if off is None or ext is None:
+        return None
+    x, y = int(off.get("x")), int(off.get("y"))
+    return x, y, x + int(ext.get("cx")), y + int(ext.get("cy"))
+
+
+def _overlaps(a, b) -> bool:
+    if a is None or b is None:
+        return True  # no geometry: assume the worst
+    return a[0] < b[2] and b[0] < a[2] and a[1] < b[3] and b[1] < a[3]
+
+
+def _has_rel_refs(element) -> bool:
+    """Whether ``element`` refers to its part's relationships (an image, a hyperlink), which a copy
+    in another part would leave dangling."""
+    prefix = f"{{{NS['r']}}}"
+    return any(key.startswith(prefix) for el in element.iter() for key in el.attrib)
+
+
+def _is_decoration(shape) -> bool:
+    return (
+        shape.tag == _q("p:sp")
+        and shape.find(".//p:nvPr/p:ph", NS) is None
+        and not _has_rel_refs(shape)
+        and not "".join(t.text or "" for t in shape.iter(_q("a:t"))).strip()
+        and _bbox(shape) is not None
+    )
+
+
+def _shapes(slide):
+    tree = slide.find("p:cSld/p:spTree", NS)
+    return [el for el in tree if el.tag not in (_q("p:nvGrpSpPr"), _q("p:grpSpPr"))]
+
+
+def _layout_rel(rels):
+    for rel in rels:
+        if rel.get("Type") == RT_SLIDE_LAYOUT:
+            return rel
+    return None
+
+
+def _packed(blob: bytes, level: int) -> int:
+    return len(zlib.compress(blob, level or 1)) + ZIP_ENTRY_OVERHEAD
+
+
+def factor_layouts(parts: dict, min_slides: int, level: int = 9) -> dict:
+    """Move repeated backgrounds and decorations into layouts; edits ``parts`` in place."""
+    slides = {}
+    for name in sorted(parts):
+        if _SLIDE.match(name) and _rels_name(name) in parts:
+            slide = etree.fromstring(parts[name])
+            rels = etree.fromstring(parts[_rels_name(name)])
+            rel = _layout_rel(rels)
+            if rel is not None:
+                slides[name] = (slide, rels, rel, _resolve(name, rel.get("Target")))
+    stats = {"layouts_added": 0, "shapes_moved": 0, "backgrounds_moved": 0}
+    dirty = set()
+
+    # Backgrounds: the most common one on a layout's slides becomes the layout's own. Only when
+    # every slide on the layout sets a background, since slides without one inherit the layout's.
+    by_layout = defaultdict(list)
+    for name, (slide, _, _, layout) in slides.items():
+        by_layout[layout].append((name, slide.find("p:cSld/p:bg", NS)))
+    for layout_name, members in by_layout.items():
+        if any(bg is None or _has_rel_refs(bg) for _, bg in members):
+            continue
+        signature, count = Counter(etree.tostring(bg, method="c14n") for _, bg in members).most_common(1)[0]
+        if count < min_slides:
+            continue
+        layout = etree.fromstring(parts[layout_name])
+        _set_background(layout, next(bg for _, bg in members if etree.tostring(bg, method="c14n") == signature))
+        parts[layout_name] = _xml(layout)
+        for name, bg in members:
+            if etree.tostring(bg, method="c14n") == signature:
+                bg.getparent().remove(bg)
+                dirty.add(name)
+        stats["backgrounds_moved"] += count
+
+    # Decorations: slides sharing a layout and the same set of movable shapes get a copy of the
+    # layout holding those shapes, when that makes the package smaller.
+    frequent = Counter()
+    for slide, *_ in slides.values():
+        frequent.update({_signature(s) for s in _shapes(slide) if _is_decoration(s)})
+
+    groups = defaultdict(list)
+    for name, (slide, _, _, layout) in slides.items():
+        moved, kept = [], []
+        for shape in _shapes(slide):
+            box = _bbox(shape)
+            if (
+                _is_decoration(shape)
+                and frequent[_signature(shape)] >= min_slides
+                and not any(_overlaps(box, k) for k in kept)
+            ):
+                moved.append(shape)
+            else:
+                kept.append(box)
+        if moved:
+            groups[(layout, tuple(map(_signature, moved)))].append((name, moved))
+
+    next_layout = 1 + max(
+        int(m.group(1)) for m in (re.match(r"ppt/slideLayouts/slideLayout(\d+)\.xml$", n) for n in parts) if m
+    )
+    for (layout_name, _), members in groups.items():
+        if len(members) < min_slides:
+            continue
+        before = after = 0
+        for slide_name, moved in members:
+            slide = slides[slide_name][0]
+            before += _packed(_xml(slide), level)
+            trimmed = deepcopy(slide)
+            drop = {id(shape) for shape in moved}
+            for original, clone in zip(_shapes(slide), _shapes(trimmed)):
+                if id(original) in drop:
+                    clone.getparent().remove(clone)
+            after += _packed(_xml(trimmed), level)
+        new_layout = _layout_with(parts[layout_name], members[0][1], next_layout)
+        after += _packed(new_layout, level) + _packed(parts[_rels_name(layout_name)], level) + LAYOUT_REGISTRATION
+        if after >= before:
+            continue
+
+        new_name = f"ppt/slideLayouts/slideLayout{next_layout}.xml"
+        _add_layout(parts, layout_name, new_name, new_layout)
+        next_layout += 1
+        stats["layouts_added"] += 1
+        for slide_name, moved in members:
+            _, _, rel, _ = slides[slide_name]
+            for shape in moved:
+                shape.getparent().remove(shape)
+            stats["shapes_moved"] += len(moved)
+            rel.set("Target", posixpath.relpath(new_name, posixpath.dirname(slide_name)))
+            dirty.add(slide_name)
+
+    for name in dirty:
+        slide, rels, _, _ = slides[name]
+        parts[name] = _xml(slide)
+        parts[_rels_name(name)] = _xml(rels)
+    return stats
+
+
+def _set_background(layout, bg) -> None:
+    c_sld = layout.find("p:cSld", NS)
+    old_bg = c_sld.find("p:bg", NS)
+    if old_bg is not None:
+        c_sld.remove(old_bg)
+    c_sld.insert(0, deepcopy(bg))
+
+
+def _layout_with(blob: bytes, shapes, number: int) -> bytes:
+    """A copy of a layout with ``shapes`` drawn on it."""
+    layout = etree.fromstring(blob)
+    c_sld = layout.find("p:cSld", NS)
+    c_sld.set("name", f"{c_sld.get('name', 'Layout')} ({number})")
+    tree = c_sld.find("p:spTree", NS)
+    next_id = 1 + max(int(el.get("id")) for el in tree.iter(_q("p:cNvPr")))
+    for shape in shapes:
+        clone = deepcopy(shape)
+        clone.find(".//p:cNvPr", NS).set("id", str(next_id))
+        next_id += 1
+        tree.append(clone)
+    return _xml(layout)
+
+
+def _add_layout(parts: dict, source: str, name: str, blob: bytes) -> None:
+    parts[name] = blob
+    parts[_rels_name(name)] = parts[_rels_name(source)]
+
+    # register it with the same master as the layout it was copied from
+    layout_rels = etree.fromstring(parts[_rels_name(source)])
+    master_rel = next(r for r in layout_rels if r.get("Type").endswith("/slideMaster"))
+    master_name = _resolve(source, master_rel.get("Target"))
+    master = etree.fromstring(parts[master_name])
+    master_rels = etree.fromstring(parts[_rels_name(master_name)])
+    rids = {r.get("Id") for r in master_rels}
+    rid = next(f"rId{n}" for n in range(1, len(rids) + 2) if f"rId{n}" not in rids)
+    etree.SubElement(master_rels, _q("rel:Relationship"), Id=rid, Type=RT_SLIDE_LAYOUT,
+                     Target=posixpath.relpath(name, posixpath.dirname(master_name)))
+    id_lst = master.find("p:sldLayoutIdLst", NS)
+    etree.SubElement(id_lst, _q("p:sldLayoutId"), {"id": str(_next_layout_id(parts)), _q("r:id"): rid})
+    parts[master_name] = _xml(master)
+    parts[_rels_name(master_name)] = _xml(master_rels)
+
+    types = etree.fromstring(parts[CONTENT_TYPES])
+    etree.SubElement(types, _q("ct:Override"), PartName=f"/{name}", ContentType=CT_SLIDE_LAYOUT)
+    parts[CONTENT_TYPES] = _xml(types)
+
+
+def _next_layout_id(parts: dict) -> int:
+    """Master and layout IDs share one space (2^31 and up); take the next unused one."""
+    used = [2147483647]
+    for name, blob in parts.items():
+        if name == "ppt/presentation.xml" or name.startswith("ppt/slideMasters/slideMaster") and name.endswith(".xml"):
+            used += [int(i) for i in re.findall(rb'<p:sld(?:Master|Layout)Id id="(\d+)"', blob)]
+    return max(used) + 1
+
+
+# ── Media ──
+
+def dedupe_media(parts: dict) -> dict:
+    """Collapse byte-identical binary parts into one and repoint relationships; edits ``parts``."""
+    canonical, duplicates = {}, {}
+    for name in sorted(parts):
+        if name.endswith((".xml", ".rels")) or "/" not in name:
+            continue
+        digest = hashlib.sha256(parts[name]).digest()
+        keep = canonical.setdefault(digest, name)
+        if keep != name:
+            duplicates[name] = keep
+    if not duplicates:
+        return {"media_deduped": 0, "media_bytes_saved": 0}
+
+    for rels_name in [n for n in parts if n.endswith(".rels")]:
+        rels = etree.fromstring(parts[rels_name])
+        source = _source_of(rels_name)
+        changed = False
+        for rel in rels:
+            if rel.get("TargetMode") == "External":
+                continue
+            target = _resolve(source, rel.get("Target")) if not rel.get("Target").startswith("/") \
+                else rel.get("Target").lstrip("/")
+            if target in duplicates:
+                rel.set("Target", posixpath.relpath(duplicates[target], posixpath.dirname(source)))
+                changed = True
+        if changed:
+            parts[rels_name] = _xml(rels)
+
+    saved = sum(len(parts.pop(name)) for name in duplicates)
+    types = etree.fromstring(parts[CONTENT_TYPES])
+    for override in types.findall("ct:Override", NS):
+        if override.get("PartName").lstrip("/") in duplicates:
+            types.remove(override)
+    parts[CONTENT_TYPES] = _xml(types)
+    return {"media_deduped": len(duplicates), "media_bytes_saved": saved}
+
+
+# ── Package I/O ──
+
+def read_parts(path) -> dict:
+    with zipfile.ZipFile(path) as zf:
+        return {name: zf.read(name) for name in zf.namelist()}
+
+
+def write_parts(parts: dict, path, level: int = 9) -> None:
+    compression = zipfile.ZIP_STORED if level == 0 else zipfile.ZIP_DEFLATED
+    with zipfile.ZipFile(path, "w", compression=compression, compresslevel=level or None) as zf:
+        zf.writestr(CONTENT_TYPES, parts[CONTENT_TYPES])
+        for name, blob in parts.items():
+            if name != CONTENT_TYPES:
+                zf.writestr(name, blob)
+
+
+def optimize(source, output, level: int = 9, min_slides: int = 2, layouts: bool = True, media: bool = True) -> dict:
+    """Write an optimized copy of ``source`` to ``output``; return what was done and what it saved."""
+    started = time.perf_counter()
+    parts = read_parts(source)
+    stats = {"layouts_added": 0, "shapes_moved": 0, "backgrounds_moved": 0, "media_deduped": 0, "media_bytes_saved": 0}
+    if layouts:
+        stats.update(factor_layouts(parts, min_slides, level))
+    if media:
+        stats.update(dedupe_media(parts))
+    write_parts(parts, output, level)
+    stats["bytes_in"] = Path(source).stat().st_size
+    stats["bytes_out"] = Path(output).stat().st_size
+    stats["bytes_saved"] = stats["bytes_in"] - stats["bytes_out"]
+    stats["seconds"] = time.perf_counter() - started
+    return stats
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Shrink a .pptx by factoring repeated content into layouts")
+    parser.add_argument("input", help="Deck to optimize")
+    parser.add_argument("-o", "--output", type=str, required=True, help="Optimized .pptx path")
+    parser.add_argument("--level", type=int, default=9, choices=range(10), help="Deflate level, 0 = store (default: 9)")
+    parser.add_argument("--min-slides", type=int, default=2, help="Slides that must share a decoration (default: 2)")
+    parser.add_argument("--no-layouts", action="store_true", help="Leave backgrounds and decorations on the slides")
+    parser.add_argument("--no-media", action="store_true", help="Skip media deduplication")
+    args = parser.parse_args()
+
+    Path(args.output).parent.mkdir(parents=True, exist_ok=True)
+    stats = optimize(args.input, args.output, args.level, args.min_slides, not args.no_layouts, not args.no_media)
+    print(f"Optimized deck saved to: {args.output}")
+    print(f"  {stats['backgrounds_moved']} backgrounds and {stats['shapes_moved']} shapes moved "
+          f"into {stats['layouts_added']} new layouts")
+    print(f"  {stats['media_deduped']} duplicate media parts removed ({stats['media_bytes_saved']:,} bytes)")
+    print(f"  {stats['bytes_in']:,} -> {stats['bytes_out']:,} bytes, saved {stats['bytes_saved']:,} "
+          f"({stats['bytes_saved'] / stats['bytes_in']:.1%}) in {stats['seconds'] * 1000:.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,247 @@
+"""
+Render slides in worker processes and merge them into one presentation.
+
+Slide specs (functions or SlideSpecs, as in decks.incremental) are split into
+contiguous chunks. Each worker draws its chunk on a scratch presentation built
+from the same sized template and ships back, per slide, the slide part XML and
+every part it relates to besides its layout (pictures, charts and their
+embedded workbooks), recursively. The parent adds one blank slide per result
+in the original order, so slide IDs, the slide list and layout relationships
+come out exactly as a sequential build would assign them, then swaps in the
+rendered XML and re-attaches the related parts under fresh part names with the
+same rIds the slide XML refers to. Images and media go through python-pptx's
+own get-or-add, which reuses a part with the same SHA1, so a picture used on
+many slides is stored once, as in a sequential build.
+
+Shape IDs are allocated per slide, so a slide rendered in a worker is
+byte-identical to the same slide rendered sequentially; ``--verify`` checks
+that against an in-process build. (Embedded chart workbooks carry their own
+creation timestamp, so those differ between any two builds.)
+
+The ``pictures`` deck puts one shared logo and a per-slide PNG or JPEG on
+every slide, to check image sharing and numbering with ``--verify``.
+
+Usage:
+    python -m decks.parallel overview --output build/overview.pptx
+    python -m decks.parallel overview --repeat 56 --workers 8 --output build/report.pptx --verify
+    python -m decks.parallel pictures --repeat 4 --output build/pictures.pptx --verify
+"""
+
+import argparse
+import io
+import multiprocessing
+import re
+import time
+import zipfile
+from functools import lru_cache
+from pathlib import Path, PurePosixPath
+
+from pptx.media import Video
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+from pptx.opc.package import Part
+from pptx.opc.packuri import PackURI
+from pptx.util import Inches
+
+from decks.helpers import blank, new_presentation, stitle
+from decks.incremental import DECKS, SlideSpec, as_spec, load_slide_xml
+from decks.theme import ACCENT_BLUE, ACCENT_TEAL, GREEN, ORANGE, PINK, PURPLE
+
+
+class MergeError(Exception):
+    """A worker-rendered slide could not be attached with the rIds its XML expects."""
+
+
+def _rid_order(item):
+    return int(item[0][3:]) if item[0].startswith("rId") and item[0][3:].isdigit() else 0
+
+
+def _export_rels(part, depth=0) -> list:
+    """Snapshot ``part``'s non-layout relationships as picklable tuples, recursing into targets."""
+    if depth > 8:
+        raise MergeError(f"relationship chain too deep below {part.partname}")
+    exported = []
+    for rId, rel in sorted(part.rels.items(), key=_rid_order):
+        if rel.reltype == RT.SLIDE_LAYOUT:
+            continue
+        if rel.is_external:
+            exported.append((rId, rel.reltype, True, rel.target_ref))
+            continue
+        target = rel.target_part
+        exported.append((rId, rel.reltype, False, {
+            "partname": str(target.partname),
+            "content_type": target.content_type,
+            "blob": target.blob,
+            "rels": _export_rels(target, depth + 1),
+        }))
+    return exported
+
+
+def _partname_template(partname: str) -> str:
+    """'/ppt/charts/chart3.xml' -> '/ppt/charts/chart%d.xml'."""
+    return re.sub(r"\d+(\.\w+)$", r"%d\1", partname)
+
+
+def _import_part(package, target):
+    """A part for an exported target; images and media reuse an existing part with the same bytes."""
+    content_type, blob = target["content_type"], target["blob"]
+    if content_type.startswith("image/"):
+        return package.get_or_add_image_part(io.BytesIO(blob))
+    if content_type.startswith(("video/", "audio/")):
+        filename = PurePosixPath(target["partname"]).name
+        return package.get_or_add_media_part(Video.from_blob(blob, content_type, filename))
+    partname = package.next_partname(_partname_template(target["partname"]))
+    child = Part.load(PackURI(partname), content_type, package, blob)
+    _import_rels(package, child, target["rels"])
+    return child
+
+
+def _import_rels(package, part, exported) -> None:
+    for rId, reltype, is_external, target in exported:
+        if is_external:
+            new_rId = part.rels.get_or_add_ext_rel(reltype, target)
+        else:
+            new_rId = part.rels.get_or_add(reltype, _import_part(package, target))
+        if new_rId != rId:
+            raise MergeError(f"{part.partname}: expected {rId} for {reltype}, got {new_rId}")
+
+
+def render_chunk(chunk) -> list[tuple[int, bytes, list]]:
+    """Draw ``(index, spec)`` pairs on a scratch presentation; return their parts."""
+    prs = new_presentation()
+    rendered = []
+    for index, spec in chunk:
+        slide = blank(prs)
+        spec.render(slide)
+        rendered.append((index, slide.part.blob, _export_rels(slide.part)))
+    return rendered
+
+
+def _chunks(specs, size):
+    for start in range(0, len(specs), size):
+        yield [(start + i, spec) for i, spec in enumerate(specs[start:start + size])]
+
+
+def merge_rendered(prs, rendered) -> None:
+    """Append rendered slides to ``prs`` in index order."""
+    package = prs.part.package
+    for _, blob, rels in sorted(rendered, key=lambda r: r[0]):
+        slide = blank(prs)
+        load_slide_xml(slide, blob)
+        _import_rels(package, slide.part, rels)
+
+
+def build_parallel(slides, output=None, workers=None, prs=None, chunksize=None):
+    """Render ``slides`` (functions or SlideSpecs) across ``workers`` processes into one deck.
+
+    Specs must be picklable: module-level slide functions and plain-data
+    arguments. Returns ``(prs, stats)``.
+    """
+    specs = [as_spec(s) for s in slides]
+    workers = workers or multiprocessing.cpu_count()
+    prs = prs or new_presentation()
+    started = time.perf_counter()
+    if chunksize is None:
+        chunksize = max(1, -(-len(specs) // (workers * 4)))
+
+    if workers <= 1 or len(specs) <= chunksize:
+        rendered = [r for chunk in _chunks(specs, len(specs) or 1) for r in render_chunk(chunk)]
+    else:
+        with multiprocessing.Pool(workers, initializer=new_presentation) as pool:
+            rendered = [r for part in pool.imap_unordered(render_chunk, _chunks(specs, chunksize)) for r in part]
+    render_done = time.perf_counter()
+
+    merge_rendered(prs, rendered)
+    merge_done = time.perf_counter()
+    if output:
+        prs.save(output)
+    finished = time.perf_counter()
+    return prs, {
+        "slides": len(specs),
+        "workers": workers,
+        "render_seconds": render_done - started,
+        "merge_seconds": merge_done - render_done,
+        "save_seconds": finished - merge_done,
+        "seconds": finished - started,
+    }
+
+
+def build_sequential(slides, output=None, prs=None):
+    prs = prs or new_presentation()
+    for spec in map(as_spec, slides):
+        spec.render(blank(prs))
+    if output:
+        prs.save(output)
+    return prs
+
+
+def package_parts(prs) -> dict[str, bytes]:
+    buffer = io.BytesIO()
+    prs.save(buffer)
+    with zipfile.ZipFile(buffer) as zf:
+        return {name: zf.read(name) for name in zf.namelist()}
+
+
+def _differences(a: dict[str, bytes], b: dict[str, bytes]) -> list[str]:
+    names = sorted(set(a) | set(b))
+    return [name for name in names if a.get(name) != b.get(name)]
+
+
+# ── Picture deck ──
+
+@lru_cache(maxsize=None)
+def _swatch(color, fmt: str) -> bytes:
+    from PIL import Image
+
+    buffer = io.BytesIO()
+    Image.new("RGB", (96, 96), tuple(color)).save(buffer, fmt)
+    return buffer.getvalue()
+
+
+def picture_slide(s, n):
+    stitle(s, f"Pictures {n + 1}", "A shared logo and a slide-specific swatch")
+    s.shapes.add_picture(io.BytesIO(_swatch(ACCENT_BLUE, "PNG")), Inches(11.5), Inches(.4), Inches(1))
+    colors = (ACCENT_TEAL, GREEN, ORANGE, PINK, PURPLE)
+    fmt = "JPEG" if n % 3 == 2 else "PNG"
+    s.shapes.add_picture(io.BytesIO(_swatch(colors[n % len(colors)], fmt)), Inches(1), Inches(2), Inches(3))
+
+
+PARALLEL_DECKS = {**DECKS, "pictures": [SlideSpec(picture_slide, n) for n in range(8)]}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Render a deck's slides in parallel worker processes")
+    parser.add_argument("deck", choices=sorted(PARALLEL_DECKS), help="Deck to build")
+    parser.add_argument("--output", type=str, required=True, help="Output .pptx path")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=multiprocessing.cpu_count(),
+        help="Worker processes (default: CPU count)",
+    )
+    parser.add_argument("--repeat", type=int, default=1, help="Repeat the deck's slides N times (load testing)")
+    parser.add_argument("--chunksize", type=int, default=None, help="Slides per worker task")
+    parser.add_argument("--verify", action="store_true", help="Compare against a sequential build, part by part")
+    args = parser.parse_args()
+
+    slides = list(PARALLEL_DECKS[args.deck]) * args.repeat
+    Path(args.output).parent.mkdir(parents=True, exist_ok=True)
+    prs, stats = build_parallel(slides, args.output, args.workers, chunksize=args.chunksize)
+    print(f"Presentation saved to: {args.output}")
+    print(f"{stats['slides']} slides on {stats['workers']} workers in {stats['seconds'] * 1000:.0f} ms "
+          f"(render {stats['render_seconds'] * 1000:.0f} ms, merge {stats['merge_seconds'] * 1000:.0f} ms, "
+          f"save {stats['save_seconds'] * 1000:.0f} ms)")
+
+    if args.verify:
+        started = time.perf_counter()
+        expected = package_parts(build_sequential(slides))
+        seconds = time.perf_counter() - started
+        diff = _differences(package_parts(prs), expected)
+        print(f"Sequential build: {seconds * 1000:.0f} ms")
+        if diff:
+            print(f"MISMATCH in {len(diff)} parts: {', '.join(diff[:10])}")
+            raise SystemExit(1)
+        print("Identical to the sequential build")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,363 @@
+"""
+Turn benchmark results into a performance report deck.
+
+Input is JSON in either of two shapes. The generic one:
+
+    {
+      "title": "Messaging API load test",
+      "date": "October 2026",
+      "benchmarks": [
+        {"name": "send_sms", "group": "api", "unit": "req/s", "higher_is_better": true,
+         "value": 1840, "baseline": 1710,
+         "latency_ms": {"p50": 12, "p95": 40, "p99": 85},
+         "baseline_latency_ms": {"p50": 11, "p95": 38, "p99": 120},
+         "rss_mb": [210, 214, 230, 228], "baseline_rss_mb": [205, 209, 221, 220], "rss_interval_s": 1}
+      ]
+    }
+
+Everything but ``name`` and ``value`` is optional. Output of
+``python -m decks.bench --json`` is also accepted and compared against its
+baseline (decks/bench_baseline.json unless ``--baseline`` says otherwise),
+with raw timings, or, with ``--normalize``, timings scaled by the two runs'
+calibration times the way ``decks.bench --normalize`` does.
+
+The deck follows the agentic deck's style (``slide_title``, ``add_card``):
+a title slide, a summary of regressions and improvements, change against
+baseline per group, latency percentiles, memory over time and a full
+results table. Regressions - worse than baseline by more than
+``--tolerance`` - are RED, improvements GREEN, the rest gray. Charts are
+native and go through decks.charts.ChartWriter, which builds chart XML from
+templates, so reports with hundreds of benchmarks render in about a second.
+
+Usage:
+    python -m decks.bench --json build/bench.json
+    python -m decks.perf_report build/bench.json --output build/perf_report.pptx
+    python -m decks.perf_report loadtest.json --output build/loadtest.pptx --tolerance 0.05
+"""
+
+import argparse
+import json
+import time
+from datetime import date
+from pathlib import Path
+
+from pptx.enum.text import PP_ALIGN
+from pptx.util import Inches, Pt
+
+from decks.charts import ChartWriter
+from decks.helpers import (
+    add_card, add_multiline, add_rect, add_shape, add_text, blank, new_presentation, set_slide_bg, slide_title,
+)
+from decks.theme import (
+    ACCENT_BLUE, ACCENT_TEAL, DARK_BG, DARK_CARD, GREEN, LIGHT_GRAY, MED_GRAY, ORANGE, PINK, PURPLE, RED,
+    SECTION_BG, WHITE,
+)
+
+PALETTE = (ACCENT_BLUE, ACCENT_TEAL, ORANGE, PURPLE, PINK, GREEN, LIGHT_GRAY, RED)
+STATUS_COLORS = {"regression": RED, "improvement": GREEN, "unchanged": MED_GRAY, "new": ACCENT_BLUE}
+BARS_PER_SLIDE = 16
+LATENCY_PER_SLIDE = 8
+LINES_PER_SLIDE = 8
+ROWS_PER_SLIDE = 14
+DEFAULT_TOLERANCE = 0.10
+
+
+# ── Results ──
+
+def _status(change, higher_is_better, tolerance) -> str:
+    if change is None:
+        return "new"
+    better = change if higher_is_better else -change
+    if better < -tolerance:
+        return "regression"
+    if better > tolerance:
+        return "improvement"
+    return "unchanged"
+
+
+def _change(value, baseline):
+    return (value - baseline) / baseline if baseline else None
+
+
+def from_bench(results: dict, baseline: dict | None, normalize: bool = False) -> dict:
+    """Generic results from ``decks.bench`` output; with ``normalize``, timings scaled to the baseline machine."""
+    from decks.bench import TIMED, _metrics, calibration_scale
+
+    scale = calibration_scale(results, baseline) if baseline and normalize else 1.0
+    old = dict(_metrics(baseline)) if baseline else {}
+    units = {"us_per_call": "us/call", "ms": "ms", "build_ms": "ms", "save_ms": "ms"}
+    benchmarks = []
+    for name, row in _metrics(results):
+        group, _, short = name.rpartition(".")
+        base = old.get(name, {})
+        for key in TIMED:
+            if key in row:
+                benchmarks.append({
+                    "name": short if key in ("us_per_call", "ms") else f"{short} {key[:-3]}", "group": group,
+                    "unit": units[key], "higher_is_better": False,
+                    "value": row[key] / scale, "baseline": base.get(key),
+                })
+        if "peak_rss_mb" in row:
+            benchmarks.append({
+                "name": f"{short} peak RSS", "group": "memory", "unit": "MB",
+                "higher_is_better": False, "value": row["peak_rss_mb"], "baseline": base.get("peak_rss_mb"),
+            })
+    meta = results["meta"]
+    return {
+        "title": "Deck Builder Benchmarks",
+        "subtitle": f"Python {meta.get('python', '?')}  |  python-pptx {meta.get('python_pptx', '?')}"
+                    + (f"  |  timings x{1 / scale:.2f} to the baseline machine" if scale != 1.0 else ""),
+        "benchmarks": benchmarks,
+    }
+
+
+def load_results(path, baseline_path=None, normalize: bool = False) -> dict:
+    results = json.loads(Path(path).read_text())
+    if "helpers" in results and "decks" in results:
+        from decks.bench import BASELINE
+
+        baseline_file = Path(baseline_path or BASELINE)
+        baseline = json.loads(baseline_file.read_text()) if baseline_file.exists() else None
+        return from_bench(results, baseline, normalize)
+    if "benchmarks" not in results:
+        raise ValueError(f"{path}: expected a 'benchmarks' list or decks.bench output")
+    return results
+
+
+def classify(results: dict, tolerance: float) -> list[dict]:
+    """Benchmarks with ``change`` (fraction vs baseline) and ``status`` filled in."""
+    rows = []
+    for b in results["benchmarks"]:
+        higher = b.get("higher_is_better", False)
+        change = _change(b["value"], b.get("baseline"))
+        latency = b.get("latency_ms") or {}
+        base_latency = b.get("baseline_latency_ms") or {}
+        worst = max(latency, key=_percentile, default=None)
+        latency_change = _change(latency[worst], base_latency.get(worst)) if worst else None
+        status = _status(change, higher, tolerance)
+        latency_status = _status(latency_change, False, tolerance)
+        if status != "regression" and latency_status == "regression":
+            status = "regression"  # a tail-latency regression counts even when throughput held
+        rows.append({**b, "group": b.get("group", "benchmarks"), "unit": b.get("unit", ""),
+                     "higher_is_better": higher, "change": change, "status": status,
+                     "tail": worst, "tail_change": latency_change, "tail_status": latency_status})
+    return rows
+
+
+def _percentile(name: str) -> float:
+    try:
+        return float(name.lstrip("pP"))
+    except ValueError:
+        return 0.0
+
+
+def _fmt(value) -> str:
+    if value is None:
+        return "-"
+    if abs(value) >= 1000:
+        return f"{value:,.0f}"
+    return f"{value:.3g}" if abs(value) < 10 else f"{value:.1f}"
+
+
+def _pct(change) -> str:
+    return "new" if change is None else f"{change:+.1%}"
+
+
+def _pages(items, size):
+    return [items[i:i + size] for i in range(0, len(items), size)] or [[]]
+
+
+# ── Slides ──
+
+def title_slide(slide, report):
+    set_slide_bg(slide, DARK_BG)
+    add_rect(slide, Inches(0), Inches(0), Inches(0.15), Inches(7.5), ACCENT_BLUE)
+    add_rect(slide, Inches(0), Inches(4.4), Inches(13.333), Pt(2), DARK_CARD)
+
+    add_text(slide, report["title"], Inches(1), Inches(1.2), Inches(11), Inches(0.9),
+             font_size=48, color=WHITE, bold=True, font_name="Calibri Light", fit=True)
+    add_text(slide, "Performance Report", Inches(1), Inches(2.1), Inches(11), Inches(0.7),
+             font_size=40, color=ACCENT_TEAL, bold=True, font_name="Calibri Light")
+    if report.get("subtitle"):
+        add_text(slide, report["subtitle"], Inches(1), Inches(3.3), Inches(11), Inches(0.5),
+                 font_size=18, color=LIGHT_GRAY)
+
+    counts = report["counts"]
+    add_text(slide, f"{len(report['rows'])} benchmarks  |  {counts['regression']} regressions  |  "
+             f"{counts['improvement']} improvements", Inches(1), Inches(4.8), Inches(9), Inches(0.4),
+             font_size=16, color=MED_GRAY)
+    add_text(slide, report["date"], Inches(9.5), Inches(6.5), Inches(3), Inches(0.3),
+             font_size=14, color=MED_GRAY, alignment=PP_ALIGN.RIGHT)
+
+
+def summary(slide, report):
+    slide_title(slide, "Summary", f"Against baseline, tolerance {report['tolerance']:.0%}")
+
+    counts = report["counts"]
+    tiles = [
+        ("Regressions", counts["regression"], RED),
+        ("Improvements", counts["improvement"], GREEN),
+        ("Unchanged", counts["unchanged"], MED_GRAY),
+        ("New", counts["new"], ACCENT_BLUE),
+    ]
+    for i, (label, count, color) in enumerate(tiles):
+        x = Inches(0.5) + Inches(i * 3.15)
+        add_shape(slide, x, Inches(1.8), Inches(2.9), Inches(1.5), SECTION_BG, color, Pt(2))
+        add_text(slide, str(count), x, Inches(1.9), Inches(2.9), Inches(0.8),
+                 font_size=40, color=color, bold=True, alignment=PP_ALIGN.CENTER)
+        add_text(slide, label, x, Inches(2.75), Inches(2.9), Inches(0.4),
+                 font_size=16, color=LIGHT_GRAY, alignment=PP_ALIGN.CENTER)
+
+    def worst(status, key):
+        rows = [r for r in report["rows"] if r["status"] == status]
+        return sorted(rows, key=key)[:6]
+
+    def badness(r):
+        change = r["change"] if r["change"] is not None else 0.0
+        return -abs(change)
+
+    regressions = [f"{r['name']}: {_pct(r['change'])}"
+                   + (f", {r['tail']} {_pct(r['tail_change'])}" if r["tail_status"] == "regression" else "")
+                   for r in worst("regression", badness)]
+    improvements = [f"{r['name']}: {_pct(r['change'])}" for r in worst("improvement", badness)]
+    add_card(slide, Inches(0.5), Inches(3.6), Inches(6.05), Inches(3.4), "Largest Regressions",
+             regressions or ["None"], accent=RED, item_size=13, fit=True)
+    add_card(slide, Inches(6.75), Inches(3.6), Inches(6.05), Inches(3.4), "Largest Improvements",
+             improvements or ["None"], accent=GREEN, item_size=13, fit=True)
+
+
+def changes(slide, report, group, rows, page, pages, charts):
+    suffix = f"  ({page}/{pages})" if pages > 1 else ""
+    slide_title(slide, f"Change vs Baseline: {group}{suffix}",
+                "Positive is better; red regressed, green improved beyond tolerance")
+    rows = rows[::-1]  # bar charts draw bottom-up
+    better = [None if r["change"] is None else 100 * (r["change"] if r["higher_is_better"] else -r["change"])
+              for r in rows]
+    charts.add(slide, "bar", [r["name"] for r in rows], [("Change %", better, MED_GRAY)],
+               Inches(0.5), Inches(1.7), Inches(8.4), Inches(5.5), labels=True, number_format='0.0"%"',
+               point_colors=[STATUS_COLORS[r["status"]] for r in rows])
+    lines = [(f"{r['name']}: {_fmt(r['value'])} {r['unit']}", r["status"] != "unchanged",
+              STATUS_COLORS[r["status"]]) for r in rows[::-1]]
+    add_card(slide, Inches(9.1), Inches(1.7), Inches(3.7), Inches(5.5), "Current", lines,
+             accent=ACCENT_BLUE, item_size=11, fit=True)
+
+
+def latency(slide, report, rows, page, pages, charts):
+    suffix = f"  ({page}/{pages})" if pages > 1 else ""
+    slide_title(slide, f"Latency Percentiles{suffix}", "Milliseconds, current run; tail change vs baseline at right")
+    percentiles = sorted({p for r in rows for p in r["latency_ms"]}, key=_percentile)
+    series = [(p, [r["latency_ms"].get(p) for r in rows], PALETTE[i % len(PALETTE)])
+              for i, p in enumerate(percentiles)]
+    charts.add(slide, "column", [r["name"] for r in rows], series,
+               Inches(0.5), Inches(1.7), Inches(8.4), Inches(5.5), legend=True, number_format="0.0")
+    lines = [(f"{r['name']} {r['tail']}: {_pct(r['tail_change'])}", r["tail_status"] != "unchanged",
+              STATUS_COLORS[r["tail_status"]]) for r in rows]
+    add_card(slide, Inches(9.1), Inches(1.7), Inches(3.7), Inches(5.5), "Tail Latency", lines,
+             accent=PURPLE, item_size=12, fit=True)
+
+
+def memory(slide, report, rows, page, pages, charts):
+    suffix = f"  ({page}/{pages})" if pages > 1 else ""
+    interval = rows[0].get("rss_interval_s", 1) if rows else 1
+    slide_title(slide, f"Memory Over Time{suffix}", f"Resident set size (MB), sampled every {interval}s")
+    length = max(len(r["rss_mb"]) for r in rows)
+    series = [(r["name"], r["rss_mb"], PALETTE[i % len(PALETTE)]) for i, r in enumerate(rows)]
+    charts.add(slide, "line", [_fmt(i * interval) for i in range(length)], series,
+               Inches(0.5), Inches(1.7), Inches(8.4), Inches(5.5), legend=True, number_format="0")
+    lines = []
+    for r in rows:
+        peak, base = max(r["rss_mb"]), max(r.get("baseline_rss_mb") or [0]) or None
+        status = _status(_change(peak, base), False, report["tolerance"])
+        lines.append((f"{r['name']}: peak {_fmt(peak)} MB ({_pct(_change(peak, base))})",
+                      status != "unchanged", STATUS_COLORS[status]))
+    add_card(slide, Inches(9.1), Inches(1.7), Inches(3.7), Inches(5.5), "Peak RSS", lines,
+             accent=ORANGE, item_size=12, fit=True)
+
+
+def table(slide, report, rows, page, pages):
+    suffix = f"  ({page}/{pages})" if pages > 1 else ""
+    slide_title(slide, f"All Results{suffix}", f"{len(report['rows'])} benchmarks")
+    add_shape(slide, Inches(0.5), Inches(1.7), Inches(12.3), Inches(5.5), SECTION_BG, DARK_CARD, Pt(1))
+    columns = [
+        ("Benchmark", Inches(0.8), Inches(5.2), [f"{r['group']} / {r['name']}" for r in rows], None),
+        ("Current", Inches(6.1), Inches(2), [f"{_fmt(r['value'])} {r['unit']}" for r in rows], None),
+        ("Baseline", Inches(8.2), Inches(2), [_fmt(r.get("baseline")) for r in rows], None),
+        ("Change", Inches(10.3), Inches(2.2), [_pct(r["change"]) for r in rows],
+         [STATUS_COLORS[r["status"]] for r in rows]),
+    ]
+    for title, x, w, values, colors in columns:
+        add_text(slide, title, x, Inches(1.85), w, Inches(0.35), font_size=13, color=ACCENT_BLUE, bold=True)
+        lines = [(v, False, colors[i] if colors else LIGHT_GRAY) for i, v in enumerate(values)]
+        add_multiline(slide, lines, x, Inches(2.25), w, Inches(4.9), font_size=12, line_spacing=1.2)
+
+
+def build_report(results: dict, output=None, tolerance=DEFAULT_TOLERANCE, prs=None):
+    rows = classify(results, tolerance)
+    counts = {status: sum(r["status"] == status for r in rows) for status in STATUS_COLORS}
+    report = {
+        "title": results.get("title", "Benchmarks"),
+        "subtitle": results.get("subtitle", ""),
+        "date": results.get("date") or date.today().strftime("%B %Y"),
+        "tolerance": tolerance,
+        "rows": rows,
+        "counts": counts,
+    }
+    prs = prs or new_presentation()
+    charts = ChartWriter(prs)
+    title_slide(blank(prs), report)
+    summary(blank(prs), report)
+
+    groups = {}
+    for r in rows:
+        groups.setdefault(r["group"], []).append(r)
+    for group, members in groups.items():
+        pages = _pages(members, BARS_PER_SLIDE)
+        for page, chunk in enumerate(pages, 1):
+            changes(blank(prs), report, group, chunk, page, len(pages), charts)
+
+    with_latency = [r for r in rows if r.get("latency_ms")]
+    pages = _pages(with_latency, LATENCY_PER_SLIDE) if with_latency else []
+    for page, chunk in enumerate(pages, 1):
+        latency(blank(prs), report, chunk, page, len(pages), charts)
+
+    with_rss = [r for r in rows if r.get("rss_mb")]
+    pages = _pages(with_rss, LINES_PER_SLIDE) if with_rss else []
+    for page, chunk in enumerate(pages, 1):
+        memory(blank(prs), report, chunk, page, len(pages), charts)
+
+    pages = _pages(rows, ROWS_PER_SLIDE)
+    for page, chunk in enumerate(pages, 1):
+        table(blank(prs), report, chunk, page, len(pages))
+
+    if output:
+        prs.save(output)
+    return prs, report
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Render benchmark results as a performance report deck")
+    parser.add_argument("results", help="Benchmark JSON (generic, or decks.bench --json output)")
+    parser.add_argument("--output", type=str, required=True, help="Output .pptx path")
+    parser.add_argument("--baseline", type=str, default=None, help="Baseline for decks.bench output")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE,
+                        help=f"Change that counts as a regression or improvement (default: {DEFAULT_TOLERANCE})")
+    parser.add_argument("--normalize", action="store_true",
+                        help="Scale decks.bench timings by the calibration workload (default: raw)")
+    args = parser.parse_args()
+
+    try:
+        results = load_results(args.results, args.baseline, args.normalize)
+    except ValueError as exc:
+        parser.error(str(exc))
+    Path(args.output).parent.mkdir(parents=True, exist_ok=True)
+    started = time.perf_counter()
+    prs, report = build_report(results, args.output, args.tolerance)
+    elapsed = time.perf_counter() - started
+    counts = report["counts"]
+    print(f"Presentation saved to: {args.output}")
+    print(f"{len(report['rows'])} benchmarks, {counts['regression']} regressions, {counts['improvement']} "
+          f"improvements: {len(prs.slides)} slides in {elapsed * 1000:.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
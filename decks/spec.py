@@ -0,0 +1,485 @@
+"""
+Declarative decks: a YAML/JSON slide spec compiled to a flat render plan.
+
+A spec lists slides; each slide has a title (or is a section divider) and a
+list of blocks. Blocks place components - tiles, numbered steps, flow nodes,
+layers with status badges, cards, badges - singly or in grids, and plain
+text. All lengths are in inches, "1.5pt" is points, colors are theme names
+(ACCENT_BLUE) or "#RRGGBB".
+
+    slides:
+      - title: What is Turumba Today?
+        subtitle: A working platform with 50+ API endpoints
+        blocks:
+          - grid: tile
+            at: [.5, 3.0]
+            size: [2.95, 1.9]
+            step: [3.15, 2.15]
+            columns: 4
+            items:
+              - {title: Accounts & Auth, desc: "Multi-tenant accounts, users,\\nroles", color: GREEN}
+
+Components are lists of primitives positioned relative to the component's
+box, with small expressions over its width and height (``w-.4``,
+``(w-.6)/2``) and ``{field}`` placeholders filled from the item; a spec can
+define its own under ``components:``. The compiler evaluates every
+expression, color and placeholder once, producing per slide a list of
+``(helper, args)`` calls, so rendering is a loop over prepared tuples.
+``$name`` placeholders are left in the plan and filled per deck by
+``render_plan(..., values)``, which is how one compiled plan stamps out a
+deck per tenant. Text elements and blocks with ``fit: true`` shrink their
+font at render time until the (substituted) text fits its box.
+
+decks/specs/overview_sample.yaml reproduces slides 2, 3, 6 and 8 of the
+overview deck shape for shape; ``--verify-overview`` checks that.
+
+Usage:
+    python -m decks.spec decks/specs/overview_sample.yaml --output build/sample.pptx
+    python -m decks.spec spec.yaml --values tenants.csv --output "build/tenants/{account}.pptx" --workers 8
+"""
+
+import argparse
+import ast
+import csv
+import json
+import multiprocessing
+import re
+import time
+from pathlib import Path
+from string import Template
+
+from pptx.dml.color import RGBColor
+from pptx.enum.text import PP_ALIGN
+from pptx.util import Inches, Pt
+
+from decks import theme
+from decks.helpers import blank, circle, ml, new_presentation, rect, rr, set_bg, txt
+
+PRIMITIVES = {"rr": rr, "rect": rect, "circle": circle, "txt": txt, "ml": ml, "bg": set_bg}
+ALIGN = {"left": PP_ALIGN.LEFT, "center": PP_ALIGN.CENTER, "right": PP_ALIGN.RIGHT}
+
+# Built-in components, drawn the way the overview deck draws them by hand.
+COMPONENTS = {
+    # slide 2 feature tiles
+    "tile": [
+        {"rr": [0, 0, "w", "h"], "fill": "SECTION_BG", "border": "color", "bw": "1.5pt"},
+        {"txt": "{title}", "box": [.2, .15, "w-.4", .3], "sz": 14, "clr": "color", "bold": True},
+        {"rect": [.2, .48, "w-.4", "1pt"], "fill": "color"},
+        {"txt": "{desc}", "box": [.2, .6, "w-.4", "h-.9"], "sz": 11, "clr": "LIGHT_GRAY"},
+    ],
+    # slide 6 numbered steps, arrows between columns
+    "step": [
+        {"rr": [0, 0, "w", "h"], "fill": "SECTION_BG", "border": "color", "bw": "1.5pt"},
+        {"circle": [.15, .15, .5], "fill": "color"},
+        {"txt": "{n}", "box": [.15, .18, .5, .45], "sz": 18, "clr": "WHITE", "bold": True, "align": "center"},
+        {"txt": "{title}", "box": [.8, .18, "w-1.1", .3], "sz": 14, "clr": "color", "bold": True},
+        {"txt": "{desc}", "box": [.8, .55, "w-1.1", "h-.8"], "sz": 11, "clr": "LIGHT_GRAY"},
+        {"txt": "▶", "box": ["w", .55, .3, .4], "sz": 16, "clr": "MED_GRAY", "when": "not_last_in_row"},
+    ],
+    # slide 8 flow nodes, centered, arrows between nodes
+    "node": [
+        {"rr": [0, 0, "w", "h"], "fill": "SECTION_BG", "border": "color", "bw": "1.5pt"},
+        {"circle": ["(w-.6)/2", .15, .55], "fill": "color"},
+        {"txt": "{n}", "box": ["(w-.6)/2", .18, .55, .5], "sz": 18, "clr": "WHITE", "bold": True, "align": "center"},
+        {"txt": "{title}", "box": [.15, .8, "w-.3", .3], "sz": 12, "clr": "color", "bold": True, "align": "center"},
+        {"txt": "{desc}", "box": [.15, 1.15, "w-.3", .8], "sz": 10, "clr": "LIGHT_GRAY", "align": "center"},
+        {"txt": "▶", "box": ["w", .75, .25, .35], "sz": 14, "clr": "MED_GRAY", "when": "not_last_in_row"},
+    ],
+    # slide 3 layer bars with a status badge
+    "layer": [
+        {"rr": [0, 0, "w", "h"], "fill": "SECTION_BG", "border": "color", "bw": "2pt"},
+        {"txt": "{title}", "box": [.3, .12, 4, .3], "sz": 15, "clr": "color", "bold": True},
+        {"txt": "{desc}", "box": [.3, .45, 7, .7], "sz": 11, "clr": "LIGHT_GRAY"},
+        {"rr": ["w-2", .15, 1.7, .28], "fill": "badge_color"},
+        {"txt": "{badge}", "box": ["w-2", .15, 1.7, .28], "sz": 10, "clr": "WHITE", "bold": True, "align": "center"},
+    ],
+    "badge": [
+        {"rr": [0, 0, "w", "h"], "fill": "color"},
+        {"txt": "{text}", "box": [0, 0, "w", "h"], "sz": "sz", "clr": "WHITE", "bold": True, "align": "center"},
+    ],
+    # helpers.card
+    "card": [
+        {"rr": [0, 0, "w", "h"], "fill": "SECTION_BG", "border": "color", "bw": "1.5pt"},
+        {"txt": "{title}", "box": [.2, .12, "w-.4", .35], "sz": "tsz", "clr": "color", "bold": True},
+        {"rect": [.2, .48, "w-.4", "1.5pt"], "fill": "color"},
+        {"ml": "items", "box": [.2, .58, "w-.4", "h-.7"], "sz": "isz", "bullet": True, "sp": 1.35, "when": "items"},
+    ],
+}
+DEFAULTS = {"sz": 10, "tsz": 15, "isz": 12, "color": "ACCENT_BLUE"}
+GRID_ALIASES = {"flow": "node", "steps": "step", "layers": "layer", "tiles": "tile"}
+
+
+class SpecError(ValueError):
+    """The spec is malformed; the message says where."""
+
+
+# ── Values ──
+
+def color(value):
+    if isinstance(value, RGBColor):
+        return value
+    if isinstance(value, str) and value.startswith("#"):
+        return RGBColor.from_string(value[1:])
+    try:
+        return getattr(theme, value)
+    except (AttributeError, TypeError):
+        raise SpecError(f"unknown color {value!r}") from None
+
+
+_PT = re.compile(r"(\d*\.?\d+)pt\b")
+_exprs = {}
+
+
+def length(value, env) -> int:
+    """EMU for an inch literal, "Npt", or an expression over ``env`` lengths (w, h).
+
+    Literals convert to EMU one at a time, as ``x + Inches(.2)`` does in the
+    hand-written slides, so compiled geometry matches theirs to the unit.
+    """
+    if isinstance(value, (int, float)):
+        return Inches(value)
+    tree = _exprs.get(value)
+    if tree is None:
+        tree = _exprs[value] = ast.parse(_PT.sub(r"pt(\1)", value), mode="eval").body
+    return _length(tree, env)
+
+
+def _length(node, env) -> int:
+    if isinstance(node, ast.Constant):
+        return Inches(node.value)
+    if isinstance(node, ast.Name):
+        return env[node.id]
+    if isinstance(node, ast.Call) and getattr(node.func, "id", None) == "pt":
+        return Pt(node.args[0].value)
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.USub):
+        return -_length(node.operand, env)
+    if isinstance(node, ast.BinOp):
+        if isinstance(node.op, ast.Add):
+            return _length(node.left, env) + _length(node.right, env)
+        if isinstance(node.op, ast.Sub):
+            return _length(node.left, env) - _length(node.right, env)
+        if isinstance(node.op, (ast.Mult, ast.Div)) and isinstance(node.right, ast.Constant):
+            left = _length(node.left, env)
+            return int(left * node.right.value if isinstance(node.op, ast.Mult) else left / node.right.value)
+    raise SpecError(f"unsupported length expression: {ast.unparse(node)}")
+
+
+def _scalar(value, item):
+    return item[value] if isinstance(value, str) and value in item else value
+
+
+def _text(template: str, item) -> str:
+    try:
+        return template.format_map(item)
+    except KeyError as exc:
+        raise SpecError(f"placeholder {exc} not in item {item}") from None
+
+
+def _lines(lines, item):
+    out = []
+    for line in lines:
+        if isinstance(line, str):
+            out.append(line)
+        else:
+            line = list(line)
+            if len(line) > 2:
+                line[2] = color(_scalar(line[2], item))
+            out.append(tuple(line))
+    return out
+
+
+# ── Compiler ──
+
+def _component_ops(elements, x, y, w, h, item, ops):
+    env = {"w": w, "h": h}
+    for el in elements:
+        when = el.get("when")
+        if when == "not_last_in_row" and item["last_in_row"]:
+            continue
+        if when and when != "not_last_in_row" and not item.get(when):
+            continue
+        if "rr" in el or "rect" in el:
+            kind = "rr" if "rr" in el else "rect"
+            l, t, bw, bh = (length(v, env) for v in el[kind])
+            border = color(_scalar(el["border"], item)) if el.get("border") else None
+            bwidth = length(el["bw"], env) if el.get("bw") else None
+            ops.append((PRIMITIVES[kind], (x + l, y + t, bw, bh, color(_scalar(el["fill"], item)), border, bwidth)))
+        elif "circle" in el:
+            l, t, size = (length(v, env) for v in el["circle"])
+            ops.append((circle, (x + l, y + t, size, color(_scalar(el["fill"], item)))))
+        elif "txt" in el:
+            l, t, bw, bh = (length(v, env) for v in el["box"])
+            ops.append((txt, (
+                _text(el["txt"], item), x + l, y + t, bw, bh,
+                _scalar(el.get("sz", 18), item), color(_scalar(el.get("clr", "WHITE"), item)),
+                bool(_scalar(el.get("bold", False), item)), ALIGN[el.get("align", "left")],
+                el.get("font", "Calibri"), el.get("fit", False),
+            )))
+        elif "ml" in el:
+            l, t, bw, bh = (length(v, env) for v in el["box"])
+            ops.append((ml, (
+                _lines(item[el["ml"]], item), x + l, y + t, bw, bh,
+                _scalar(el.get("sz", 14), item), color(_scalar(el.get("clr", "WHITE"), item)),
+                el.get("sp", 1.4), el.get("bullet", False), el.get("font", "Calibri"),
+                el.get("fit", False),
+            )))
+        else:
+            raise SpecError(f"unknown component element {el}")
+
+
+def _item(block: dict, fields: dict, lookups: dict) -> dict:
+    item = {**DEFAULTS, **block.get("params", {}), **fields}
+    for name, (source, table, *default) in lookups.items():
+        item[name] = table.get(item.get(source), default[0] if default else None)
+    return item
+
+
+def _grid_ops(block, components, ops):
+    kind = block.get("grid") or GRID_ALIASES[block["type"]]
+    elements = components[kind]
+    items = block["items"]
+    columns = block.get("columns", 1 if kind == "layer" else len(items))
+    x0, y0 = block["at"]
+    w, h = (Inches(v) for v in block["size"])
+    dx, dy = block.get("step", [0, 0])
+    lookups = block.get("lookup", {})
+    for i, fields in enumerate(items):
+        col, row = i % columns, i // columns
+        x = Inches(fields["x"]) if "x" in fields else Inches(x0) + Inches(col * dx)
+        y = Inches(fields["y"]) if "y" in fields else Inches(y0) + Inches(row * dy)
+        item = _item(block, fields, lookups)
+        item.setdefault("n", i + 1)
+        item["last_in_row"] = col == columns - 1 or i == len(items) - 1
+        _component_ops(elements, x, y, w, h, item, ops)
+
+
+def _block_ops(block, components, ops):
+    kind = block.get("type") or ("grid" if "grid" in block else None)
+    if kind in ("grid", *GRID_ALIASES):
+        _grid_ops(block, components, ops)
+    elif kind == "text":
+        x, y = block["at"]
+        w, h = block["size"]
+        ops.append((txt, (
+            block["text"], Inches(x), Inches(y), Inches(w), Inches(h), block.get("sz", 18),
+            color(block.get("color", "WHITE")), block.get("bold", False), ALIGN[block.get("align", "left")],
+            block.get("font", "Calibri"), block.get("fit", False),
+        )))
+    elif kind == "lines":
+        x, y = block["at"]
+        w, h = block["size"]
+        ops.append((ml, (
+            _lines(block["lines"], {}), Inches(x), Inches(y), Inches(w), Inches(h), block.get("sz", 14),
+            color(block.get("color", "WHITE")), block.get("sp", 1.4), block.get("bullet", False),
+            block.get("font", "Calibri"), block.get("fit", False),
+        )))
+    elif kind in components:
+        x, y = block["at"]
+        w, h = block["size"]
+        fields = {k: v for k, v in block.items() if k not in ("type", "at", "size", "params", "lookup")}
+        item = _item(block, fields, block.get("lookup", {}))
+        item.setdefault("last_in_row", True)
+        _component_ops(components[kind], Inches(x), Inches(y), Inches(w), Inches(h), item, ops)
+    else:
+        raise SpecError(f"unknown block type {kind!r}")
+
+
+def _slide_ops(slide, components) -> list:
+    ops = []
+    background = color(slide.get("background", "DARK_BG"))
+    if "section" in slide:
+        sec = slide["section"]
+        num = sec["num"]
+        ops += [
+            (set_bg, (background,)),
+            (rect, (Inches(0), Inches(3.2), Inches(13.333), Inches(1.1), theme.SECTION_BG, None, None)),
+            (rect, (Inches(0), Inches(3.2), Inches(.15), Inches(1.1), theme.ACCENT_BLUE, None, None)),
+            (txt, (f"0{num}" if num < 10 else str(num), Inches(.6), Inches(2.2), Inches(2), Inches(.8),
+                   48, theme.ACCENT_BLUE, True, PP_ALIGN.LEFT, "Calibri Light")),
+            (txt, (sec["title"], Inches(.6), Inches(3.25), Inches(12), Inches(.7),
+                   36, theme.WHITE, True, PP_ALIGN.LEFT, "Calibri Light")),
+        ]
+        if sec.get("subtitle"):
+            ops.append((txt, (sec["subtitle"], Inches(.6), Inches(4.4), Inches(10), Inches(.5),
+                              18, theme.MED_GRAY, False, PP_ALIGN.LEFT, "Calibri")))
+    elif "title" in slide:
+        ops += [
+            (set_bg, (background,)),
+            (rect, (Inches(.6), Inches(.5), Inches(1.5), Pt(3), theme.ACCENT_BLUE, None, None)),
+            (txt, (slide["title"], Inches(.6), Inches(.6), Inches(11), Inches(.6),
+                   30, theme.WHITE, True, PP_ALIGN.LEFT, "Calibri Light")),
+        ]
+        if slide.get("subtitle"):
+            ops.append((txt, (slide["subtitle"], Inches(.6), Inches(1.15), Inches(11), Inches(.4),
+                              16, theme.MED_GRAY, False, PP_ALIGN.LEFT, "Calibri")))
+    else:
+        ops.append((set_bg, (background,)))
+    for i, block in enumerate(slide.get("blocks", [])):
+        try:
+            _block_ops(block, components, ops)
+        except (KeyError, TypeError, ValueError) as exc:
+            if isinstance(exc, SpecError):
+                raise SpecError(f"block {i + 1}: {exc}") from None
+            raise SpecError(f"block {i + 1}: missing or malformed {exc}") from None
+    return ops
+
+
+class Plan:
+    """Compiled slides: per slide, a list of ``(helper, args)`` calls.
+
+    ``dynamic`` lists the ``(slide, op)`` positions whose text holds ``$name``
+    placeholders, so per-deck values touch only those calls.
+    """
+
+    __slots__ = ("slides", "dynamic")
+
+    def __init__(self, slides):
+        self.slides = slides
+        self.dynamic = [
+            (i, j) for i, ops in enumerate(slides) for j, (fn, args) in enumerate(ops)
+            if fn in (txt, ml) and "$" in repr(args[0])
+        ]
+
+    def ops(self) -> int:
+        return sum(map(len, self.slides))
+
+
+def compile_spec(spec: dict) -> Plan:
+    components = {**COMPONENTS, **spec.get("components", {})}
+    slides = []
+    for i, slide in enumerate(spec.get("slides", [])):
+        try:
+            slides.append(_slide_ops(slide, components))
+        except SpecError as exc:
+            raise SpecError(f"slide {i + 1}: {exc}") from None
+    return Plan(slides)
+
+
+def load_spec(path) -> dict:
+    text = Path(path).read_text(encoding="utf-8")
+    if str(path).endswith((".yaml", ".yml")):
+        import yaml  # PyYAML, only needed for YAML specs
+
+        return yaml.safe_load(text)
+    return json.loads(text)
+
+
+# ── Rendering ──
+
+def _substitute(args, values):
+    text = args[0]
+    if isinstance(text, str):
+        text = Template(text).safe_substitute(values)
+    else:
+        text = [Template(t).safe_substitute(values) if isinstance(t, str)
+                else (Template(t[0]).safe_substitute(values), *t[1:]) for t in text]
+    return (text, *args[1:])
+
+
+def render_plan(plan: Plan, output=None, values=None, prs=None):
+    """Draw every slide of ``plan``; ``values`` fill ``$name`` placeholders."""
+    prs = prs or new_presentation()
+    dynamic = {}
+    if values and plan.dynamic:
+        for i, j in plan.dynamic:
+            dynamic.setdefault(i, {})[j] = _substitute(plan.slides[i][j][1], values)
+    for i, ops in enumerate(plan.slides):
+        slide = blank(prs)
+        overrides = dynamic.get(i)
+        if overrides is None:
+            for fn, args in ops:
+                fn(slide, *args)
+        else:
+            for j, (fn, args) in enumerate(ops):
+                fn(slide, *overrides.get(j, args))
+    if output:
+        prs.save(output)
+    return prs
+
+
+_worker_plan = None
+
+
+def _init_worker(plan: Plan) -> None:
+    global _worker_plan
+    _worker_plan = plan
+    new_presentation()
+
+
+def _stamp(job) -> str:
+    output, values = job
+    Path(output).parent.mkdir(parents=True, exist_ok=True)
+    render_plan(_worker_plan, output, values)
+    return output
+
+
+def stamp_decks(plan: Plan, jobs, workers: int) -> int:
+    """Render ``plan`` once per ``(output, values)`` job across ``workers`` processes."""
+    jobs = list(jobs)
+    if workers <= 1:
+        _init_worker(plan)
+        return sum(1 for _ in map(_stamp, jobs))
+    with multiprocessing.Pool(workers, initializer=_init_worker, initargs=(plan,)) as pool:
+        return sum(1 for _ in pool.imap_unordered(_stamp, jobs, chunksize=max(1, len(jobs) // (workers * 8))))
+
+
+def verify_overview(plan: Plan) -> bool:
+    """Compare the sample spec's slides with the hand-written overview slides 2, 3, 6 and 8."""
+    from lxml import etree
+
+    from decks import overview
+
+    expected = [overview.what_is_turumba_today, overview.how_turumba_evolves,
+                overview.how_it_all_works_together, overview.turumba_gateway]
+    prs = new_presentation()
+    for build in expected:
+        build(blank(prs))
+    ok = True
+    for build, mine, theirs in zip(expected, render_plan(plan).slides, prs.slides):
+        same = etree.tostring(mine._element) == etree.tostring(theirs._element)
+        ok &= same
+        print(f"  {build.__name__:<28} {'identical' if same else 'DIFFERENT'}")
+    return ok
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compile a YAML/JSON deck spec and render it")
+    parser.add_argument("spec", help="Spec file (.yaml, .yml or .json)")
+    parser.add_argument("--output", type=str, required=True,
+                        help="Output .pptx path; with --values, a pattern like build/{account}.pptx")
+    parser.add_argument("--values", type=str, default=None, help="CSV with one row of $placeholder values per deck")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=multiprocessing.cpu_count(),
+        help="Worker processes for --values (default: CPU count)",
+    )
+    parser.add_argument("--verify-overview", action="store_true",
+                        help="Check the spec against overview slides 2, 3, 6 and 8")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    try:
+        plan = compile_spec(load_spec(args.spec))
+    except SpecError as exc:
+        parser.error(f"{args.spec}: {exc}")
+    compiled = time.perf_counter()
+    print(f"Compiled {len(plan.slides)} slides into {plan.ops()} calls in {(compiled - started) * 1000:.1f} ms")
+
+    if args.values:
+        with open(args.values, newline="", encoding="utf-8") as f:
+            jobs = [(args.output.format_map(row), row) for row in csv.DictReader(f)]
+        count = stamp_decks(plan, jobs, args.workers)
+        seconds = time.perf_counter() - compiled
+        print(f"Rendered {count} decks in {seconds:.2f}s ({count / seconds:.1f} decks/sec)")
+    else:
+        Path(args.output).parent.mkdir(parents=True, exist_ok=True)
+        render_plan(plan, args.output)
+        print(f"Presentation saved to: {args.output} in {(time.perf_counter() - compiled) * 1000:.0f} ms")
+
+    if args.verify_overview and not verify_overview(plan):
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,189 @@
+"""
+Stream slides straight into the .pptx zip as they are finished.
+
+``prs.save()`` serializes the whole package at the end, so every slide's XML
+tree stays alive until then. StreamingDeck writes each slide into the zip as
+soon as the next one is started (or on ``flush()``), then drops its XML tree
+and those of the parts it owns (charts, notes), keeping only the part object
+so the presentation's slide list and relationships stay intact. Shared parts
+(layouts, masters, theme) and media, which python-pptx deduplicates by hash,
+stay in memory; everything not yet written goes out on ``close()``.
+
+Slides are created without python-pptx's per-slide scans of the whole package
+(next part name, next slide ID), so adding a slide costs the same at slide
+10,000 as at slide 10. The result is part-for-part identical to ``prs.save()``
+of the same build; only the zip member order differs.
+
+    with StreamingDeck("build/report.pptx") as deck:
+        for row in rows:
+            s = deck.add_slide()
+            stitle(s, row.title)
+            ...
+
+Usage:
+    python -m decks.streaming agentic --repeat 200 --output build/agentic_x200.pptx
+"""
+
+import argparse
+import os
+import resource
+import tempfile
+import time
+import zipfile
+from pathlib import Path
+
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+from pptx.opc.package import XmlPart
+from pptx.opc.packuri import PACKAGE_URI, PackURI
+from pptx.opc.serialized import _ContentTypesItem
+from pptx.opc.oxml import serialize_part_xml
+from pptx.parts.slide import SlidePart
+
+from decks.helpers import blank, new_presentation
+from decks.incremental import DECKS, as_spec
+
+SHARED_RELTYPES = {RT.SLIDE_LAYOUT, RT.SLIDE_MASTER, RT.NOTES_MASTER, RT.THEME}
+
+
+class StreamingDeck:
+    """A presentation whose finished slides are written to ``output`` one at a time."""
+
+    def __init__(self, output, prs=None, layout_index=6, compresslevel=None):
+        self.output = Path(output)
+        self.prs = prs or new_presentation()
+        self._layout_part = self.prs.slide_layouts[layout_index].part
+        self._package = self.prs.part.package
+        self._sldIdLst = self.prs.slides._sldIdLst
+        self._written = set()
+        self._pending = None
+        first = self._package.next_partname("/ppt/slides/slide%d.xml")
+        self._next_partno = int(first.idx)
+        self._next_slide_id = max([255] + [int(s.get("id")) for s in self._sldIdLst]) + 1
+        self.slides_written = 0
+
+        fd, self._tmp = tempfile.mkstemp(dir=self.output.parent, suffix=".pptx.tmp")
+        os.close(fd)
+        self._zip = zipfile.ZipFile(
+            self._tmp, "w", compression=zipfile.ZIP_DEFLATED, compresslevel=compresslevel, strict_timestamps=False
+        )
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+    def add_slide(self):
+        """Flush the previous slide and return a new blank one on the deck's layout."""
+        self.flush()
+        partname = PackURI(f"/ppt/slides/slide{self._next_partno}.xml")
+        self._next_partno += 1
+        slide_part = SlidePart.new(partname, self._package, self._layout_part)
+        rId = self.prs.part.rels._add_relationship(RT.SLIDE, slide_part)
+        self._sldIdLst._add_sldId(id=self._next_slide_id, rId=rId)
+        self._next_slide_id += 1
+        self._pending = slide_part
+        return slide_part.slide
+
+    def render(self, spec):
+        """Add a slide and draw a slide function or SlideSpec on it."""
+        slide = self.add_slide()
+        as_spec(spec).render(slide)
+        return slide
+
+    def flush(self) -> None:
+        """Write the current slide (and the parts it owns) and release their XML."""
+        if self._pending is not None:
+            self._write_part(self._pending)
+            self._pending = None
+            self.slides_written += 1
+
+    def _write_part(self, part) -> None:
+        self._written.add(part.partname)
+        self._zip.writestr(part.partname.membername, part.blob)
+        if part.rels:
+            self._zip.writestr(part.partname.rels_uri.membername, part.rels.xml)
+        for rel in part.rels.values():
+            if rel.is_external or rel.reltype in SHARED_RELTYPES or rel.target_part.partname in self._written:
+                continue
+            self._write_part(rel.target_part)
+        if _keep_loaded(part):
+            return
+        if isinstance(part, XmlPart):
+            part._element = None
+            part.__dict__.pop("slide", None)
+            part.__dict__.pop("chart", None)
+        else:
+            part._blob = None
+
+    def close(self) -> None:
+        """Write the remaining parts, presentation and content types, then move the file into place."""
+        self.flush()
+        parts = tuple(self._package.iter_parts())
+        for part in parts:
+            if part.partname in self._written:
+                continue
+            self._zip.writestr(part.partname.membername, part.blob)
+            if part.rels:
+                self._zip.writestr(part.partname.rels_uri.membername, part.rels.xml)
+        self._zip.writestr(PACKAGE_URI.rels_uri.membername, self._package._rels.xml)
+        self._zip.writestr("[Content_Types].xml", serialize_part_xml(_ContentTypesItem.xml_for(parts)))
+        self._zip.close()
+        os.replace(self._tmp, self.output)
+
+    def abort(self) -> None:
+        self._zip.close()
+        Path(self._tmp).unlink(missing_ok=True)
+
+
+def _keep_loaded(part) -> bool:
+    """Media parts stay loaded so python-pptx can keep deduplicating them by hash."""
+    return part.content_type.startswith(("image/", "video/", "audio/"))
+
+
+def build_streaming(slides, output, prs=None, compresslevel=None):
+    """Stream ``slides`` (functions or SlideSpecs) into ``output``; return the slide count."""
+    with StreamingDeck(output, prs, compresslevel=compresslevel) as deck:
+        for spec in slides:
+            deck.render(spec)
+    return deck.slides_written
+
+
+def build_in_memory(slides, output, prs=None):
+    prs = prs or new_presentation()
+    for spec in map(as_spec, slides):
+        spec.render(blank(prs))
+    prs.save(output)
+    return len(prs.slides)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Build a deck by streaming each slide into the zip")
+    parser.add_argument("deck", choices=sorted(DECKS), help="Deck to build")
+    parser.add_argument("--output", type=str, required=True, help="Output .pptx path")
+    parser.add_argument("--repeat", type=int, default=1, help="Repeat the deck's slides N times")
+    parser.add_argument(
+        "--in-memory",
+        action="store_true",
+        help="Build with a regular prs.save() instead, to compare peak memory (run each mode in its own process)",
+    )
+    args = parser.parse_args()
+
+    slides = list(DECKS[args.deck]) * args.repeat
+    Path(args.output).parent.mkdir(parents=True, exist_ok=True)
+    build = build_in_memory if args.in_memory else build_streaming
+    started = time.perf_counter()
+    count = build(slides, args.output)
+    seconds = time.perf_counter() - started
+    peak_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024  # KiB on Linux
+
+    print(f"Presentation saved to: {args.output}")
+    print(f"{'In memory' if args.in_memory else 'Streaming'}: {count} slides in {seconds:.2f}s, "
+          f"peak RSS {peak_mb:.0f} MB")
+
+
+if __name__ == "__main__":
+    main()
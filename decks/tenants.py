@@ -0,0 +1,494 @@
+"""
+Monthly contact-base report decks, one per tenant, from a persons CSV.
+
+The dataset is read once, in large blocks cut at record boundaries, and each
+block is aggregated per tenant by a worker process: contacts, active
+contacts and joins per subscription tier, joins per month and contacts per
+country. Partial results are merged as they come back, with only a few
+blocks in flight at a time, so memory holds the per-tenant totals and not
+the dataset. Rows that joined after the report month are left out.
+
+Each tenant then gets a deck in the overview deck's style - title slide,
+at-a-glance figures, tier mix, activity, growth and countries - with native
+(editable) pptx charts. Decks are rendered and saved by a second pool of
+workers, fed a bounded window of tenants at a time; nothing but a short
+summary comes back per deck.
+
+Tenants are the values of ``--tenant-field`` (``company`` by default), or,
+with ``--tenants N``, N synthetic tenants assigned by a stable hash of each
+row's email, for datasets without a tenant column.
+
+Usage:
+    python -m decks.tenants scripts/sample_persons.csv --output build/tenants
+    python -m decks.tenants persons.csv --output build/tenants --tenants 10000 --month 2026-09 --workers 8
+"""
+
+import argparse
+import calendar
+import csv
+import hashlib
+import io
+import multiprocessing
+import re
+import time
+import zlib
+from collections import Counter, deque
+from datetime import date
+from pathlib import Path
+
+from pptx.chart.data import CategoryChartData
+from pptx.enum.chart import XL_CHART_TYPE, XL_LEGEND_POSITION
+from pptx.enum.text import PP_ALIGN
+from pptx.util import Inches, Pt
+
+from decks.helpers import blank, card, ml, new_presentation, rect, rr, set_bg, stitle, txt
+from decks.theme import (
+    ACCENT_BLUE, ACCENT_TEAL, DARK_CARD, GREEN, LIGHT_GRAY, MED_GRAY, ORANGE, PURPLE, SECTION_BG, WHITE,
+)
+
+TIERS = ("free", "basic", "pro", "enterprise")
+TIER_COLORS = (MED_GRAY, ACCENT_TEAL, ACCENT_BLUE, PURPLE)
+BLOCK_SIZE = 4 << 20            # bytes of CSV per aggregation task
+GROWTH_MONTHS = 24
+TOP_COUNTRIES = 10
+
+
+# ── Aggregation ──
+
+class TenantStats:
+    """Counts for one tenant; ``merge`` adds another partial result for the same tenant."""
+
+    __slots__ = ("contacts", "active", "tiers", "active_tiers", "months", "countries")
+
+    def __init__(self):
+        self.contacts = 0
+        self.active = 0
+        self.tiers = [0] * len(TIERS)
+        self.active_tiers = [0] * len(TIERS)
+        self.months = Counter()
+        self.countries = Counter()
+
+    def merge(self, other: "TenantStats") -> None:
+        self.contacts += other.contacts
+        self.active += other.active
+        self.tiers = [a + b for a, b in zip(self.tiers, other.tiers)]
+        self.active_tiers = [a + b for a, b in zip(self.active_tiers, other.active_tiers)]
+        self.months.update(other.months)
+        self.countries.update(other.countries)
+
+    def __getstate__(self):
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def __setstate__(self, state):
+        for name, value in zip(self.__slots__, state):
+            setattr(self, name, value)
+
+
+def _record_end(block: bytes) -> int:
+    """Offset just past the last complete CSV record in ``block`` (0 if there is none)."""
+    end = block.rfind(b"\n")
+    while end >= 0 and block.count(b'"', 0, end) % 2:
+        end = block.rfind(b"\n", 0, end)  # that newline is inside a quoted field
+    return end + 1
+
+
+def read_blocks(path, block_size=BLOCK_SIZE):
+    """Yield the header line, then blocks of whole records."""
+    with open(path, "rb") as f:
+        yield f.readline()
+        rest = b""
+        while True:
+            chunk = f.read(block_size)
+            if not chunk:
+                break
+            block = rest + chunk
+            end = _record_end(block)
+            if end == 0:
+                rest = block
+                continue
+            yield block[:end]
+            rest = block[end:]
+        if rest.strip():
+            yield rest
+
+
+def _tenant_of(tenants: int):
+    if not tenants:
+        return None
+    width = len(str(tenants))
+    names = [f"Tenant {i + 1:0{width}d}" for i in range(tenants)]
+    return lambda email: names[zlib.crc32(email.encode()) % tenants]
+
+
+def aggregate_block(job) -> dict:
+    """Per-tenant stats for one block of CSV records."""
+    block, columns, tenant_field, tenants, cutoff = job
+    tenant_col = columns[tenant_field] if not tenants else columns["email"]
+    tier_col, active_col = columns["subscription_tier"], columns["is_active"]
+    joined_col, country_col = columns["joined_date"], columns["country"]
+    bucket = _tenant_of(tenants)
+    tier_index = {tier: i for i, tier in enumerate(TIERS)}
+    stats = {}
+    for row in csv.reader(io.StringIO(block.decode("utf-8"))):
+        if not row:
+            continue
+        joined = row[joined_col]
+        if joined > cutoff:
+            continue
+        key = row[tenant_col] if bucket is None else bucket(row[tenant_col])
+        s = stats.get(key)
+        if s is None:
+            s = stats[key] = TenantStats()
+        tier = tier_index.get(row[tier_col])
+        active = row[active_col] == "true"
+        s.contacts += 1
+        s.active += active
+        if tier is not None:
+            s.tiers[tier] += 1
+            s.active_tiers[tier] += active
+        s.months[joined[:7]] += 1
+        s.countries[row[country_col]] += 1
+    return stats
+
+
+def _windowed(pool, fn, jobs, window):
+    """``pool.imap`` with at most ``window`` jobs submitted and not yet collected."""
+    pending = deque()
+    for job in jobs:
+        pending.append(pool.apply_async(fn, (job,)))
+        if len(pending) >= window:
+            yield pending.popleft().get()
+    while pending:
+        yield pending.popleft().get()
+
+
+def aggregate(path, month: str, workers: int, tenant_field="company", tenants=0, block_size=BLOCK_SIZE) -> dict:
+    """Stream ``path`` once and return ``{tenant: TenantStats}`` for contacts joined by the end of ``month``."""
+    blocks = read_blocks(path, block_size)
+    header = next(csv.reader([next(blocks).decode("utf-8")]))
+    columns = {name: i for i, name in enumerate(header)}
+    needed = ["subscription_tier", "is_active", "joined_date", "country", "email" if tenants else tenant_field]
+    missing = [name for name in needed if name not in columns]
+    if missing:
+        raise ValueError(f"{path} has no column(s) {', '.join(missing)}")
+    cutoff = month_end(month).isoformat()
+    jobs = ((block, columns, tenant_field, tenants, cutoff) for block in blocks)
+
+    totals = {}
+    if workers <= 1:
+        _merge_into(totals, map(aggregate_block, jobs))
+        return totals
+    with multiprocessing.Pool(workers) as pool:
+        _merge_into(totals, _windowed(pool, aggregate_block, jobs, workers * 2))
+    return totals
+
+
+def _merge_into(totals: dict, partials) -> None:
+    for partial in partials:
+        for tenant, s in partial.items():
+            mine = totals.get(tenant)
+            if mine is None:
+                totals[tenant] = s
+            else:
+                mine.merge(s)
+
+
+def month_end(month: str) -> date:
+    year, mon = map(int, month.split("-"))
+    return date(year, mon, calendar.monthrange(year, mon)[1])
+
+
+def _months_back(month: str, count: int) -> list[str]:
+    year, mon = map(int, month.split("-"))
+    out = []
+    for _ in range(count):
+        out.append(f"{year:04d}-{mon:02d}")
+        year, mon = (year, mon - 1) if mon > 1 else (year - 1, 12)
+    return out[::-1]
+
+
+# ── Slides ──
+
+def _chart(s, kind, data, l, t, w, h, colors, legend=False, labels=False):
+    chart = s.shapes.add_chart(kind, l, t, w, h, data).chart
+    chart.font.size = Pt(11)
+    chart.font.color.rgb = LIGHT_GRAY
+    chart.has_legend = legend
+    if legend:
+        chart.legend.position = XL_LEGEND_POSITION.BOTTOM
+        chart.legend.include_in_layout = False
+    plot = chart.plots[0]
+    if kind == XL_CHART_TYPE.DOUGHNUT:
+        for point, color in zip(plot.series[0].points, colors):
+            point.format.fill.solid()
+            point.format.fill.fore_color.rgb = color
+            point.format.line.color.rgb = SECTION_BG
+    else:
+        for axis in (chart.category_axis, chart.value_axis):
+            axis.format.line.color.rgb = DARK_CARD
+            axis.has_major_gridlines = axis is chart.value_axis
+        chart.value_axis.major_gridlines.format.line.color.rgb = DARK_CARD
+        for series, color in zip(plot.series, colors):
+            if kind == XL_CHART_TYPE.LINE:
+                series.format.line.color.rgb = color
+                series.format.line.width = Pt(2.5)
+                series.smooth = False
+            else:
+                series.format.fill.solid()
+                series.format.fill.fore_color.rgb = color
+    if labels:
+        plot.has_data_labels = True
+        plot.data_labels.font.size = Pt(10)
+        plot.data_labels.font.color.rgb = WHITE
+    return chart
+
+
+def _pct(part, whole) -> str:
+    return f"{part / whole:.0%}" if whole else "-"
+
+
+def title_slide(s, report):
+    set_bg(s)
+    rect(s, Inches(0), Inches(0), Inches(.15), Inches(7.5), ACCENT_BLUE)
+    rect(s, Inches(0), Inches(4.4), Inches(13.333), Pt(2), DARK_CARD)
+
+    txt(s, report["tenant"], Inches(1), Inches(1.5), Inches(11), Inches(1.2),
+        sz=54, clr=WHITE, bold=True, font="Calibri Light", fit=True)
+    txt(s, "Contact Base Report", Inches(1), Inches(2.7), Inches(11), Inches(.6),
+        sz=28, clr=ACCENT_TEAL, font="Calibri Light")
+    txt(s, f"{report['contacts']:,} contacts across {len(report['countries'])} countries",
+        Inches(1), Inches(4.7), Inches(8), Inches(.5), sz=20, clr=LIGHT_GRAY)
+    txt(s, "Tier Mix  |  Activity  |  Growth  |  Countries",
+        Inches(1), Inches(6.2), Inches(10), Inches(.4), sz=14, clr=MED_GRAY)
+    txt(s, report["month_name"], Inches(10), Inches(6.5), Inches(2.5), Inches(.3),
+        sz=14, clr=MED_GRAY, align=PP_ALIGN.RIGHT)
+
+
+def at_a_glance(s, report):
+    stitle(s, "At a Glance", f"{report['tenant']}  |  as of {report['as_of']}")
+
+    contacts, new, previous = report["contacts"], report["new"], report["new_previous"]
+    change = f"{new - previous:+,} vs previous month" if previous or new else "no joins yet"
+    figures = [
+        ("Contacts", f"{contacts:,}", "total, all tiers", ACCENT_BLUE),
+        ("Active", _pct(report["active"], contacts), f"{report['active']:,} active contacts", GREEN),
+        (f"New in {report['month_short']}", f"{new:,}", change, ACCENT_TEAL),
+        ("Countries", f"{len(report['countries']):,}", f"top: {report['top_country']}", ORANGE),
+    ]
+    for i, (label, value, note, color) in enumerate(figures):
+        x = Inches(.5) + Inches(i * 3.15)
+        rr(s, x, Inches(1.9), Inches(2.95), Inches(2.1), SECTION_BG, color, Pt(1.5))
+        txt(s, label, x + Inches(.2), Inches(2.05), Inches(2.55), Inches(.3), sz=14, clr=color, bold=True)
+        rect(s, x + Inches(.2), Inches(2.38), Inches(2.55), Pt(1), color)
+        txt(s, value, x + Inches(.2), Inches(2.5), Inches(2.55), Inches(.9),
+            sz=40, clr=WHITE, bold=True, font="Calibri Light", fit=True)
+        txt(s, note, x + Inches(.2), Inches(3.4), Inches(2.55), Inches(.4), sz=11, clr=LIGHT_GRAY, fit=True)
+
+    top_tier = max(range(len(TIERS)), key=lambda i: report["tiers"][i])
+    card(s, Inches(.5), Inches(4.3), Inches(12.3), Inches(2.6), "Highlights", [
+        f"{TIERS[top_tier].title()} is the largest tier with {report['tiers'][top_tier]:,} contacts "
+        f"({_pct(report['tiers'][top_tier], contacts)})",
+        f"{report['growth_12']:,} contacts joined in the last 12 months",
+        f"{report['top_country']} is the largest country with {report['countries'][0][1]:,} contacts",
+        f"{_pct(report['active'], contacts)} of contacts are active",
+    ], accent=ACCENT_BLUE, isz=14, fit=True)
+
+
+def tier_mix(s, report):
+    stitle(s, "Tier Mix", "Contacts by subscription tier")
+
+    data = CategoryChartData()
+    data.categories = [t.title() for t in TIERS]
+    data.add_series("Contacts", report["tiers"])
+    _chart(s, XL_CHART_TYPE.DOUGHNUT, data, Inches(.5), Inches(1.7), Inches(6.2), Inches(5.3),
+           TIER_COLORS, legend=True, labels=True)
+
+    items = [(f"{tier.title()}: {count:,} ({_pct(count, report['contacts'])})", False, color)
+             for tier, count, color in zip(TIERS, report["tiers"], (LIGHT_GRAY, ACCENT_TEAL, ACCENT_BLUE, PURPLE))]
+    paid = sum(report["tiers"][1:])
+    items.append((f"Paid tiers: {paid:,} ({_pct(paid, report['contacts'])})", True, WHITE))
+    card(s, Inches(7.2), Inches(1.9), Inches(5.6), Inches(4.6), "Breakdown", items, accent=ACCENT_BLUE, isz=14)
+
+
+def activity(s, report):
+    stitle(s, "Activity", "Active and inactive contacts per tier")
+
+    data = CategoryChartData()
+    data.categories = [t.title() for t in TIERS]
+    data.add_series("Active", report["active_tiers"])
+    data.add_series("Inactive", [a - b for a, b in zip(report["tiers"], report["active_tiers"])])
+    _chart(s, XL_CHART_TYPE.COLUMN_STACKED, data, Inches(.5), Inches(1.7), Inches(7.6), Inches(5.3),
+           (GREEN, DARK_CARD), legend=True)
+
+    items = [f"{tier.title()}: {_pct(active, count)} active"
+             for tier, active, count in zip(TIERS, report["active_tiers"], report["tiers"])]
+    card(s, Inches(8.5), Inches(1.9), Inches(4.3), Inches(4.6), "Active Rate", items, accent=GREEN, isz=14)
+
+
+def growth(s, report):
+    stitle(s, "Growth", f"Contacts by joined date, last {GROWTH_MONTHS} months")
+
+    months, joins, total = report["growth_months"], report["growth_joins"], report["growth_total"]
+    labels = [calendar.month_abbr[int(m[5:])] + " " + m[2:4] for m in months]
+
+    data = CategoryChartData()
+    data.categories = labels
+    data.add_series("Total contacts", total)
+    _chart(s, XL_CHART_TYPE.LINE, data, Inches(.5), Inches(1.7), Inches(6.2), Inches(5.3), (ACCENT_BLUE,))
+
+    data = CategoryChartData()
+    data.categories = labels
+    data.add_series("New contacts", joins)
+    _chart(s, XL_CHART_TYPE.COLUMN_CLUSTERED, data, Inches(6.9), Inches(1.7), Inches(6), Inches(5.3), (ACCENT_TEAL,))
+
+    txt(s, "Total contacts", Inches(.8), Inches(1.55), Inches(4), Inches(.3), sz=12, clr=ACCENT_BLUE, bold=True)
+    txt(s, "New per month", Inches(7.2), Inches(1.55), Inches(4), Inches(.3), sz=12, clr=ACCENT_TEAL, bold=True)
+
+
+def countries(s, report):
+    stitle(s, "Countries", f"Top {TOP_COUNTRIES} countries by contacts")
+
+    top = report["countries"][:TOP_COUNTRIES][::-1]  # bar charts draw bottom-up
+    data = CategoryChartData()
+    data.categories = [name for name, _ in top]
+    data.add_series("Contacts", [count for _, count in top])
+    _chart(s, XL_CHART_TYPE.BAR_CLUSTERED, data, Inches(.5), Inches(1.7), Inches(7.6), Inches(5.3),
+           (ORANGE,), labels=True)
+
+    shown = sum(count for _, count in report["countries"][:TOP_COUNTRIES])
+    ml(s, [
+        (f"{len(report['countries']):,} countries in total", True, WHITE),
+        (f"Top {min(TOP_COUNTRIES, len(report['countries']))} hold {_pct(shown, report['contacts'])} "
+         f"of contacts", False, LIGHT_GRAY),
+        (f"{report['contacts'] - shown:,} contacts elsewhere", False, LIGHT_GRAY),
+    ], Inches(8.6), Inches(2.2), Inches(4.2), Inches(2), sz=16, sp=1.6)
+
+
+SLIDES = [
+    title_slide,
+    at_a_glance,
+    tier_mix,
+    activity,
+    growth,
+    countries,
+]
+
+
+def tenant_report(tenant: str, stats: TenantStats, month: str) -> dict:
+    """Everything the slides show, computed once from a tenant's stats."""
+    months = _months_back(month, GROWTH_MONTHS)
+    before = sum(n for m, n in stats.months.items() if m < months[0])
+    joins = [stats.months.get(m, 0) for m in months]
+    total, running = [], before
+    for n in joins:
+        running += n
+        total.append(running)
+    ranked = sorted(stats.countries.items(), key=lambda kv: (-kv[1], kv[0]))
+    return {
+        "tenant": tenant,
+        "month_name": f"{calendar.month_name[int(month[5:])]} {month[:4]}",
+        "month_short": calendar.month_abbr[int(month[5:])],
+        "as_of": month_end(month).isoformat(),
+        "contacts": stats.contacts,
+        "active": stats.active,
+        "tiers": list(stats.tiers),
+        "active_tiers": list(stats.active_tiers),
+        "new": joins[-1],
+        "new_previous": joins[-2],
+        "growth_12": sum(joins[-12:]),
+        "growth_months": months,
+        "growth_joins": joins,
+        "growth_total": total,
+        "countries": ranked,
+        "top_country": ranked[0][0] if ranked else "-",
+    }
+
+
+def build_tenant_report(report: dict, output=None, prs=None):
+    prs = prs or new_presentation()
+    for build in SLIDES:
+        build(blank(prs), report)
+    if output:
+        prs.save(output)
+    return prs
+
+
+# ── Batch ──
+
+def slugify(name: str) -> str:
+    return re.sub(r"[^A-Za-z0-9]+", "-", name).strip("-").lower() or "tenant"
+
+
+def output_names(tenants) -> dict:
+    """A unique file stem per tenant; clashing slugs get a short hash of the name."""
+    slugs = Counter(slugify(t) for t in tenants)
+    return {t: slugify(t) if slugs[slugify(t)] == 1 else f"{slugify(t)}-{hashlib.sha1(t.encode()).hexdigest()[:6]}"
+            for t in tenants}
+
+
+_worker_month = None
+
+
+def _init_worker(month: str) -> None:
+    global _worker_month
+    _worker_month = month
+    new_presentation()
+
+
+def render_job(job) -> tuple[str, int]:
+    tenant, stats, output = job
+    build_tenant_report(tenant_report(tenant, stats, _worker_month), output)
+    return tenant, stats.contacts
+
+
+def render_all(totals: dict, month: str, output_dir, workers: int) -> int:
+    """Render one deck per tenant into ``output_dir``; return how many were written."""
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    names = output_names(totals)
+    jobs = ((tenant, totals[tenant], output_dir / f"{names[tenant]}.pptx") for tenant in sorted(totals))
+    if workers <= 1:
+        _init_worker(month)
+        return sum(1 for _ in map(render_job, jobs))
+    with multiprocessing.Pool(workers, initializer=_init_worker, initargs=(month,), maxtasksperchild=500) as pool:
+        return sum(1 for _ in _windowed(pool, render_job, jobs, workers * 4))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Render a monthly contact-base report deck for every tenant")
+    parser.add_argument("persons", help="Persons CSV (as written by scripts/generate_persons_csv.py)")
+    parser.add_argument("--output", type=str, required=True, help="Directory for the decks")
+    parser.add_argument("--month", type=str, default=date.today().strftime("%Y-%m"),
+                        help="Report month, YYYY-MM (default: this month)")
+    parser.add_argument("--tenant-field", type=str, default="company", help="Column naming the tenant (default: company)")
+    parser.add_argument("--tenants", type=int, default=0, help="Instead, spread rows over N synthetic tenants by email")
+    parser.add_argument("--limit", type=int, default=0, help="Only render the first N tenants (by name)")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=multiprocessing.cpu_count(),
+        help="Worker processes (default: CPU count)",
+    )
+    args = parser.parse_args()
+    if not re.fullmatch(r"\d{4}-\d{2}", args.month) or not 1 <= int(args.month[5:]) <= 12:
+        parser.error(f"--month must be YYYY-MM, got {args.month!r}")
+
+    started = time.perf_counter()
+    try:
+        totals = aggregate(args.persons, args.month, args.workers, args.tenant_field, args.tenants)
+    except ValueError as exc:
+        parser.error(str(exc))
+    aggregated = time.perf_counter() - started
+    if args.limit:
+        totals = {t: totals[t] for t in sorted(totals)[:args.limit]}
+    contacts = sum(s.contacts for s in totals.values())
+    print(f"Aggregated {contacts:,} contacts into {len(totals):,} tenants in {aggregated:.2f}s")
+
+    started = time.perf_counter()
+    count = render_all(totals, args.month, args.output, args.workers)
+    elapsed = time.perf_counter() - started
+    print(f"Rendered {count:,} decks into {args.output} in {elapsed:.1f}s ({count / elapsed:.1f} decks/sec)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,289 @@
+"""
+Fit text into fixed boxes using font advance tables.
+
+Each font's advance widths are read once from its TrueType file (cmap + hmtx),
+word widths are cached per font, and line breaking is memoized per
+(text, font, bold, size, width), so sizing thousands of boxes costs a few
+dictionary lookups each after the first.
+
+``fit_size`` returns the largest point size, at or below the requested one,
+at which the text word-wraps inside the box the way PowerPoint wraps a
+word-wrapped text box (0.1" side insets, about 1.2 line height). Height is
+checked against the full box: the decks size boxes to their text lines and
+let PowerPoint grow them, so only extra wrapped lines count as overflow.
+``txt(..., fit=True)`` and ``ml(..., fit=True)`` use it.
+
+Fonts are looked up by name in the usual font directories; Carlito is
+metric-compatible with Calibri and is used when Calibri itself is missing.
+With neither installed, DejaVu Sans is used, narrowed by FALLBACK_SCALE,
+and with no font file at all a flat average width per character. Use
+``register_font`` to point a name at specific files.
+
+Usage:
+    python -m decks.textfit                  # fit benchmark on generated tenant names
+    python -m decks.textfit --boxes 50000
+"""
+
+import argparse
+import os
+import random
+import struct
+import time
+from functools import lru_cache
+from pathlib import Path
+
+from pptx.util import Emu, Inches
+
+FONT_DIRS = [
+    "/usr/share/fonts", "/usr/local/share/fonts", os.path.expanduser("~/.fonts"),
+    os.path.expanduser("~/.local/share/fonts"), "/Library/Fonts", os.path.expanduser("~/Library/Fonts"),
+    "C:/Windows/Fonts",
+]
+FONT_FILES = {
+    # name: (regular candidates, bold candidates)
+    "Calibri": (["calibri.ttf", "Carlito-Regular.ttf"], ["calibrib.ttf", "Carlito-Bold.ttf"]),
+    "Calibri Light": (["calibril.ttf", "calibri.ttf", "Carlito-Regular.ttf"], ["calibrib.ttf", "Carlito-Bold.ttf"]),
+}
+FALLBACK_FILES = (["DejaVuSans.ttf"], ["DejaVuSans-Bold.ttf"])
+FALLBACK_SCALE = 0.9    # DejaVu Sans runs about 10-15% wider than Calibri; err on the wide side
+FLAT_WIDTH = 0.55       # em per character when no font file is available at all
+
+LINE_HEIGHT = 1.2
+H_INSET = Inches(.1)
+EMU_PER_PT = 12700
+
+_registered = {}
+_files = None
+
+
+# ── Advance tables ──
+
+def register_font(name: str, regular: str, bold: str | None = None) -> None:
+    """Use these TrueType files for ``name`` (bold falls back to regular)."""
+    _registered[name] = (regular, bold or regular)
+    _metrics.cache_clear()
+    wrap.cache_clear()
+    fit_lines.cache_clear()
+
+
+def _font_files() -> dict:
+    global _files
+    if _files is None:
+        _files = {}
+        for root in FONT_DIRS:
+            for folder, _, names in os.walk(root):
+                for name in names:
+                    _files.setdefault(name.lower(), os.path.join(folder, name))
+    return _files
+
+
+def _find(candidates) -> str | None:
+    files = _font_files()
+    return next((files[c.lower()] for c in candidates if c.lower() in files), None)
+
+
+def read_advances(path) -> dict[str, float]:
+    """Advance width in em of every character mapped by the font's Unicode cmap."""
+    data = Path(path).read_bytes()
+    tables = {}
+    for i in range(struct.unpack_from(">H", data, 4)[0]):
+        tag, _, offset, _ = struct.unpack_from(">4sIII", data, 12 + 16 * i)
+        tables[tag] = offset
+    units = struct.unpack_from(">H", data, tables[b"head"] + 18)[0]
+    n_metrics = struct.unpack_from(">H", data, tables[b"hhea"] + 34)[0]
+    advances = struct.unpack_from(f">{n_metrics * 2}H", data, tables[b"hmtx"])[::2]
+
+    cmap = tables[b"cmap"]
+    subtable = None
+    for i in range(struct.unpack_from(">H", data, cmap + 2)[0]):
+        platform, encoding, offset = struct.unpack_from(">HHI", data, cmap + 4 + 8 * i)
+        fmt = struct.unpack_from(">H", data, cmap + offset)[0]
+        if platform == 3 and encoding == 10 and fmt == 12:
+            subtable = (12, cmap + offset)
+            break
+        if platform == 3 and encoding == 1 and fmt == 4:
+            subtable = (4, cmap + offset)
+    if subtable is None:
+        raise ValueError(f"{path}: no Unicode cmap")
+
+    def em(glyph):
+        return advances[min(glyph, n_metrics - 1)] / units
+
+    widths = {}
+    fmt, pos = subtable
+    if fmt == 4:
+        seg2 = struct.unpack_from(">H", data, pos + 6)[0]
+        segs = seg2 // 2
+        ends = struct.unpack_from(f">{segs}H", data, pos + 14)
+        starts = struct.unpack_from(f">{segs}H", data, pos + 16 + seg2)
+        deltas = struct.unpack_from(f">{segs}h", data, pos + 16 + 2 * seg2)
+        range_pos = pos + 16 + 3 * seg2
+        ranges = struct.unpack_from(f">{segs}H", data, range_pos)
+        for i in range(segs):
+            for code in range(starts[i], min(ends[i], 0xFFFE) + 1):
+                if ranges[i] == 0:
+                    glyph = (code + deltas[i]) & 0xFFFF
+                else:
+                    glyph = struct.unpack_from(">H", data, range_pos + 2 * i + ranges[i] + 2 * (code - starts[i]))[0]
+                    glyph = (glyph + deltas[i]) & 0xFFFF if glyph else 0
+                widths[chr(code)] = em(glyph)
+    else:
+        for i in range(struct.unpack_from(">I", data, pos + 12)[0]):
+            start, end, glyph = struct.unpack_from(">III", data, pos + 16 + 12 * i)
+            for code in range(start, min(end, 0x10FFFF) + 1):
+                widths[chr(code)] = em(glyph + code - start)
+    return widths
+
+
+class FontMetrics:
+    """Advance widths for one face, with per-word widths cached."""
+
+    __slots__ = ("name", "source", "advances", "scale", "default", "_words")
+
+    def __init__(self, name, source, advances, scale=1.0):
+        self.name = name
+        self.source = source
+        self.advances = advances
+        self.scale = scale
+        self.default = (advances.get("n", FLAT_WIDTH) if advances else FLAT_WIDTH)
+        self._words = {}
+
+    def width(self, word: str) -> float:
+        """Width of ``word`` in em."""
+        w = self._words.get(word)
+        if w is None:
+            get, default = self.advances.get, self.default
+            w = self._words[word] = sum(get(c, default) for c in word) * self.scale
+        return w
+
+
+@lru_cache(maxsize=None)
+def _metrics(font: str, bold: bool) -> FontMetrics:
+    index = 1 if bold else 0
+    if font in _registered:
+        path = _registered[font][index]
+        return FontMetrics(font, path, read_advances(path))
+    path = _find(FONT_FILES.get(font, ([f"{font}.ttf"], [f"{font} Bold.ttf", f"{font}-Bold.ttf"]))[index])
+    if path:
+        return FontMetrics(font, path, read_advances(path))
+    path = _find(FALLBACK_FILES[index])
+    if path:
+        return FontMetrics(font, path, read_advances(path), FALLBACK_SCALE)
+    return FontMetrics(font, None, {}, 1.1 if bold else 1.0)
+
+
+# ── Layout ──
+
+@lru_cache(maxsize=65536)
+def wrap(text: str, font: str, bold: bool, size: float, width: int) -> tuple[str, ...]:
+    """Greedy word wrap of ``text`` at ``size`` pt into ``width`` EMU of line; words longer than a line are split."""
+    metrics = _metrics(font, bold)
+    limit = width / EMU_PER_PT / size  # line width in em
+    space = metrics.width(" ")
+    lines = []
+    for paragraph in text.split("\n"):
+        line, used = [], 0.0
+        for word in paragraph.split(" "):
+            w = metrics.width(word)
+            if line and used + space + w <= limit:
+                line.append(word)
+                used += space + w
+                continue
+            if line:
+                lines.append(" ".join(line))
+            while w > limit and len(word) > 1:  # break an over-long word by characters, as PowerPoint does
+                cut = len(word) - 1
+                while cut > 1 and metrics.width(word[:cut]) > limit:
+                    cut -= 1
+                lines.append(word[:cut])
+                word = word[cut:]
+                w = metrics.width(word)
+            line, used = [word], w
+        lines.append(" ".join(line))
+    return tuple(lines)
+
+
+@lru_cache(maxsize=65536)
+def fit_lines(paragraphs: tuple, width: int, height: int, max_sz: int, min_sz: int = 6,
+              font: str = "Calibri", spacing: float = 1.0) -> int:
+    """Largest size in [min_sz, max_sz] at which ``paragraphs`` ((text, bold) pairs) fit the box.
+
+    ``spacing`` is the ml() line-spacing factor: each paragraph is followed by
+    ``size * (spacing - 1)`` points of space. Returns ``min_sz`` if nothing fits.
+    """
+    inner_w = int(width) - 2 * H_INSET
+    inner_h = int(height) / EMU_PER_PT
+
+    def fits(size):
+        lines = sum(len(wrap(text, font, bold, size, inner_w)) for text, bold in paragraphs)
+        return lines * size * LINE_HEIGHT + (len(paragraphs) - 1) * size * (spacing - 1) <= inner_h
+
+    lo, hi = min_sz, max_sz
+    if fits(hi):
+        return hi
+    while lo < hi - 1:  # invariant: hi does not fit
+        mid = (lo + hi) // 2
+        if fits(mid):
+            lo = mid
+        else:
+            hi = mid
+    return lo
+
+
+def fit_size(text: str, width, height, max_sz, min_sz: int = 6, font: str = "Calibri", bold: bool = False) -> int:
+    """Largest point size at or below ``max_sz`` at which ``text`` fits a ``width`` x ``height`` box."""
+    return fit_lines(((text, bold),), int(width), int(height), int(max_sz), min_sz, font)
+
+
+def clear_caches() -> None:
+    """Forget loaded fonts and every memoized width, wrap and fit."""
+    _metrics.cache_clear()
+    wrap.cache_clear()
+    fit_lines.cache_clear()
+
+
+# ── Benchmark ──
+
+_FIRST = ["Addis", "Abebe", "Selam", "Tigist", "Dawit", "Hanna", "Mekdes", "Yonas", "Liya", "Kebede"]
+_ORGS = ["Logistics", "Microfinance Institution", "Health Clinics", "Coffee Exporters", "Telecom",
+         "Cooperative Union", "School District", "Water Utility", "Regional Bank", "Ride Share"]
+
+
+def tenant_names(count: int, seed: int = 7) -> list[str]:
+    rng = random.Random(seed)
+    return [f"{rng.choice(_FIRST)} {rng.choice(_FIRST)}{rng.randrange(1000)} {rng.choice(_ORGS)}"
+            + (f" {rng.choice(_ORGS)}" if rng.random() < .3 else "") for _ in range(count)]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark fitting generated tenant names into card titles")
+    parser.add_argument("--boxes", type=int, default=20000, help="Text boxes to size (default: 20000)")
+    parser.add_argument("--distinct", type=int, default=2000, help="Distinct strings among them (default: 2000)")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    for bold in (False, True):
+        metrics = _metrics("Calibri", bold)
+    loaded = time.perf_counter()
+    print(f"Calibri metrics from {metrics.source or 'flat estimate'} "
+          f"({len(metrics.advances)} glyphs) in {(loaded - started) * 1000:.1f} ms")
+
+    names = tenant_names(args.distinct)
+    boxes = [(names[i % len(names)], Inches(2.55 + (i % 3) * .5), Inches(.3 + (i % 2) * .3)) for i in range(args.boxes)]
+    for label in ("cold", "warm"):
+        if label == "cold":
+            clear_caches()
+        started = time.perf_counter()
+        sizes = [fit_size(text, w, h, 14, bold=True) for text, w, h in boxes]
+        seconds = time.perf_counter() - started
+        print(f"  {label}: {args.boxes:,} boxes in {seconds * 1000:.0f} ms ({args.boxes / seconds:,.0f} boxes/sec)")
+    shrunk = sum(1 for s in sizes if s < 14)
+    print(f"  {shrunk:,} of {args.boxes:,} titles shrunk below 14 pt, smallest {min(sizes)} pt")
+    text, w, h = boxes[max(range(len(boxes)), key=lambda i: len(boxes[i][0]))]
+    size = fit_size(text, w, h, 14, bold=True)
+    print(f"  e.g. {text!r} in {Emu(w).inches:.2f}\" x {Emu(h).inches:.2f}\" -> {size} pt: "
+          f"{wrap(text, 'Calibri', True, size, w - 2 * H_INSET)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,23 @@
+"""Turumba brand colors and slide geometry shared by every deck."""
+
+from pptx.dml.color import RGBColor
+from pptx.util import Inches
+
+# ── Brand Colors ──
+DARK_BG      = RGBColor(0x0F, 0x17, 0x2A)  # Deep navy
+ACCENT_BLUE  = RGBColor(0x38, 0x9C, 0xF7)  # Bright blue
+ACCENT_TEAL  = RGBColor(0x06, 0xB6, 0xD4)  # Teal
+WHITE        = RGBColor(0xFF, 0xFF, 0xFF)
+LIGHT_GRAY   = RGBColor(0xCC, 0xCC, 0xCC)
+MED_GRAY     = RGBColor(0x99, 0x99, 0x99)
+GREEN        = RGBColor(0x22, 0xC5, 0x5E)
+ORANGE       = RGBColor(0xF5, 0x9E, 0x0B)
+RED          = RGBColor(0xEF, 0x44, 0x44)
+PURPLE       = RGBColor(0xA7, 0x8B, 0xFA)
+SECTION_BG   = RGBColor(0x14, 0x1F, 0x38)  # Slightly lighter navy
+DARK_CARD    = RGBColor(0x1A, 0x25, 0x38)
+PINK         = RGBColor(0xEC, 0x48, 0x99)
+
+# ── 16:9 slide size ──
+SLIDE_WIDTH  = Inches(13.333)
+SLIDE_HEIGHT = Inches(7.5)
@@ -0,0 +1,247 @@
+"""
+Rebuild a deck whenever its source changes, from one long-lived process.
+
+python-pptx, the helpers and the template stay loaded between builds. When a
+watched file is saved, its module (and the modules that import it) is
+reloaded and the deck is rebuilt through the same per-slide keys as
+decks.incremental, with the rendered XML kept in memory: only slides whose
+function, arguments or helpers changed are drawn again, the rest are loaded
+from their cached XML. Spec files (.yaml/.json) are recompiled and each
+slide's key is its compiled op list. The output is written to a temporary
+file and renamed over the old one, so a viewer never sees a half-written deck.
+
+Changes are picked up with inotify (through libc, no extra package) on the
+directories holding the watched files, which also catches editors that save
+by renaming a temporary file. Where inotify is unavailable the files' mtimes
+are polled instead.
+
+Usage:
+    python -m decks.watch overview --output build/overview.pptx
+    python -m decks.watch decks/specs/overview_sample.yaml --output build/sample.pptx
+    python create_presentation.py --watch
+"""
+
+import argparse
+import ctypes
+import importlib
+import os
+import select
+import struct
+import sys
+import time
+import traceback
+from io import BytesIO
+from pathlib import Path
+
+from decks import helpers, incremental
+from decks.incremental import SlideSpec, _cacheable, _write_atomic, load_slide_xml, spec_key
+
+# Modules in import order: a change to one reloads it and everything after it.
+MODULES = ("decks.theme", "decks.textfit", "decks.helpers", "decks.overview", "decks.agentic", "decks.spec")
+DECK_MODULES = {"overview": "decks.overview", "agentic": "decks.agentic"}
+SETTLE = 0.02                   # seconds to wait for the rest of an editor's writes
+POLL_INTERVAL = 0.1
+
+IN_CLOSE_WRITE = 0x008
+IN_MOVED_TO = 0x080
+IN_CREATE = 0x100
+_EVENT = struct.Struct("iIII")
+
+
+class Inotify:
+    """Changed-file notifications for a set of files, via inotify on their directories."""
+
+    def __init__(self, paths):
+        self.paths = {Path(p).resolve() for p in paths}
+        libc = ctypes.CDLL(None, use_errno=True)
+        if not hasattr(libc, "inotify_init1"):
+            raise OSError("inotify is not available")
+        self.fd = libc.inotify_init1(os.O_CLOEXEC | os.O_NONBLOCK)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self.dirs = {}
+        for folder in {p.parent for p in self.paths}:
+            wd = libc.inotify_add_watch(self.fd, str(folder).encode(), IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE)
+            if wd < 0:
+                raise OSError(ctypes.get_errno(), f"inotify_add_watch failed for {folder}")
+            self.dirs[wd] = folder
+
+    def _read(self, timeout) -> set:
+        changed = set()
+        if not select.select([self.fd], [], [], timeout)[0]:
+            return changed
+        try:
+            data = os.read(self.fd, 65536)
+        except BlockingIOError:
+            return changed
+        offset = 0
+        while offset < len(data):
+            wd, _mask, _cookie, length = _EVENT.unpack_from(data, offset)
+            offset += _EVENT.size
+            name = data[offset:offset + length].rstrip(b"\0").decode()
+            offset += length
+            path = self.dirs[wd] / name
+            if path in self.paths:
+                changed.add(path)
+        return changed
+
+    def wait(self) -> set:
+        """Block until a watched file changes; return every file changed in that burst."""
+        changed = set()
+        while not changed:
+            changed = self._read(None)
+        while True:
+            more = self._read(SETTLE)
+            if not more:
+                return changed
+            changed |= more
+
+    def close(self) -> None:
+        os.close(self.fd)
+
+
+class Poller:
+    """The same interface as Inotify, polling mtimes."""
+
+    def __init__(self, paths):
+        self.paths = {Path(p).resolve() for p in paths}
+        self.mtimes = {p: self._mtime(p) for p in self.paths}
+
+    @staticmethod
+    def _mtime(path):
+        try:
+            return path.stat().st_mtime_ns
+        except FileNotFoundError:
+            return None
+
+    def wait(self) -> set:
+        while True:
+            time.sleep(POLL_INTERVAL)
+            changed = {p for p in self.paths if self._mtime(p) != self.mtimes[p]}
+            if changed:
+                time.sleep(SETTLE)
+                for p in changed:
+                    self.mtimes[p] = self._mtime(p)
+                return changed
+
+    def close(self) -> None:
+        pass
+
+
+def watcher(paths):
+    try:
+        return Inotify(paths)
+    except OSError:
+        return Poller(paths)
+
+
+def _draw_ops(slide, ops):
+    for fn, args in ops:
+        fn(slide, *args)
+
+
+class LiveDeck:
+    """A deck (module name or spec file) rebuilt in place, with rendered slides kept in memory."""
+
+    def __init__(self, source, output):
+        self.source = source
+        self.output = Path(output)
+        self.is_spec = source not in DECK_MODULES
+        self._xml = {}
+        for name in MODULES:
+            importlib.import_module(name)
+
+    def files(self) -> list:
+        modules = MODULES if not self.is_spec else MODULES[:3] + ("decks.spec",)
+        files = [Path(sys.modules[name].__file__) for name in modules]
+        if self.is_spec:
+            files.append(Path(self.source))
+        return files
+
+    def reload(self, changed) -> None:
+        """Reload the changed modules and every module after the first of them."""
+        changed = {Path(p).resolve() for p in changed}
+        first = next((i for i, name in enumerate(MODULES) if Path(sys.modules[name].__file__).resolve() in changed),
+                     None)
+        if first is None:
+            return
+        for name in MODULES[first:]:
+            importlib.reload(sys.modules[name])
+        incremental._render_version = None
+        incremental._source_hashes.clear()
+
+    def specs(self) -> list:
+        if not self.is_spec:
+            return [incremental.as_spec(s) for s in sys.modules[DECK_MODULES[self.source]].SLIDES]
+        spec = sys.modules["decks.spec"]
+        plan = spec.compile_spec(spec.load_spec(self.source))
+        return [SlideSpec(_draw_ops, ops) for ops in plan.slides]
+
+    def build(self) -> dict:
+        """Rebuild the deck and write it atomically; return how many slides were drawn and reused."""
+        prs = helpers.new_presentation()
+        stats = {"rendered": 0, "reused": 0}
+        keep = {}
+        for spec in self.specs():
+            key = spec_key(spec)
+            slide = helpers.blank(prs)
+            blob = self._xml.get(key)
+            if blob is not None:
+                load_slide_xml(slide, blob)
+                stats["reused"] += 1
+            else:
+                spec.render(slide)
+                stats["rendered"] += 1
+                if _cacheable(slide):
+                    blob = slide.part.blob
+            if blob is not None:
+                keep[key] = blob
+        self._xml = keep
+        buffer = BytesIO()
+        prs.save(buffer)
+        _write_atomic(self.output, buffer.getvalue())
+        stats["slides"] = len(prs.slides)
+        return stats
+
+
+def watch(source, output) -> None:
+    """Build ``source`` into ``output``, then rebuild on every save until interrupted."""
+    deck = LiveDeck(source, output)
+    deck.output.parent.mkdir(parents=True, exist_ok=True)
+    started = time.perf_counter()
+    stats = deck.build()
+    print(f"Built {deck.output} ({stats['slides']} slides) in {(time.perf_counter() - started) * 1000:.0f} ms")
+    files = watcher(deck.files())
+    print(f"Watching {len(files.paths)} files ({type(files).__name__.lower()}); Ctrl-C to stop")
+    try:
+        while True:
+            changed = files.wait()
+            started = time.perf_counter()
+            try:
+                deck.reload(changed)
+                stats = deck.build()
+            except Exception:
+                traceback.print_exc()
+                print(f"Build failed; {deck.output} left as it was")
+                continue
+            names = ", ".join(sorted(p.name for p in changed))
+            print(f"{names}: rendered {stats['rendered']}, reused {stats['reused']} slides, "
+                  f"wrote {deck.output} in {(time.perf_counter() - started) * 1000:.0f} ms")
+    except KeyboardInterrupt:
+        pass
+    finally:
+        files.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Rebuild a deck on every save of its sources")
+    parser.add_argument("source", help=f"Deck ({', '.join(DECK_MODULES)}) or spec file (.yaml, .yml, .json)")
+    parser.add_argument("--output", type=str, required=True, help="Output .pptx path")
+    args = parser.parse_args()
+    if args.source not in DECK_MODULES and not Path(args.source).is_file():
+        parser.error(f"{args.source!r} is neither a deck name nor a spec file")
+    watch(args.source, args.output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""
+Split a CSV stream into blocks of whole records for worker processes.
+
+Shared by the scripts that fan a persons CSV out to a process pool
+(profile_persons.py, persons_index.py). A block ends at the last newline
+outside a quoted field, so every block parses on its own with
+``csv.reader``; ``windowed`` feeds the blocks to a pool while keeping only a
+bounded number in flight.
+"""
+
+import argparse
+from collections import deque
+
+
+BLOCK_SIZE = 4 << 20            # bytes of CSV per worker task
+
+
+def record_end(block: bytes) -> int:
+    """Offset just past the last complete CSV record in ``block`` (0 if there is none)."""
+    end = block.rfind(b"\n")
+    while end >= 0 and block.count(b'"', 0, end) % 2:
+        end = block.rfind(b"\n", 0, end)  # that newline is inside a quoted field
+    return end + 1
+
+
+def read_blocks(f, block_size: int = BLOCK_SIZE, tail: bool = True):
+    """Yield ``(block, end)`` for blocks of whole records read from a binary file's current position.
+
+    ``end`` is the number of bytes consumed so far, counted from that position. With ``tail``, a
+    last record that has no trailing newline is yielded too; without it, that record is left unread
+    (a writer may still be appending to it).
+    """
+    if block_size <= 0:
+        raise ValueError(f"block_size must be positive, not {block_size}")
+    consumed = 0
+    rest = b""
+    while True:
+        chunk = f.read(block_size)
+        if not chunk:
+            break
+        block = rest + chunk
+        end = record_end(block)
+        if end == 0:
+            rest = block
+            continue
+        consumed += end
+        yield block[:end], consumed
+        rest = block[end:]
+    if tail and rest.strip():
+        yield rest, consumed + len(rest)
+
+
+def windowed(pool, fn, jobs, window):
+    """``pool.imap`` with at most ``window`` jobs submitted and not yet collected."""
+    pending = deque()
+    for job in jobs:
+        pending.append(pool.apply_async(fn, (job,)))
+        if len(pending) >= window:
+            yield pending.popleft().get()
+    while pending:
+        yield pending.popleft().get()
+
+
+def kilobytes(value: str) -> int:
+    """argparse type for a positive block size in KB."""
+    size = int(value)
+    if size <= 0:
+        raise argparse.ArgumentTypeError(f"must be a positive number of KB, not {value}")
+    return size
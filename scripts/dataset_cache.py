@@ -0,0 +1,199 @@
+"""
+Content-addressed cache of generated datasets, with size-bounded LRU eviction.
+
+A dataset is stored under the SHA-256 of the parameters that determine it
+(row count, locale, seed, date, the generator's code and library versions), so
+identical requests from CI and local runs share one file. A hit links the
+cached file to the requested output (hard link, or a copy across
+filesystems) and generates nothing.
+
+Cached files are read-only, and outputs are replaced by rename, never
+rewritten in place, so a hard-linked output never changes its cache entry
+underneath it. Parallel jobs wanting the same missing dataset serialize on
+a lock, so only one builds it and the others link the result. Entries are
+written to a temporary file and published by rename, so readers never see
+a partial dataset. Each entry has a small JSON sidecar with its parameters
+and size, whose mtime is the last time it was used. After a build, the
+least recently used entries are evicted until the cache fits its size
+bound. Locking uses fcntl where it exists; without it, concurrent misses
+may both build, but publishing stays atomic.
+
+Usage:
+    python scripts/dataset_cache.py stats --cache .dataset_cache
+    python scripts/dataset_cache.py prune --cache .dataset_cache --max-size 512
+    python scripts/dataset_cache.py clear --cache .dataset_cache
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import shutil
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:             # Windows: no advisory locks, builds may be duplicated
+    fcntl = None
+
+
+DEFAULT_MAX_MB = 2048
+
+
+def cache_key(params: dict) -> str:
+    return hashlib.sha256(json.dumps(params, sort_keys=True, separators=(",", ":")).encode()).hexdigest()
+
+
+def _replace_with(source: Path, output: Path) -> None:
+    """Make ``output`` a hard link to ``source`` (a copy if linking fails), replacing it by rename."""
+    output.parent.mkdir(parents=True, exist_ok=True)
+    tmp = output.with_name(f".{output.name}.{os.getpid()}.tmp")
+    tmp.unlink(missing_ok=True)
+    try:
+        os.link(source, tmp)
+    except OSError:             # another filesystem, or no hard links
+        shutil.copyfile(source, tmp)
+    os.replace(tmp, output)
+
+
+class DatasetCache:
+    def __init__(self, root, max_bytes: int = DEFAULT_MAX_MB << 20):
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+
+    def _paths(self, key: str) -> tuple[Path, Path]:
+        folder = self.root / "objects" / key[:2]
+        return folder / key, folder / f"{key}.json"
+
+    @contextmanager
+    def _lock(self, name: str, blocking: bool = True):
+        """Hold an exclusive lock; yields False if ``blocking`` is off and someone else holds it."""
+        if fcntl is None:
+            yield True
+            return
+        path = self.root / "locks" / f"{name}.lock"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "a") as f:
+            try:
+                fcntl.flock(f, fcntl.LOCK_EX | (0 if blocking else fcntl.LOCK_NB))
+            except BlockingIOError:
+                yield False
+                return
+            try:
+                yield True
+            finally:
+                fcntl.flock(f, fcntl.LOCK_UN)
+
+    def fetch(self, key: str, output: Path) -> bool:
+        """Link the entry for ``key`` to ``output`` if it is cached and intact."""
+        data, meta = self._paths(key)
+        try:
+            size = json.loads(meta.read_text())["size"]
+            if data.stat().st_size != size:
+                raise ValueError("size mismatch")
+            if not (output.exists() and os.path.samefile(data, output)):
+                _replace_with(data, output)
+            os.utime(meta)                       # last use, for LRU eviction
+            return True
+        except (FileNotFoundError, ValueError, KeyError):
+            return False                         # missing, half-evicted or damaged: rebuild
+
+    def get_or_create(self, params: dict, output, build) -> bool:
+        """Put the dataset for ``params`` at ``output``, calling ``build(path)`` to write it on a miss.
+
+        Returns True on a cache hit.
+        """
+        output = Path(output)
+        key = cache_key(params)
+        if self.fetch(key, output):
+            return True
+        with self._lock(key[:2]):                # striped by key prefix, so at most 256 lock files
+            if self.fetch(key, output):           # built by a concurrent job while we waited
+                return True
+            data, meta = self._paths(key)
+            data.parent.mkdir(parents=True, exist_ok=True)
+            tmp = data.with_name(f".{key}.{os.getpid()}.tmp")
+            try:
+                build(tmp)
+                os.chmod(tmp, 0o444)
+                _replace_with(tmp, output)
+                os.replace(tmp, data)
+            finally:
+                tmp.unlink(missing_ok=True)
+            meta_tmp = meta.with_name(f".{meta.name}.{os.getpid()}.tmp")
+            meta_tmp.write_text(json.dumps({"params": params, "size": data.stat().st_size,
+                                            "created": time.time()}, indent=1))
+            os.replace(meta_tmp, meta)
+        self.evict(keep=key)
+        return False
+
+    def entries(self) -> list[dict]:
+        """Cached entries, least recently used first."""
+        found = []
+        for meta in (self.root / "objects").glob("*/*.json"):
+            try:
+                info = json.loads(meta.read_text())
+                used = meta.stat().st_mtime
+            except (FileNotFoundError, ValueError):
+                continue
+            found.append({"key": meta.stem, "size": info["size"], "used": used, "params": info["params"]})
+        return sorted(found, key=lambda e: e["used"])
+
+    def evict(self, max_bytes: int | None = None, keep: str | None = None) -> list[dict]:
+        """Drop least recently used entries until the cache fits; returns those removed.
+
+        Skipped if another process is evicting already. An entry being linked while it is evicted is
+        either linked before its file goes (the link keeps the data) or seen as a miss and rebuilt.
+        """
+        limit = self.max_bytes if max_bytes is None else max_bytes
+        removed = []
+        with self._lock("evict", blocking=False) as acquired:
+            if not acquired:
+                return removed
+            entries = self.entries()
+            total = sum(e["size"] for e in entries)
+            for entry in entries:
+                if total <= limit:
+                    break
+                if entry["key"] == keep:
+                    continue
+                data, meta = self._paths(entry["key"])
+                meta.unlink(missing_ok=True)     # sidecar first: a fetch that finds no sidecar is a miss
+                data.unlink(missing_ok=True)
+                total -= entry["size"]
+                removed.append(entry)
+        return removed
+
+    def clear(self) -> None:
+        shutil.rmtree(self.root / "objects", ignore_errors=True)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Inspect and prune the generated-dataset cache")
+    parser.add_argument("command", choices=["stats", "prune", "clear"], help="What to do")
+    parser.add_argument("--cache", type=str, default=os.environ.get("PERSONS_CACHE", ".dataset_cache"),
+                        help="Cache directory (default: $PERSONS_CACHE, or .dataset_cache)")
+    parser.add_argument("--max-size", type=int, default=DEFAULT_MAX_MB,
+                        help=f"MB to prune the cache down to (default: {DEFAULT_MAX_MB})")
+    args = parser.parse_args()
+
+    cache = DatasetCache(args.cache, args.max_size << 20)
+    if args.command == "clear":
+        cache.clear()
+        print(f"Cleared {cache.root}")
+    elif args.command == "prune":
+        removed = cache.evict()
+        print(f"Evicted {len(removed)} entries ({sum(e['size'] for e in removed) / 1e6:.1f} MB)")
+    else:
+        entries = cache.entries()
+        for e in reversed(entries):
+            used = time.strftime("%Y-%m-%d %H:%M", time.localtime(e["used"]))
+            params = ", ".join(f"{k}={v}" for k, v in e["params"].items() if k not in ("code", "faker"))
+            print(f"{e['key'][:12]}  {e['size'] / 1e6:>9.1f} MB  used {used}  {params}")
+        print(f"{len(entries)} entries, {sum(e['size'] for e in entries) / 1e6:.1f} MB in {cache.root}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,404 @@
+"""
+Generate a conversation history dataset (conversations + messages) for persons,
+streamed straight to partitioned CSV files.
+
+Every person becomes a contact with a few conversations. Each conversation has
+a channel, a diurnal start time (busy mid-morning and evening, quiet at night),
+a lognormal number of messages and alternating inbound/outbound turns with
+realistic reply gaps; agents only reply during business hours. Each contact
+is mapped to an IANA timezone the way scheduler_bench.py does it, and the
+diurnal curve and business hours apply in that local time (DST-aware);
+timestamps are written in UTC. Message lengths follow per-channel lognormal
+distributions (short SMS/chat, long email).
+
+Contacts are assigned to partitions by index; each partition is generated by
+a pool worker and written to its own files, rolling over every
+--rows-per-file rows. A --persons-csv with fewer rows than partitions is
+cycled whole by every partition, so each still fills its quota. Nothing is
+held in memory beyond the conversation being written, so --messages
+1000000000 runs in constant memory. Output is deterministic for a given seed,
+partition count and person source.
+
+Layout:
+    <output>/conversations/part-00000-0000.csv[.gz]
+    <output>/messages/part-00000-0000.csv[.gz]
+
+Usage:
+    python scripts/generate_conversations.py
+    python scripts/generate_conversations.py --messages 10000000 --partitions 16 --workers 8
+    python scripts/generate_conversations.py --persons-csv scripts/sample_persons.csv --compress
+    python scripts/generate_conversations.py --messages 1000000000 --partitions 256 --output data/history
+
+Requirements:
+    pip install faker
+"""
+
+import argparse
+import bisect
+import csv
+import gzip
+import itertools
+import math
+import multiprocessing
+import random
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Iterator
+from zoneinfo import ZoneInfo
+
+from generate_persons_csv import generate_persons
+from scheduler_bench import TIMEZONES, person_timezone
+
+
+# channel -> (weight, median length, sigma, max length)
+CHANNELS = {
+    "sms": (0.30, 60, 0.7, 480),
+    "whatsapp": (0.25, 45, 1.0, 2000),
+    "telegram": (0.10, 40, 1.0, 2000),
+    "messenger": (0.10, 40, 1.0, 2000),
+    "email": (0.10, 600, 0.9, 10000),
+    "webchat": (0.15, 35, 0.9, 1000),
+}
+
+# Relative traffic per hour of day (contact's local time), from typical support-inbox curves.
+HOURLY_WEIGHTS = [
+    0.2, 0.1, 0.1, 0.1, 0.1, 0.2, 0.5, 1.0, 1.8, 2.4, 2.6, 2.5,
+    2.2, 2.3, 2.4, 2.3, 2.1, 1.9, 1.7, 1.8, 1.9, 1.6, 1.0, 0.5,
+]
+BUSINESS_HOURS = range(8, 19)   # contact's local time
+
+TENANTS = 500
+
+OUTBOUND_STATUSES, OUTBOUND_STATUS_CUM = ["delivered", "read", "failed"], [0.45, 0.95, 1.0]
+CONVERSATION_STATUSES, CONVERSATION_STATUS_CUM = ["open", "resolved", "closed"], [0.15, 0.75, 1.0]
+
+CONVERSATION_FIELDS = [
+    "conversation_id", "account_id", "contact_id", "contact_name", "contact_email", "contact_phone",
+    "channel", "status", "started_at", "last_message_at", "message_count",
+]
+MESSAGE_FIELDS = [
+    "message_id", "conversation_id", "account_id", "contact_id", "channel", "direction",
+    "sender_type", "status", "created_at", "length", "content",
+]
+
+VOCABULARY = (
+    "hello hi thanks thank you please order delivery payment invoice account refund help support "
+    "when where why how can could would issue problem received sent message update status today "
+    "tomorrow yesterday week price plan subscription upgrade cancel change address phone email "
+    "number code verify login password reset working not yes no ok sure great soon wait minute "
+    "hour call back team agent check confirm ticket tracking package store branch balance transfer"
+).split()
+CORPUS_WORDS = 200_000
+
+
+def iter_contacts(partition: int, partitions: int, pool: list[dict] | None,
+                  persons_csv: str | None) -> Iterator[tuple[int, dict]]:
+    """Yield (contact_index, person) for this partition, cycling the source as needed."""
+    index = partition
+    if pool is not None:
+        while True:
+            yield index, pool[index % len(pool)]
+            index += partitions
+    while True:
+        rows = 0
+        with open(persons_csv, newline="", encoding="utf-8") as f:
+            for row_index, person in enumerate(csv.DictReader(f)):
+                rows += 1
+                if row_index % partitions == partition:
+                    yield index, person
+                    index += partitions
+        if rows <= partition:
+            # fewer rows than partitions: none is this partition's own, so cycle them all (there are few)
+            if rows:
+                with open(persons_csv, newline="", encoding="utf-8") as f:
+                    yield from iter_contacts(partition, partitions, list(csv.DictReader(f)), None)
+            return
+
+
+def offset_changes(zone: ZoneInfo, start: datetime, end: datetime) -> tuple[list[datetime], list[timedelta]]:
+    """UTC instants in [start, end) at which ``zone``'s UTC offset changes, and the offsets in force.
+
+    ``offsets[i]`` applies before ``changes[i]`` (and the last one after the last change); at most one
+    change a day is assumed, located to the second.
+    """
+    def offset(seconds: int) -> timedelta:
+        return datetime.fromtimestamp(seconds, zone).utcoffset()
+
+    changes, offsets = [], [offset(int(start.timestamp()))]
+    day = int(start.timestamp())
+    while day < end.timestamp():
+        lo, hi = day, day + 86400
+        if offset(hi) != offsets[-1]:
+            while hi - lo > 1:
+                mid = (lo + hi) // 2
+                lo, hi = (mid, hi) if offset(mid) == offsets[-1] else (lo, mid)
+            changes.append(datetime.fromtimestamp(hi, timezone.utc))
+            offsets.append(offset(hi))
+        day += 86400
+    return changes, offsets
+
+
+class ConversationGenerator:
+    def __init__(self, seed: int, start: datetime, days: int, conversations_per_contact: float,
+                 messages_median: float, content: bool):
+        self.seed = seed
+        self.start = start
+        self.days = days
+        self.p_more = 1 - 1 / max(1.0, conversations_per_contact)
+        self.messages_mu = math.log(messages_median)
+        self.content = content
+        self.channels = list(CHANNELS)
+        self.channel_cum = list(itertools.accumulate(spec[0] for spec in CHANNELS.values()))
+        self.hours = list(range(24))
+        self.hour_cum = list(itertools.accumulate(HOURLY_WEIGHTS))
+        # offset changes of every contact timezone over the history (replies may trail it by months),
+        # so local time costs a bisect instead of a tz conversion per message
+        end = start + timedelta(days=days + 366)
+        self.offsets = [offset_changes(ZoneInfo(name), start - timedelta(days=1), end) for name in TIMEZONES]
+        # message bodies are slices of one pre-shuffled corpus, so a body costs a slice, not a word loop
+        corpus_rng = random.Random(seed)
+        self.corpus = " ".join(corpus_rng.choices(VOCABULARY, k=CORPUS_WORDS)) + " "
+        self.corpus_span = len(self.corpus) - max(spec[3] for spec in CHANNELS.values())
+
+    def utc_offset(self, zone: int, at: datetime) -> timedelta:
+        changes, offsets = self.offsets[zone]
+        return offsets[bisect.bisect_right(changes, at)]
+
+    def to_utc(self, zone: int, local: datetime) -> datetime:
+        """UTC time of a local wall-clock time (carried in a UTC datetime)."""
+        return local - self.utc_offset(zone, local - self.utc_offset(zone, local))
+
+    def start_time(self, rng: random.Random, zone: int) -> datetime:
+        day = rng.randrange(self.days)
+        hour = rng.choices(self.hours, cum_weights=self.hour_cum)[0]
+        return self.to_utc(zone, self.start + timedelta(days=day, hours=hour, seconds=rng.randrange(3600)))
+
+    def reply_gap(self, rng: random.Random, at: datetime, outbound: bool, same_sender: bool,
+                  zone: int) -> timedelta:
+        if same_sender:
+            return timedelta(seconds=rng.expovariate(1 / 20))
+        if not outbound:
+            return timedelta(seconds=rng.lognormvariate(math.log(300), 1.4))
+        reply_at = at + timedelta(seconds=rng.lognormvariate(math.log(90), 1.1))
+        local = reply_at + self.utc_offset(zone, reply_at)
+        if local.hour not in BUSINESS_HOURS:
+            # agents pick up the backlog when the inbox opens
+            next_open = local.replace(hour=BUSINESS_HOURS.start, minute=0, second=0, microsecond=0)
+            if local.hour >= BUSINESS_HOURS.stop:
+                next_open += timedelta(days=1)
+            reply_at = self.to_utc(zone, next_open) + timedelta(seconds=rng.expovariate(1 / 900))
+        return reply_at - at
+
+    def text(self, rng: random.Random, channel: str) -> tuple[int, str]:
+        _, median, sigma, cap = CHANNELS[channel]
+        length = max(1, min(cap, int(rng.lognormvariate(math.log(median), sigma))))
+        if not self.content:
+            return length, ""
+        offset = self.corpus.find(" ", rng.randrange(self.corpus_span)) + 1
+        return length, self.corpus[offset:offset + length]
+
+    def conversations(self, contact_index: int, person: dict) -> Iterator[tuple[list, list[list]]]:
+        rng = random.Random(self.seed * 1_000_003 + contact_index)
+        account_id = f"acct-{contact_index % TENANTS:04d}"
+        contact_id = f"contact-{contact_index:010d}"
+        name = f"{person['first_name']} {person['last_name']}"
+        zone = person_timezone(person)
+        n = 0
+        while True:
+            n += 1
+            conversation_id = f"conv-{contact_index:010d}-{n:03d}"
+            channel = rng.choices(self.channels, cum_weights=self.channel_cum)[0]
+            count = max(1, min(500, int(rng.lognormvariate(self.messages_mu, 0.9))))
+            at = self.start_time(rng, zone)
+            outbound = rng.random() < 0.3  # campaign-initiated vs customer-initiated
+            messages = []
+            for _ in range(count):
+                length, content = self.text(rng, channel)
+                if outbound:
+                    sender = "bot" if rng.random() < 0.2 else "agent"
+                    status = rng.choices(OUTBOUND_STATUSES, cum_weights=OUTBOUND_STATUS_CUM)[0]
+                else:
+                    sender, status = "contact", "received"
+                messages.append([
+                    f"{rng.getrandbits(128):032x}", conversation_id, account_id, contact_id, channel,
+                    "outbound" if outbound else "inbound", sender, status,
+                    at.isoformat(timespec="seconds"), length, content,
+                ])
+                switch = rng.random() < 0.75
+                at += self.reply_gap(rng, at, not outbound if switch else outbound, not switch, zone)
+                outbound = not outbound if switch else outbound
+            status = rng.choices(CONVERSATION_STATUSES, cum_weights=CONVERSATION_STATUS_CUM)[0]
+            conversation = [
+                conversation_id, account_id, contact_id, name, person["email"], person["phone"], channel,
+                status, messages[0][8], messages[-1][8], len(messages),
+            ]
+            yield conversation, messages
+            if rng.random() >= self.p_more:
+                return
+
+
+class PartitionWriter:
+    """Writes one table for one partition, rolling to a new file every max_rows rows."""
+
+    def __init__(self, directory: Path, partition: int, fields: list[str], max_rows: int, compress: bool):
+        self.directory = directory
+        self.partition = partition
+        self.fields = fields
+        self.max_rows = max_rows
+        self.compress = compress
+        self.file_index = -1
+        self.rows_in_file = 0
+        self.total_rows = 0
+        self.bytes_written = 0
+        self.handle = None
+        self.writer = None
+
+    def _roll(self) -> None:
+        self.close()
+        self.file_index += 1
+        suffix = ".csv.gz" if self.compress else ".csv"
+        path = self.directory / f"part-{self.partition:05d}-{self.file_index:04d}{suffix}"
+        if self.compress:
+            self.handle = gzip.open(path, "wt", newline="", encoding="utf-8", compresslevel=3)
+        else:
+            self.handle = open(path, "w", newline="", encoding="utf-8", buffering=1 << 20)
+        self.path = path
+        self.writer = csv.writer(self.handle)
+        self.writer.writerow(self.fields)
+        self.rows_in_file = 0
+
+    def write(self, rows: list[list]) -> None:
+        while rows:
+            if self.writer is None or self.rows_in_file >= self.max_rows:
+                self._roll()
+            room = self.max_rows - self.rows_in_file
+            chunk, rows = rows[:room], rows[room:]
+            self.writer.writerows(chunk)
+            self.rows_in_file += len(chunk)
+            self.total_rows += len(chunk)
+
+    def close(self) -> None:
+        if self.handle is not None:
+            self.handle.close()
+            self.bytes_written += self.path.stat().st_size
+            self.handle = None
+            self.writer = None
+
+
+_pool_persons: list[dict] | None = None
+
+
+def _init_worker(persons: list[dict] | None) -> None:
+    global _pool_persons
+    _pool_persons = persons
+
+
+def generate_partition(task: dict) -> dict:
+    partition, quota = task["partition"], task["quota"]
+    output = Path(task["output"])
+    generator = ConversationGenerator(
+        task["seed"], datetime.fromisoformat(task["start"]), task["days"],
+        task["conversations_per_contact"], task["messages_median"], task["content"],
+    )
+    conversations = PartitionWriter(output / "conversations", partition, CONVERSATION_FIELDS,
+                                    task["rows_per_file"], task["compress"])
+    messages = PartitionWriter(output / "messages", partition, MESSAGE_FIELDS,
+                               task["rows_per_file"], task["compress"])
+    contacts = 0
+    remaining = quota
+    for contact_index, person in iter_contacts(partition, task["partitions"], _pool_persons, task["persons_csv"]):
+        if remaining <= 0:
+            break
+        contacts += 1
+        for conversation, rows in generator.conversations(contact_index, person):
+            if len(rows) > remaining:
+                rows = rows[:remaining]
+                conversation[9], conversation[10] = rows[-1][8], len(rows)
+            conversations.write([conversation])
+            messages.write(rows)
+            remaining -= len(rows)
+            if remaining <= 0:
+                break
+    conversations.close()
+    messages.close()
+    return {
+        "partition": partition,
+        "contacts": contacts,
+        "conversations": conversations.total_rows,
+        "messages": messages.total_rows,
+        "bytes": conversations.bytes_written + messages.bytes_written,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Generate partitioned conversation/message history for persons")
+    parser.add_argument("--messages", type=int, default=1_000_000, help="Total messages to generate (default: 1000000)")
+    parser.add_argument("--output", type=str, default="data/conversations", help="Output directory (default: data/conversations)")
+    parser.add_argument("--partitions", type=int, default=8, help="Number of partitions (default: 8)")
+    parser.add_argument("--workers", type=int, default=multiprocessing.cpu_count(), help="Worker processes (default: CPU count)")
+    parser.add_argument("--rows-per-file", type=int, default=5_000_000, help="Rows per file before rolling over (default: 5000000)")
+    parser.add_argument("--compress", action="store_true", help="Write gzip-compressed CSV")
+    parser.add_argument("--no-content", action="store_true", help="Leave message bodies empty (lengths are still generated)")
+    parser.add_argument("--persons", type=int, default=1000, help="Generated persons to cycle through as contacts (default: 1000)")
+    parser.add_argument("--persons-csv", type=str, default=None, help="Stream contacts from an existing persons CSV instead")
+    parser.add_argument("--locale", type=str, default="en_US", help="Faker locale (default: en_US)")
+    parser.add_argument("--conversations-per-contact", type=float, default=3.0, help="Mean conversations per contact (default: 3)")
+    parser.add_argument("--messages-median", type=float, default=6.0, help="Median messages per conversation (default: 6)")
+    parser.add_argument("--start", type=str, default="2025-01-01", help="First day of the history (default: 2025-01-01)")
+    parser.add_argument("--days", type=int, default=365, help="Days of history (default: 365)")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed (default: 42)")
+    args = parser.parse_args()
+
+    output = Path(args.output)
+    for table in ("conversations", "messages"):
+        (output / table).mkdir(parents=True, exist_ok=True)
+
+    pool_persons = None
+    if args.persons_csv is None:
+        print(f"Generating {args.persons} persons with locale '{args.locale}'...")
+        pool_persons = generate_persons(args.persons, args.locale)
+
+    start = datetime.fromisoformat(args.start).replace(tzinfo=timezone.utc)
+    base, extra = divmod(args.messages, args.partitions)
+    tasks = [
+        {
+            "partition": p,
+            "partitions": args.partitions,
+            "quota": base + (1 if p < extra else 0),
+            "output": str(output),
+            "seed": args.seed,
+            "start": start.isoformat(),
+            "days": args.days,
+            "conversations_per_contact": args.conversations_per_contact,
+            "messages_median": args.messages_median,
+            "content": not args.no_content,
+            "rows_per_file": args.rows_per_file,
+            "compress": args.compress,
+            "persons_csv": args.persons_csv,
+        }
+        for p in range(args.partitions)
+    ]
+
+    print(f"Generating {args.messages:,} messages in {args.partitions} partitions with {args.workers} workers...")
+    started = time.perf_counter()
+    totals = {"contacts": 0, "conversations": 0, "messages": 0, "bytes": 0}
+    with multiprocessing.Pool(args.workers, initializer=_init_worker, initargs=(pool_persons,)) as pool:
+        for result in pool.imap_unordered(generate_partition, tasks):
+            for key in totals:
+                totals[key] += result[key]
+            elapsed = time.perf_counter() - started
+            print(f"  partition {result['partition']:>5}: {result['messages']:,} messages "
+                  f"({totals['messages'] / elapsed:,.0f} messages/sec overall)")
+
+    elapsed = time.perf_counter() - started
+    print(f"Saved {totals['messages']:,} messages in {totals['conversations']:,} conversations "
+          f"for {totals['contacts']:,} contacts to {output} ({totals['bytes'] / 1e6:,.1f} MB, {elapsed:.1f}s)")
+    if totals["messages"] < args.messages:
+        print(f"Warning: {args.messages - totals['messages']:,} of {args.messages:,} messages not generated: "
+              f"{args.persons_csv} has no persons", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
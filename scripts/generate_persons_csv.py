@@ -6,6 +6,24 @@ Usage:
     python scripts/generate_persons_csv.py --count 500
     python scripts/generate_persons_csv.py --count 200 --output data/persons.csv
     python scripts/generate_persons_csv.py --locale fr_FR --count 100
+    python scripts/generate_persons_csv.py --count 10 --snapshot .persons_snapshot.pkl
+    python scripts/generate_persons_csv.py --count 100000 --cache .dataset_cache
+
+Startup is kept short for harnesses that call the script many times: Faker is
+imported only when persons are generated, and only the providers used below
+are loaded, for the requested locale. ``import faker`` alone would list every
+locale by importing every provider (around 100 ms), so the generator module
+and the needed providers are imported directly. With ``--snapshot`` the
+generated rows are pickled; since the seed is fixed, later runs for the same
+locale, day and Faker version slice the rows they need from the snapshot
+without importing Faker at all; set PERSONS_SNAPSHOT to use one by default.
+With ``--cache`` (or PERSONS_CACHE) whole CSV files are kept in a
+content-addressed cache (scripts/dataset_cache.py) keyed by the count, locale,
+seed, day, this script and the Faker version, and a repeated run links the
+cached file to the output instead of generating it. Like the snapshot, the
+cache is keyed by day because birth and join dates are drawn relative to
+today.
+scripts/persons_startup_bench.py measures startup.
 
 Requirements:
     pip install faker
@@ -13,11 +31,11 @@ Requirements:
 
 import argparse
 import csv
+import os
 import random
+import sys
 from pathlib import Path
 
-from faker import Faker
-
 
 GENDERS = ["male", "female", "non-binary", "prefer not to say"]
 RELATIONSHIP_STATUSES = ["single", "married", "divorced", "widowed", "in a relationship"]
@@ -33,16 +51,152 @@ EDUCATION_LEVELS = [
 ]
 SUBSCRIPTION_TIERS = ["free", "basic", "pro", "enterprise"]
 
+SEED = 42
+# Providers the persons are drawn from, including those reached through format strings.
+PROVIDERS = ("person", "address", "phone_number", "internet", "company", "job", "lorem", "date_time")
+SNAPSHOT_ROWS = 1000            # rows generated into a new snapshot, at least
+
+# Imports needed only by some runs are made where they are used.
+
+
+def load_generator(locale: str):
+    """A Faker generator with only PROVIDERS, localized like ``Faker(locale)`` would localize them."""
+    import importlib
+    import importlib.util
+    import locale as pylocale
+
+    locale = pylocale.normalize(locale.replace("-", "_")).split(".")[0]
+    stub = "faker" not in sys.modules
+    if stub:
+        loaded = set(sys.modules)
+        spec = importlib.util.find_spec("faker")
+        if spec is None:
+            raise ModuleNotFoundError("No module named 'faker' (pip install faker)")
+        # An uninitialized package module: submodules import without faker/__init__.py and faker.config.
+        sys.modules["faker"] = importlib.util.module_from_spec(spec)
+    try:
+        from faker.generator import Generator
+
+        modules = [importlib.import_module(f"faker.providers.{name}") for name in PROVIDERS]
+        localized = [m for m in modules if getattr(m, "localized", False)]
+        if any(importlib.util.find_spec(f"{m.__name__}.{locale}") for m in localized):
+            generator = Generator(locale=locale, use_weighting=True)
+            for module in modules:
+                lang = None
+                if getattr(module, "localized", False):
+                    lang = locale if importlib.util.find_spec(f"{module.__name__}.{locale}") else (
+                        getattr(module, "default_locale", "") or "en_US")
+                    module = importlib.import_module(f"{module.__name__}.{lang}")
+                provider = module.Provider(generator)
+                provider.__use_weighting__ = True
+                provider.__provider__ = module.__name__.rsplit(".", 1)[0] if lang else module.__name__
+                provider.__lang__ = lang
+                generator.add_provider(provider)
+            return generator
+    finally:
+        if stub:
+            # Drop the stub and the submodules imported under it (only the stub has them as
+            # attributes), so a later ``import faker`` initializes the real package from scratch.
+            for name in set(sys.modules) - loaded:
+                if name == "faker" or name.startswith("faker."):
+                    del sys.modules[name]
+    # None of our providers knows the locale: let Faker validate it (and fall back as it does).
+    from faker import Factory
+    return Factory.create(locale, providers=[f"faker.providers.{name}" for name in PROVIDERS])
+
+
+def faker_version() -> str:
+    """The installed Faker version, read from its dist-info directory name (importlib.metadata takes ~70 ms)."""
+    import importlib.util
+
+    spec = importlib.util.find_spec("faker")
+    if spec is None:
+        raise ModuleNotFoundError("No module named 'faker' (pip install faker)")
+    infos = list(Path(spec.origin).parent.parent.glob("[Ff]aker-*.dist-info"))
+    if len(infos) == 1:
+        return infos[0].name[len("faker-"):-len(".dist-info")]
+    from importlib.metadata import version
+    return version("faker")
+
+
+def cache_params(count: int, locale: str) -> dict:
+    """Everything the generated CSV depends on, hashed into its cache key."""
+    import hashlib
+    from datetime import date
+
+    return {
+        "dataset": "persons",
+        "count": count,
+        "locale": locale,
+        "seed": SEED,
+        "date": date.today().isoformat(),   # birth_date and joined_date are relative to today
+        "code": hashlib.sha256(Path(__file__).read_bytes()).hexdigest(),
+        "faker": faker_version(),
+    }
+
+
+def _snapshot_key(locale: str) -> tuple:
+    import importlib.util
+    from datetime import date
+
+    origin = Path(importlib.util.find_spec("faker").origin).stat()
+    return (locale, SEED, date.today().isoformat(), origin.st_mtime_ns, origin.st_size,
+            Path(__file__).stat().st_mtime_ns)
+
+
+def _read_snapshot(path: Path, key: tuple, count: int) -> list[dict] | None:
+    import pickle
+
+    try:
+        with open(path, "rb") as f:
+            snapshot = pickle.load(f)
+    except (FileNotFoundError, EOFError, pickle.UnpicklingError):
+        return None
+    if snapshot.get("key") != key or len(snapshot["rows"]) < count:
+        return None
+    fields = snapshot["fields"]
+    return [dict(zip(fields, row)) for row in snapshot["rows"][:count]]
+
 
-def generate_persons(count: int, locale: str) -> list[dict]:
-    fake = Faker(locale)
-    Faker.seed(42)
-    random.seed(42)
+def _write_snapshot(path: Path, key: tuple, persons: list[dict]) -> None:
+    import pickle
+    import tempfile
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fields = list(persons[0].keys())
+    rows = [tuple(p[f] for f in fields) for p in persons]
+    fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    with os.fdopen(fd, "wb") as f:
+        pickle.dump({"key": key, "fields": fields, "rows": rows}, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp, path)      # concurrent runs never see a half-written snapshot
+
+
+def generate_persons(count: int, locale: str, snapshot: str | Path | None = None) -> list[dict]:
+    if snapshot is not None:
+        snapshot = Path(snapshot)
+        key = _snapshot_key(locale)
+        persons = _read_snapshot(snapshot, key, count)
+        if persons is not None:
+            return persons
+        persons = _generate(max(count, SNAPSHOT_ROWS), locale)
+        _write_snapshot(snapshot, key, persons)
+        return persons[:count]
+    return _generate(count, locale)
+
+
+def _generate(count: int, locale: str) -> list[dict]:
+    return build_persons(load_generator(locale), count, SEED)
+
+
+def build_persons(fake, count: int, seed=SEED) -> list[dict]:
+    """``count`` persons from a loaded generator, reseeded with ``seed`` so runs repeat exactly."""
+    fake.seed(seed)
+    rng = random.Random(seed)
 
     persons = []
 
     for _ in range(count):
-        gender = random.choice(GENDERS)
+        gender = rng.choice(GENDERS)
 
         if gender == "male":
             first_name = fake.first_name_male()
@@ -72,13 +226,13 @@ def generate_persons(count: int, locale: str) -> list[dict]:
             "bio": fake.sentence(nb_words=12),
             "language": fake.language_name(),
             "nationality": fake.country(),
-            "relationship_status": random.choice(RELATIONSHIP_STATUSES),
-            "blood_type": random.choice(BLOOD_TYPES),
-            "education_level": random.choice(EDUCATION_LEVELS),
-            "subscription_tier": random.choice(SUBSCRIPTION_TIERS),
-            "is_active": random.choice(["true", "false"]),
+            "relationship_status": rng.choice(RELATIONSHIP_STATUSES),
+            "blood_type": rng.choice(BLOOD_TYPES),
+            "education_level": rng.choice(EDUCATION_LEVELS),
+            "subscription_tier": rng.choice(SUBSCRIPTION_TIERS),
+            "is_active": rng.choice(["true", "false"]),
             "joined_date": joined_date.isoformat(),
-            "notes": fake.sentence(nb_words=8) if random.random() > 0.5 else "",
+            "notes": fake.sentence(nb_words=8) if rng.random() > 0.5 else "",
         }
 
         persons.append(person)
@@ -91,10 +245,13 @@ def write_csv(persons: list[dict], output_path: Path) -> None:
 
     fieldnames = list(persons[0].keys())
 
-    with open(output_path, "w", newline="", encoding="utf-8") as f:
+    # Written beside and renamed over the output: an output hard-linked from the cache is never rewritten.
+    tmp = output_path.with_name(f".{output_path.name}.{os.getpid()}.tmp")
+    with open(tmp, "w", newline="", encoding="utf-8") as f:
         writer = csv.DictWriter(f, fieldnames=fieldnames)
         writer.writeheader()
         writer.writerows(persons)
+    os.replace(tmp, output_path)
 
 
 def main() -> None:
@@ -117,12 +274,44 @@ def main() -> None:
         default="en_US",
         help="Faker locale, e.g. en_US, fr_FR, de_DE, ar_AA (default: en_US)",
     )
+    parser.add_argument(
+        "--snapshot",
+        type=str,
+        default=os.environ.get("PERSONS_SNAPSHOT"),
+        help="Pickle of generated rows to reuse between runs, rebuilt when the locale, day or Faker "
+             "changes (default: $PERSONS_SNAPSHOT, or none)",
+    )
+    parser.add_argument(
+        "--cache",
+        type=str,
+        default=os.environ.get("PERSONS_CACHE"),
+        help="Directory of generated CSVs reused by count, locale, seed, day, script and Faker version "
+             "(default: $PERSONS_CACHE, or none)",
+    )
+    parser.add_argument(
+        "--cache-size",
+        type=int,
+        default=2048,
+        help="MB the cache is kept under, least recently used files evicted first (default: 2048)",
+    )
     args = parser.parse_args()
 
     output_path = Path(args.output)
 
+    if args.cache:
+        from dataset_cache import DatasetCache
+
+        def build(path: Path) -> None:
+            print(f"Generating {args.count} persons with locale '{args.locale}'...")
+            write_csv(generate_persons(args.count, args.locale, args.snapshot), path)
+
+        cache = DatasetCache(args.cache, args.cache_size << 20)
+        hit = cache.get_or_create(cache_params(args.count, args.locale), output_path, build)
+        print(f"{'Reused cached' if hit else 'Cached'} {args.count} persons at {output_path}")
+        return
+
     print(f"Generating {args.count} persons with locale '{args.locale}'...")
-    persons = generate_persons(args.count, args.locale)
+    persons = generate_persons(args.count, args.locale, args.snapshot)
 
     write_csv(persons, output_path)
     print(f"Saved {len(persons)} persons to {output_path}")
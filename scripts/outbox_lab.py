@@ -0,0 +1,412 @@
+"""
+Transactional-outbox throughput lab: how fast can the outbox worker move
+person.created events from the outbox_events table into the broker?
+
+A producer thread writes generated persons and their person.created outbox
+events in the same transaction (the OutboxMiddleware pattern), at --rate
+events/sec. Outbox workers then drain the table into an in-process broker
+stand-in whose publish call costs one confirm round trip (--publish-rtt-ms),
+so publishing events one by one vs in batches behaves like RabbitMQ with
+publisher confirms.
+
+Worker strategies:
+    poll    one worker, SELECT pending rows every --poll-interval-ms
+    claim   --workers workers claiming disjoint batches (FOR UPDATE SKIP LOCKED
+            on Postgres, an atomic UPDATE ... RETURNING claim on SQLite)
+    notify  like claim, but workers sleep until the producer signals a commit
+            (LISTEN/NOTIFY on Postgres, an in-process condition on SQLite)
+
+Every combination of strategy, fetch batch size and publish mode is run on a
+fresh table; events/sec and end-to-end lag (commit -> broker) are reported.
+
+Usage:
+    python scripts/outbox_lab.py
+    python scripts/outbox_lab.py --events 100000 --rate 0 --batch-sizes 100,1000
+    python scripts/outbox_lab.py --strategies claim,notify --workers 8 --publish-rtt-ms 1
+    python scripts/outbox_lab.py --postgres postgresql://localhost/outbox_lab --json bench_output.json
+
+Requirements:
+    pip install faker
+    pip install "psycopg[binary]"   # only for --postgres
+"""
+
+import argparse
+import itertools
+import json
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+import uuid
+
+from generate_persons_csv import generate_persons
+
+
+SQLITE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS persons (
+    id TEXT PRIMARY KEY,
+    data TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS outbox_events (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    event_type TEXT NOT NULL,
+    aggregate_type TEXT NOT NULL,
+    aggregate_id TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'pending',
+    retry_count INTEGER NOT NULL DEFAULT 0,
+    created_at REAL NOT NULL,
+    published_at REAL
+);
+CREATE INDEX IF NOT EXISTS ix_outbox_status_created ON outbox_events (status, created_at);
+"""
+
+POSTGRES_SCHEMA = """
+CREATE TABLE IF NOT EXISTS persons (
+    id UUID PRIMARY KEY,
+    data JSONB NOT NULL
+);
+CREATE TABLE IF NOT EXISTS outbox_events (
+    id BIGSERIAL PRIMARY KEY,
+    event_type VARCHAR(100) NOT NULL,
+    aggregate_type VARCHAR(50) NOT NULL,
+    aggregate_id UUID NOT NULL,
+    payload JSONB NOT NULL,
+    status VARCHAR(20) NOT NULL DEFAULT 'pending',
+    retry_count INTEGER NOT NULL DEFAULT 0,
+    created_at DOUBLE PRECISION NOT NULL,
+    published_at DOUBLE PRECISION
+);
+CREATE INDEX IF NOT EXISTS ix_outbox_status_created ON outbox_events (status, created_at);
+"""
+
+
+class SQLiteStore:
+    name = "sqlite"
+
+    def __init__(self, path: str):
+        self.path = path
+        self._signal = threading.Condition()
+        self._commits = 0
+
+    def connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path, isolation_level=None, check_same_thread=False, timeout=30)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    def reset(self) -> None:
+        conn = self.connect()
+        conn.executescript("DROP TABLE IF EXISTS outbox_events; DROP TABLE IF EXISTS persons;" + SQLITE_SCHEMA)
+        conn.close()
+
+    def insert(self, conn: sqlite3.Connection, rows: list[tuple[str, str]], notify: bool) -> None:
+        now = time.time()
+        conn.execute("BEGIN IMMEDIATE")
+        conn.executemany("INSERT INTO persons (id, data) VALUES (?, ?)", rows)
+        conn.executemany(
+            "INSERT INTO outbox_events (event_type, aggregate_type, aggregate_id, payload, created_at) "
+            "VALUES ('person.created', 'person', ?, ?, ?)",
+            [(pid, data, now) for pid, data in rows],
+        )
+        conn.execute("COMMIT")
+        if notify:
+            with self._signal:
+                self._commits += 1
+                self._signal.notify_all()
+
+    def fetch(self, conn: sqlite3.Connection, limit: int) -> list[tuple]:
+        return conn.execute(
+            "SELECT id, created_at, payload FROM outbox_events WHERE status = 'pending' "
+            "ORDER BY created_at, id LIMIT ?", (limit,)
+        ).fetchall()
+
+    def claim(self, conn: sqlite3.Connection, limit: int) -> list[tuple]:
+        # SQLite has one writer at a time, so an atomic UPDATE ... RETURNING hands every
+        # worker a disjoint batch, which is what FOR UPDATE SKIP LOCKED buys on Postgres.
+        conn.execute("BEGIN IMMEDIATE")
+        rows = conn.execute(
+            "UPDATE outbox_events SET status = 'claimed' WHERE id IN ("
+            " SELECT id FROM outbox_events WHERE status = 'pending' ORDER BY created_at, id LIMIT ?"
+            ") RETURNING id, created_at, payload", (limit,)
+        ).fetchall()
+        conn.execute("COMMIT")
+        return rows
+
+    def mark_published(self, conn: sqlite3.Connection, ids: list[int]) -> None:
+        now = time.time()
+        conn.execute("BEGIN IMMEDIATE")
+        conn.executemany("UPDATE outbox_events SET status = 'published', published_at = ? WHERE id = ?",
+                         [(now, i) for i in ids])
+        conn.execute("COMMIT")
+
+    def listen(self, conn: sqlite3.Connection) -> None:
+        pass
+
+    def mark(self) -> int:
+        """Commits so far; taken before a claim, so ``wait`` sees a commit that lands after it."""
+        with self._signal:
+            return self._commits
+
+    def wait(self, conn: sqlite3.Connection, timeout: float, seen: int) -> None:
+        with self._signal:
+            self._signal.wait_for(lambda: self._commits != seen, timeout)
+
+    def wake_all(self) -> None:
+        with self._signal:
+            self._commits += 1
+            self._signal.notify_all()
+
+
+class PostgresStore:
+    name = "postgres"
+
+    def __init__(self, dsn: str):
+        import psycopg
+
+        self.psycopg = psycopg
+        self.dsn = dsn
+
+    def connect(self):
+        return self.psycopg.connect(self.dsn, autocommit=True)
+
+    def reset(self) -> None:
+        with self.connect() as conn:
+            conn.execute("DROP TABLE IF EXISTS outbox_events; DROP TABLE IF EXISTS persons;")
+            conn.execute(POSTGRES_SCHEMA)
+
+    def insert(self, conn, rows: list[tuple[str, str]], notify: bool) -> None:
+        now = time.time()
+        with conn.transaction(), conn.cursor() as cur:
+            cur.executemany("INSERT INTO persons (id, data) VALUES (%s, %s)", rows)
+            cur.executemany(
+                "INSERT INTO outbox_events (event_type, aggregate_type, aggregate_id, payload, created_at) "
+                "VALUES ('person.created', 'person', %s, %s, %s)",
+                [(pid, data, now) for pid, data in rows],
+            )
+            if notify:
+                cur.execute("SELECT pg_notify('outbox_channel', 'person')")
+
+    def fetch(self, conn, limit: int) -> list[tuple]:
+        return conn.execute(
+            "SELECT id, created_at, payload::text FROM outbox_events WHERE status = 'pending' "
+            "ORDER BY created_at, id LIMIT %s", (limit,)
+        ).fetchall()
+
+    def claim(self, conn, limit: int) -> list[tuple]:
+        return conn.execute(
+            "UPDATE outbox_events SET status = 'claimed' WHERE id IN ("
+            " SELECT id FROM outbox_events WHERE status = 'pending' ORDER BY created_at, id"
+            " LIMIT %s FOR UPDATE SKIP LOCKED"
+            ") RETURNING id, created_at, payload::text", (limit,)
+        ).fetchall()
+
+    def mark_published(self, conn, ids: list[int]) -> None:
+        conn.execute("UPDATE outbox_events SET status = 'published', published_at = %s WHERE id = ANY(%s)",
+                     (time.time(), ids))
+
+    def listen(self, conn) -> None:
+        conn.execute("LISTEN outbox_channel")
+
+    def mark(self) -> None:
+        return None  # notifications queue on the LISTEN connection, so none is missed between claim and wait
+
+    def wait(self, conn, timeout: float, seen: None) -> None:
+        for _ in conn.notifies(timeout=timeout, stop_after=1):
+            pass
+
+    def wake_all(self) -> None:
+        with self.connect() as conn:
+            conn.execute("SELECT pg_notify('outbox_channel', 'stop')")
+
+
+class BrokerStandIn:
+    """In-process RabbitMQ stand-in: one confirm round trip per publish call."""
+
+    def __init__(self, rtt_ms: float):
+        self.rtt = rtt_ms / 1000
+        self.lock = threading.Lock()
+        self.published = 0
+        self.calls = 0
+        self.lags: list[float] = []
+        self.first_at = None
+        self.last_at = None
+
+    def publish(self, events: list[tuple]) -> None:
+        for _, _, payload in events:
+            json.loads(payload)  # the worker deserializes and re-encodes each payload
+        if self.rtt:
+            time.sleep(self.rtt)
+        now = time.time()
+        with self.lock:
+            self.calls += 1
+            self.published += len(events)
+            self.lags.extend(now - created_at for _, created_at, _ in events)
+            if self.first_at is None:
+                self.first_at = now
+            self.last_at = now
+
+
+def produce(store, payloads: list[tuple[str, str]], rate: float, tx_size: int, notify: bool,
+            done: threading.Event) -> None:
+    conn = store.connect()
+    started = time.perf_counter()
+    for offset in range(0, len(payloads), tx_size):
+        if rate:
+            due = started + offset / rate
+            delay = due - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+        store.insert(conn, payloads[offset:offset + tx_size], notify)
+    conn.close()
+    done.set()
+
+
+def work(store, broker: BrokerStandIn, strategy: str, batch: int, publish_mode: str, poll_interval: float,
+         total: int, stop: threading.Event) -> None:
+    conn = store.connect()
+    if strategy == "notify":
+        store.listen(conn)
+    while not stop.is_set():
+        seen = store.mark() if strategy == "notify" else None
+        rows = store.fetch(conn, batch) if strategy == "poll" else store.claim(conn, batch)
+        if not rows:
+            if broker.published >= total:
+                stop.set()
+                store.wake_all()
+                break
+            if strategy == "notify":
+                store.wait(conn, 1.0, seen)
+            else:
+                time.sleep(poll_interval)
+            continue
+        if publish_mode == "batch":
+            broker.publish(rows)
+        else:
+            for row in rows:
+                broker.publish([row])
+        store.mark_published(conn, [row[0] for row in rows])
+    conn.close()
+
+
+def percentiles(values: list[float]) -> dict[str, float]:
+    if not values:
+        return {}
+    ordered = sorted(values)
+    last = len(ordered) - 1
+    points = {"p50": 50, "p90": 90, "p99": 99}
+    result = {name: round(ordered[min(last, int(pct / 100 * last + 0.5))] * 1000, 2) for name, pct in points.items()}
+    result["max"] = round(ordered[-1] * 1000, 2)
+    return result
+
+
+def run_config(store, payloads: list[tuple[str, str]], strategy: str, batch: int, publish_mode: str,
+               args: argparse.Namespace) -> dict:
+    store.reset()
+    broker = BrokerStandIn(args.publish_rtt_ms)
+    produced, stop = threading.Event(), threading.Event()
+    workers = 1 if strategy == "poll" else args.workers
+
+    if not args.rate:
+        # backlog mode: fill the table first, then time the drain
+        produce(store, payloads, 0, args.tx_size, False, produced)
+
+    started = time.perf_counter()
+    threads = [
+        threading.Thread(target=work, args=(store, broker, strategy, batch, publish_mode,
+                                            args.poll_interval_ms / 1000, len(payloads), stop))
+        for _ in range(workers)
+    ]
+    if args.rate:
+        threads.append(threading.Thread(
+            target=produce, args=(store, payloads, args.rate, args.tx_size, strategy == "notify", produced)))
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+
+    return {
+        "backend": store.name,
+        "strategy": strategy,
+        "workers": workers,
+        "fetch_batch": batch,
+        "publish": publish_mode,
+        "events": broker.published,
+        "publish_calls": broker.calls,
+        "seconds": round(elapsed, 3),
+        "events_per_sec": round(broker.published / elapsed, 1) if elapsed else 0,
+        "lag_ms": percentiles(broker.lags),
+    }
+
+
+def person_payloads(persons: list[dict], count: int) -> list[tuple[str, str]]:
+    payloads = []
+    for i in range(count):
+        person_id = str(uuid.UUID(int=i + 1))
+        event = {"person_id": person_id, **persons[i % len(persons)]}
+        payloads.append((person_id, json.dumps(event)))
+    return payloads
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark transactional-outbox polling and publish strategies")
+    parser.add_argument("--events", type=int, default=20000, help="person.created events per run (default: 20000)")
+    parser.add_argument("--rate", type=float, default=10000.0, help="Producer events/sec; 0 preloads a backlog and times the drain (default: 10000)")
+    parser.add_argument("--tx-size", type=int, default=1, help="Persons written per producer transaction (default: 1)")
+    parser.add_argument("--strategies", type=str, default="poll,claim,notify", help="Worker strategies to compare (default: poll,claim,notify)")
+    parser.add_argument("--batch-sizes", type=str, default="10,100,500", help="Fetch/claim batch sizes (default: 10,100,500)")
+    parser.add_argument("--publish-modes", type=str, default="single,batch", help="Publish one event per call or the whole batch (default: single,batch)")
+    parser.add_argument("--workers", type=int, default=4, help="Workers for claim/notify strategies (default: 4)")
+    parser.add_argument("--poll-interval-ms", type=float, default=50.0, help="Sleep between empty polls (default: 50)")
+    parser.add_argument("--publish-rtt-ms", type=float, default=0.3, help="Broker confirm round trip per publish call (default: 0.3)")
+    parser.add_argument("--sqlite", type=str, default=None, help="SQLite database path (default: a temp file)")
+    parser.add_argument("--postgres", type=str, default=None, help="Postgres DSN; uses real SKIP LOCKED and LISTEN/NOTIFY")
+    parser.add_argument("--persons", type=int, default=1000, help="Generated persons used as event payloads (default: 1000)")
+    parser.add_argument("--locale", type=str, default="en_US", help="Faker locale (default: en_US)")
+    parser.add_argument("--json", type=str, default=None, help="Optional path to write results as JSON")
+    args = parser.parse_args()
+
+    print(f"Generating {args.persons} persons with locale '{args.locale}'...")
+    payloads = person_payloads(generate_persons(args.persons, args.locale), args.events)
+
+    if args.postgres:
+        store = PostgresStore(args.postgres)
+        cleanup = None
+    else:
+        cleanup = None if args.sqlite else tempfile.mkdtemp(prefix="outbox_lab_")
+        store = SQLiteStore(args.sqlite or os.path.join(cleanup, "outbox.db"))
+
+    configs = itertools.product(
+        [s for s in args.strategies.split(",") if s],
+        [int(b) for b in args.batch_sizes.split(",") if b],
+        [m for m in args.publish_modes.split(",") if m],
+    )
+    mode = f"{args.rate:g} events/sec" if args.rate else "preloaded backlog"
+    print(f"Running {args.events} events per config on {store.name} ({mode})...")
+    print(f"  {'strategy':<8} {'batch':>6} {'publish':<7} {'events/sec':>11} {'calls':>7} "
+          f"{'lag p50':>9} {'lag p99':>9} {'lag max':>9}")
+
+    results = []
+    for strategy, batch, publish_mode in configs:
+        result = run_config(store, payloads, strategy, batch, publish_mode, args)
+        lag = result["lag_ms"]
+        print(f"  {strategy:<8} {batch:>6} {publish_mode:<7} {result['events_per_sec']:>11,.0f} "
+              f"{result['publish_calls']:>7} {lag.get('p50', 0):>7.1f}ms {lag.get('p99', 0):>7.1f}ms "
+              f"{lag.get('max', 0):>7.1f}ms")
+        results.append(result)
+
+    if cleanup:
+        for name in os.listdir(cleanup):
+            os.remove(os.path.join(cleanup, name))
+        os.rmdir(cleanup)
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+        print(f"Saved results to {args.json}")
+
+
+if __name__ == "__main__":
+    main()
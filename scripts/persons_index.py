@@ -0,0 +1,524 @@
+"""
+Full-text index over persons' text fields, with prefix search and BM25 ranking.
+
+The words of ``bio``, ``notes``, ``occupation``, ``company`` and ``city``
+are indexed into immutable segment files. Each segment holds a sorted term
+dictionary, posting lists of (document, term frequency) pairs
+delta-encoded as varints, document lengths and a few stored fields for
+display. Segments are memory-mapped at query time; a term is found by
+binary search over the dictionary, and a prefix (``addis*``, or every
+word with ``--prefix``) by the range of terms that start with it.
+Results are ranked by BM25 over the combined fields, a prefix query word
+scoring each document by its best-matching expansion.
+
+``build`` cuts the CSV into blocks of whole records and indexes them in
+worker processes, one segment per block. ``update`` indexes rows appended
+to the source since the last run (the manifest keeps the byte offset
+reached in each source) or a new source file. After both, runs of
+adjacent segments of the same size tier are merged, ``MERGE_FACTOR`` at a
+time: posting lists are copied byte for byte, only the first delta of each
+segment's list is re-encoded. A new manifest is renamed into place before
+merged segments are deleted, so readers always see a complete index.
+
+Usage:
+    python scripts/persons_index.py build scripts/sample_persons.csv --index build/persons_index
+    python scripts/persons_index.py update --index build/persons_index
+    python scripts/persons_index.py update more_persons.csv --index build/persons_index
+    python scripts/persons_index.py search --index build/persons_index "logistics addis*"
+    python scripts/persons_index.py search --index build/persons_index engin --prefix --all --limit 20
+    python scripts/persons_index.py merge --index build/persons_index --all
+"""
+
+import argparse
+import bisect
+import csv
+import heapq
+import io
+import json
+import math
+import mmap
+import multiprocessing
+import os
+import re
+import struct
+import tempfile
+import time
+from array import array
+from collections import Counter, defaultdict
+from itertools import accumulate
+from pathlib import Path
+
+from csv_blocks import BLOCK_SIZE, kilobytes, read_blocks, windowed
+
+
+FIELDS = ("bio", "notes", "occupation", "company", "city")
+STORED = ("first_name", "last_name", "email", "city", "company", "occupation")
+MERGE_FACTOR = 8                # adjacent segments of one size tier merged at a time
+MAX_EXPANSIONS = 256            # terms a prefix expands to, the most frequent first
+BM25_K1 = 1.2
+BM25_B = 0.75
+MANIFEST = "manifest.json"
+
+MAGIC = b"PERSIDX1"
+SECTIONS = ("terms", "term_offsets", "postings_offsets", "df", "last_doc", "postings",
+            "doc_lengths", "stored_offsets", "stored")
+_HEADER = struct.Struct("<8sIIQ" + "QQ" * len(SECTIONS))
+_TOKEN = re.compile(r"\w\w+")
+_QUERY_TOKEN = re.compile(r"\w+\*?")
+
+
+def tokenize(text: str) -> list[str]:
+    return _TOKEN.findall(text.lower())
+
+
+# ── Varints ──
+
+def _put_varint(out: bytearray, n: int) -> None:
+    while n >= 0x80:
+        out.append((n & 0x7F) | 0x80)
+        n >>= 7
+    out.append(n)
+
+
+def _varints(buf) -> list[int]:
+    out = []
+    n = shift = 0
+    for b in buf:
+        if b & 0x80:
+            n |= (b & 0x7F) << shift
+            shift += 7
+        else:
+            out.append(n | (b << shift))
+            n = shift = 0
+    return out
+
+
+def _first_varint(buf) -> tuple[int, int]:
+    """The first varint in ``buf`` and its length in bytes."""
+    n = shift = 0
+    for i, b in enumerate(buf):
+        n |= (b & 0x7F) << shift
+        if not b & 0x80:
+            return n, i + 1
+        shift += 7
+    raise ValueError("truncated varint")
+
+
+# ── Segments ──
+
+def write_segment(path: Path, terms: list[bytes], postings: list[bytes], df: list[int], last_doc: list[int],
+                  doc_lengths, stored: list[bytes]) -> None:
+    """Write a segment file atomically; ``terms`` must be sorted and ``postings`` already encoded."""
+    sections = {
+        "terms": b"".join(terms),
+        "term_offsets": array("I", accumulate((len(t) for t in terms), initial=0)).tobytes(),
+        "postings_offsets": array("Q", accumulate((len(p) for p in postings), initial=0)).tobytes(),
+        "df": array("I", df).tobytes(),
+        "last_doc": array("I", last_doc).tobytes(),
+        "postings": b"".join(postings),
+        "doc_lengths": array("H", doc_lengths).tobytes(),
+        "stored_offsets": array("Q", accumulate((len(s) for s in stored), initial=0)).tobytes(),
+        "stored": b"".join(stored),
+    }
+    table, body, offset = [], bytearray(), _HEADER.size
+    for name in SECTIONS:
+        pad = -offset % 8                   # keep every array section 8-byte aligned for memoryview.cast
+        body += b"\0" * pad
+        offset += pad
+        table += [offset, len(sections[name])]
+        body += sections[name]
+        offset += len(sections[name])
+    header = _HEADER.pack(MAGIC, len(terms), len(stored), sum(doc_lengths), *table)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    with os.fdopen(fd, "wb") as f:
+        f.write(header)
+        f.write(body)
+    os.chmod(tmp, 0o644)
+    os.replace(tmp, path)
+
+
+class Segment:
+    """A memory-mapped segment file."""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        with open(path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self._view = view = memoryview(self._mmap)
+        magic, self.term_count, self.doc_count, self.total_length, *table = _HEADER.unpack_from(view)
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not a persons index segment")
+        parts = {name: view[table[2 * i]:table[2 * i] + table[2 * i + 1]] for i, name in enumerate(SECTIONS)}
+        self.terms = parts["terms"]
+        self.term_offsets = parts["term_offsets"].cast("I")
+        self.postings_offsets = parts["postings_offsets"].cast("Q")
+        self.df = parts["df"].cast("I")
+        self.last_doc = parts["last_doc"].cast("I")
+        self.postings_blob = parts["postings"]
+        self.doc_lengths = parts["doc_lengths"].cast("H")
+        self.stored_offsets = parts["stored_offsets"].cast("Q")
+        self.stored_blob = parts["stored"]
+
+    def term(self, i: int) -> bytes:
+        return bytes(self.terms[self.term_offsets[i]:self.term_offsets[i + 1]])
+
+    def lower_bound(self, key: bytes) -> int:
+        lo, hi = 0, self.term_count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self.term(mid) < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def find(self, term: bytes) -> int:
+        i = self.lower_bound(term)
+        return i if i < self.term_count and self.term(i) == term else -1
+
+    def prefix_range(self, prefix: bytes) -> range:
+        # 0xFF never occurs in UTF-8, so prefix + 0xFF sorts after every term starting with prefix
+        return range(self.lower_bound(prefix), self.lower_bound(prefix + b"\xff"))
+
+    def raw_postings(self, i: int):
+        return self.postings_blob[self.postings_offsets[i]:self.postings_offsets[i + 1]]
+
+    def postings(self, i: int) -> tuple[list[int], list[int]]:
+        """Document ids and term frequencies of term ``i``."""
+        values = _varints(self.raw_postings(i))
+        return list(accumulate(values[0::2])), values[1::2]
+
+    def stored(self, doc: int) -> dict:
+        blob = bytes(self.stored_blob[self.stored_offsets[doc]:self.stored_offsets[doc + 1]])
+        return dict(zip(STORED, blob.decode("utf-8").split("\x1f")))
+
+    def close(self) -> None:
+        for name in ("terms", "term_offsets", "postings_offsets", "df", "last_doc", "postings_blob",
+                     "doc_lengths", "stored_offsets", "stored_blob", "_view"):
+            getattr(self, name).release()
+        self._mmap.close()
+
+
+# ── Building ──
+
+def build_segment(job) -> dict:
+    """Index one block of CSV records into a new segment file; return its manifest entry."""
+    block, columns, path = job
+    text_cols = [columns[name] for name in FIELDS if name in columns]
+    stored_cols = [columns.get(name) for name in STORED]
+    index = defaultdict(list)
+    doc_lengths, stored = [], []
+    doc = 0
+    for row in csv.reader(io.StringIO(block.decode("utf-8"))):
+        if not row:
+            continue
+        tokens = tokenize(" ".join(row[c] for c in text_cols if c < len(row)))
+        for term, tf in Counter(tokens).items():
+            index[term].append((doc, tf))
+        doc_lengths.append(min(len(tokens), 0xFFFF))
+        stored.append("\x1f".join(row[c] if c is not None and c < len(row) else "" for c in stored_cols)
+                      .encode("utf-8"))
+        doc += 1
+
+    entries = sorted((term.encode("utf-8"), plist) for term, plist in index.items())
+    postings, df, last_doc = [], [], []
+    for _term, plist in entries:
+        out = bytearray()
+        previous = 0
+        for d, tf in plist:
+            _put_varint(out, d - previous)
+            _put_varint(out, tf)
+            previous = d
+        postings.append(bytes(out))
+        df.append(len(plist))
+        last_doc.append(previous)
+    write_segment(Path(path), [t for t, _ in entries], postings, df, last_doc, doc_lengths, stored)
+    return {"name": Path(path).name, "docs": len(stored), "length": sum(doc_lengths)}
+
+
+def _term_stream(seg: Segment, n: int):
+    for i in range(seg.term_count):
+        yield seg.term(i), n, i
+
+
+def merge_segments(segments: list[Segment], path: Path) -> dict:
+    """Merge adjacent segments, in order, into one new segment at ``path``."""
+    bases = list(accumulate((s.doc_count for s in segments), initial=0))
+    terms, postings, df, last_doc = [], [], [], []
+    streams = [_term_stream(seg, n) for n, seg in enumerate(segments)]
+    current, parts, count, last = None, [], 0, -1
+    for term, n, i in heapq.merge(*streams):
+        if term != current:
+            if current is not None:
+                terms.append(current)
+                postings.append(b"".join(parts))
+                df.append(count)
+                last_doc.append(last)
+            current, parts, count, last = term, [], 0, -1
+        seg = segments[n]
+        raw = seg.raw_postings(i)
+        first, size = _first_varint(raw)
+        first += bases[n]
+        head = bytearray()
+        _put_varint(head, first - last if last >= 0 else first)     # re-base the first delta only
+        parts.append(bytes(head))
+        parts.append(bytes(raw[size:]))
+        count += seg.df[i]
+        last = bases[n] + seg.last_doc[i]
+    if current is not None:
+        terms.append(current)
+        postings.append(b"".join(parts))
+        df.append(count)
+        last_doc.append(last)
+
+    doc_lengths = array("H")
+    stored = []
+    for seg in segments:
+        doc_lengths.extend(seg.doc_lengths)
+        blob, offsets = seg.stored_blob, seg.stored_offsets
+        stored.extend(bytes(blob[offsets[d]:offsets[d + 1]]) for d in range(seg.doc_count))
+    write_segment(path, terms, postings, df, last_doc, doc_lengths, stored)
+    return {"name": path.name, "docs": len(stored), "length": sum(doc_lengths)}
+
+
+# ── Index directory ──
+
+def _read_manifest(index_dir: Path) -> dict:
+    try:
+        return json.loads((index_dir / MANIFEST).read_text())
+    except FileNotFoundError:
+        return {"sources": {}, "segments": [], "next_segment": 0}
+
+
+def _write_manifest(index_dir: Path, manifest: dict) -> None:
+    fd, tmp = tempfile.mkstemp(dir=index_dir, suffix=".tmp")
+    with os.fdopen(fd, "w") as f:
+        json.dump(manifest, f, indent=1)
+    os.chmod(tmp, 0o644)
+    os.replace(tmp, index_dir / MANIFEST)
+
+
+def _segment_name(manifest: dict) -> str:
+    manifest["next_segment"] += 1
+    return f"seg_{manifest['next_segment']:06d}.idx"
+
+
+def index_source(index_dir, source, workers: int, block_size=BLOCK_SIZE) -> dict:
+    """Index the rows of ``source`` not indexed yet, then merge segments; return what was added."""
+    index_dir = Path(index_dir)
+    index_dir.mkdir(parents=True, exist_ok=True)
+    manifest = _read_manifest(index_dir)
+    key = str(Path(source).resolve())
+    started = time.perf_counter()
+    with open(source, "rb") as f:
+        header = next(csv.reader([f.readline().decode("utf-8")]))
+        columns = {name: i for i, name in enumerate(header)}
+        if not any(name in columns for name in FIELDS):
+            raise SystemExit(f"{source} has none of the indexed columns: {', '.join(FIELDS)}")
+        f.seek(max(manifest["sources"].get(key, 0), f.tell()))
+        start = f.tell()
+        # A trailing record without its newline may still be being written: leave it for the next update.
+        blocks = read_blocks(f, block_size, tail=False)
+        jobs = []
+        ends = []
+
+        def job_stream():
+            for block, end in blocks:
+                ends.append(start + end)
+                jobs.append(_segment_name(manifest))
+                yield block, columns, str(index_dir / jobs[-1])
+
+        if workers <= 1:
+            results = list(map(build_segment, job_stream()))
+        else:
+            with multiprocessing.Pool(workers) as pool:
+                results = list(windowed(pool, build_segment, job_stream(), workers * 2))
+    added = [r for r in results if r["docs"]]
+    for r in results:
+        if not r["docs"]:
+            (index_dir / r["name"]).unlink(missing_ok=True)
+    manifest["segments"].extend(added)
+    if ends:
+        manifest["sources"][key] = ends[-1]
+    _write_manifest(index_dir, manifest)
+    merged = merge_policy(index_dir)
+    return {"docs": sum(r["docs"] for r in added), "segments": len(added), "merges": merged,
+            "seconds": time.perf_counter() - started}
+
+
+def _tier(docs: int) -> int:
+    return int(math.log(max(docs, 1), MERGE_FACTOR))
+
+
+def merge_policy(index_dir, merge_all: bool = False) -> int:
+    """Merge runs of MERGE_FACTOR adjacent same-tier segments (or everything) until none are left."""
+    index_dir = Path(index_dir)
+    merges = 0
+    while True:
+        manifest = _read_manifest(index_dir)
+        entries = manifest["segments"]
+        run = None
+        if merge_all:
+            if len(entries) > 1:
+                run = (0, len(entries))
+        else:
+            start = 0
+            for i in range(1, len(entries) + 1):
+                if i == len(entries) or _tier(entries[i]["docs"]) != _tier(entries[start]["docs"]):
+                    if i - start >= MERGE_FACTOR:
+                        run = (start, start + MERGE_FACTOR)
+                        break
+                    start = i
+        if run is None:
+            return merges
+        lo, hi = run
+        segments = [Segment(index_dir / e["name"]) for e in entries[lo:hi]]
+        try:
+            entry = merge_segments(segments, index_dir / _segment_name(manifest))
+        finally:
+            for seg in segments:
+                seg.close()
+        old = entries[lo:hi]
+        manifest["segments"] = entries[:lo] + [entry] + entries[hi:]
+        _write_manifest(index_dir, manifest)
+        for e in old:                         # readers holding a mapping keep the file until they close it
+            (index_dir / e["name"]).unlink(missing_ok=True)
+        merges += 1
+
+
+# ── Searching ──
+
+class Index:
+    """Every segment of an index directory, memory-mapped, with the collection statistics BM25 needs."""
+
+    def __init__(self, index_dir):
+        self.dir = Path(index_dir)
+        manifest = _read_manifest(self.dir)
+        self.segments = [Segment(self.dir / e["name"]) for e in manifest["segments"]]
+        self.bases = list(accumulate((s.doc_count for s in self.segments), initial=0))
+        self.docs = self.bases[-1]
+        self.avg_length = sum(s.total_length for s in self.segments) / self.docs if self.docs else 0.0
+
+    def close(self) -> None:
+        for seg in self.segments:
+            seg.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def expand(self, word: str, prefix: bool) -> dict[bytes, list[tuple[int, int]]]:
+        """``{term: [(segment, term index), ...]}`` for a query word, exact or as a prefix."""
+        key = word.encode("utf-8")
+        found = defaultdict(list)
+        for n, seg in enumerate(self.segments):
+            if prefix:
+                for i in seg.prefix_range(key):
+                    found[seg.term(i)].append((n, i))
+            else:
+                i = seg.find(key)
+                if i >= 0:
+                    found[key].append((n, i))
+        if len(found) > MAX_EXPANSIONS:
+            by_df = sorted(found, key=lambda t: -sum(self.segments[n].df[i] for n, i in found[t]))
+            found = {t: found[t] for t in by_df[:MAX_EXPANSIONS]}
+        return found
+
+    def search(self, query: str, limit: int = 10, prefix: bool = False, require_all: bool = False) -> list[dict]:
+        words = [w.lower() for w in _QUERY_TOKEN.findall(query)]
+        scores = defaultdict(float)
+        matched = Counter()
+        k1, b = BM25_K1, BM25_B
+        norm = k1 / self.avg_length * b if self.avg_length else 0.0
+        for word in words:
+            is_prefix = prefix or word.endswith("*")
+            best = {}
+            for term, places in self.expand(word.rstrip("*"), is_prefix).items():
+                df = sum(self.segments[n].df[i] for n, i in places)
+                idf = math.log(1 + (self.docs - df + 0.5) / (df + 0.5))
+                for n, i in places:
+                    seg, base = self.segments[n], self.bases[n]
+                    lengths = seg.doc_lengths
+                    docs, tfs = seg.postings(i)
+                    for doc, tf in zip(docs, tfs):
+                        score = idf * tf * (k1 + 1) / (tf + k1 * (1 - b) + norm * lengths[doc])
+                        gid = base + doc
+                        if score > best.get(gid, 0.0):
+                            best[gid] = score
+            for gid, score in best.items():
+                scores[gid] += score
+                matched[gid] += 1
+        if require_all:
+            scores = {gid: s for gid, s in scores.items() if matched[gid] == len(words)}
+        top = heapq.nlargest(limit, scores.items(), key=lambda item: (item[1], -item[0]))
+        return [{"row": gid + 1, "score": round(score, 3), **self.stored(gid)} for gid, score in top]
+
+    def stored(self, gid: int) -> dict:
+        n = bisect.bisect_right(self.bases, gid) - 1
+        return self.segments[n].stored(gid - self.bases[n])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Full-text index over persons' text fields")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    build = commands.add_parser("build", help="Index a persons CSV into a new index directory")
+    build.add_argument("source", help="Persons CSV (as written by scripts/generate_persons_csv.py)")
+    update = commands.add_parser("update", help="Index rows appended to the indexed sources, or a new CSV")
+    update.add_argument("source", nargs="?", default=None, help="CSV to index (default: every indexed source)")
+    for sub in (build, update):
+        sub.add_argument("--block-size", type=kilobytes, default=BLOCK_SIZE >> 10,
+                         help=f"KB of CSV per segment (default: {BLOCK_SIZE >> 10})")
+        sub.add_argument(
+            "--workers",
+            type=int,
+            default=multiprocessing.cpu_count(),
+            help="Worker processes (default: CPU count)",
+        )
+    search = commands.add_parser("search", help="Rank persons by BM25 for a query")
+    search.add_argument("query", nargs="+", help="Query words; end a word with * to match it as a prefix")
+    search.add_argument("--limit", type=int, default=10, help="Results to show (default: 10)")
+    search.add_argument("--prefix", action="store_true", help="Match every query word as a prefix")
+    search.add_argument("--all", action="store_true", help="Only return persons matching every word")
+    search.add_argument("--json", action="store_true", help="Print results as JSON")
+    merge = commands.add_parser("merge", help="Merge segments by the merge policy, or all of them")
+    merge.add_argument("--all", action="store_true", help="Merge every segment into one")
+    for sub in (build, update, search, merge):
+        sub.add_argument("--index", type=str, required=True, help="Index directory")
+    args = parser.parse_args()
+
+    index_dir = Path(args.index)
+    if args.command == "build":
+        if (index_dir / MANIFEST).exists():
+            parser.error(f"{index_dir} already holds an index; use update to add rows")
+        stats = index_source(index_dir, args.source, args.workers, args.block_size << 10)
+        print(f"Indexed {stats['docs']} persons into {stats['segments']} segments "
+              f"({stats['merges']} merges) in {stats['seconds']:.2f} s -> {index_dir}")
+    elif args.command == "update":
+        sources = [args.source] if args.source else list(_read_manifest(index_dir)["sources"])
+        for source in sources:
+            stats = index_source(index_dir, source, args.workers, args.block_size << 10)
+            print(f"{source}: indexed {stats['docs']} new persons into {stats['segments']} segments "
+                  f"({stats['merges']} merges) in {stats['seconds']:.2f} s")
+    elif args.command == "merge":
+        merges = merge_policy(index_dir, merge_all=args.all)
+        print(f"{merges} merges; {len(_read_manifest(index_dir)['segments'])} segments left")
+    else:
+        started = time.perf_counter()
+        with Index(index_dir) as index:
+            results = index.search(" ".join(args.query), args.limit, args.prefix, args.all)
+            elapsed = (time.perf_counter() - started) * 1000
+            if args.json:
+                print(json.dumps(results, indent=1, ensure_ascii=False))
+                return
+            for rank, r in enumerate(results, 1):
+                print(f"{rank:>3}. {r['score']:>7.3f}  row {r['row']:<9} {r['first_name']} {r['last_name']} "
+                      f"<{r['email']}>  {r['occupation']} @ {r['company']}, {r['city']}")
+            print(f"{len(results)} results from {index.docs} persons in {len(index.segments)} segments, "
+                  f"{elapsed:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
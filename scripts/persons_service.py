@@ -0,0 +1,287 @@
+"""
+Serve generated persons over HTTP, streamed from a pool of warm generators.
+
+Load-test processes that each call ``generate_persons()`` pay Faker's
+startup and generation cost over and over. This service pays it once: a
+process pool loads a generator per locale when it starts and keeps it, and
+``GET /persons`` streams rows to any number of clients as chunked NDJSON or
+CSV over keep-alive connections.
+
+A request is cut into chunks of ``CHUNK_ROWS`` rows; the workers generate
+and serialize chunks in parallel and the handler writes them in order.
+At most ``--window`` chunks of a response are in flight, and each write
+waits for the socket to drain, so a slow client slows its own generation
+down instead of piling rows up in memory. Chunk 0 is seeded with ``seed``
+itself (a request of up to CHUNK_ROWS rows returns exactly what
+generate_persons_csv.py writes for that seed) and chunk k with
+``"<seed>/<k>"``, so a response depends only on its parameters, never on
+the number of workers.
+
+    GET /persons?count=10000&seed=42&locale=fr_FR&columns=first_name,email&format=csv
+    GET /health
+
+``format`` is ``ndjson`` (default) or ``csv``; ``columns`` defaults to all.
+
+Usage:
+    python scripts/persons_service.py
+    python scripts/persons_service.py --port 8766 --workers 4 --locales en_US,fr_FR
+    python scripts/persons_service.py --bench --clients 16 --count 20000
+    python scripts/persons_service.py --bench --target http://localhost:8766 --json bench_output.json
+
+Requirements:
+    pip install faker aiohttp
+"""
+
+import argparse
+import asyncio
+import csv
+import io
+import json
+import multiprocessing
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from aiohttp import ClientSession, ClientTimeout, TCPConnector, web
+
+from generate_persons_csv import SEED, build_persons, load_generator
+
+
+CHUNK_ROWS = 500
+MAX_COUNT = 10_000_000
+FORMATS = {"ndjson": "application/x-ndjson", "csv": "text/csv"}
+
+
+# ── Pool workers ──
+
+_generators: dict = {}
+
+
+def _generator(locale: str):
+    fake = _generators.get(locale)
+    if fake is None:
+        fake = _generators[locale] = load_generator(locale)
+    return fake
+
+
+def _warm(locales: list[str]) -> None:
+    for locale in locales:
+        _generator(locale)
+
+
+def _columns(locale: str) -> list[str]:
+    return list(build_persons(_generator(locale), 1)[0])
+
+
+def _chunk(job) -> bytes:
+    """Generate and serialize chunk ``index`` of a response."""
+    locale, seed, index, rows, columns, fmt = job
+    persons = build_persons(_generator(locale), rows, seed if index == 0 else f"{seed}/{index}")
+    if fmt == "ndjson":
+        return "".join(json.dumps({c: p[c] for c in columns}, ensure_ascii=False) + "\n"
+                       for p in persons).encode("utf-8")
+    buf = io.StringIO()
+    writer = csv.writer(buf)
+    if index == 0:
+        writer.writerow(columns)
+    writer.writerows([p[c] for c in columns] for p in persons)
+    return buf.getvalue().encode("utf-8")
+
+
+# ── Service ──
+
+def make_app(workers: int, locales: list[str], window: int) -> web.Application:
+    app = web.Application()
+
+    async def start_pool(app: web.Application) -> None:
+        app["pool"] = ProcessPoolExecutor(workers, initializer=_warm, initargs=(locales,))
+        app["columns"] = await asyncio.get_running_loop().run_in_executor(app["pool"], _columns, locales[0])
+
+    async def stop_pool(app: web.Application) -> None:
+        app["pool"].shutdown(cancel_futures=True)
+
+    def bad_request(message: str) -> web.HTTPBadRequest:
+        return web.HTTPBadRequest(text=json.dumps({"error": message}), content_type="application/json")
+
+    async def persons(request: web.Request) -> web.StreamResponse:
+        q = request.query
+        try:
+            count = int(q.get("count", 100))
+            seed = int(q.get("seed", SEED))
+        except ValueError:
+            raise bad_request("count and seed must be integers")
+        if not 0 <= count <= MAX_COUNT:
+            raise bad_request(f"count must be between 0 and {MAX_COUNT}")
+        fmt = q.get("format", "ndjson")
+        if fmt not in FORMATS:
+            raise bad_request(f"format must be one of: {', '.join(FORMATS)}")
+        columns = [c for c in q.get("columns", "").split(",") if c] or app["columns"]
+        unknown = [c for c in columns if c not in app["columns"]]
+        if unknown:
+            raise bad_request(f"unknown columns: {', '.join(unknown)}")
+        locale = q.get("locale", locales[0])
+
+        loop = asyncio.get_running_loop()
+        jobs = ((locale, seed, i, min(CHUNK_ROWS, count - start), columns, fmt)
+                for i, start in enumerate(range(0, count, CHUNK_ROWS)))
+        pending = deque()
+
+        def submit() -> None:
+            job = next(jobs, None)
+            if job is not None:
+                pending.append(loop.run_in_executor(app["pool"], _chunk, job))
+
+        for _ in range(window):
+            submit()
+        response = web.StreamResponse(headers={"Content-Type": f"{FORMATS[fmt]}; charset=utf-8",
+                                               "X-Persons-Count": str(count)})
+        response.enable_chunked_encoding()
+        try:
+            try:
+                # The first chunk is awaited before the headers go out, so a bad locale is still a 400.
+                data = await pending.popleft() if pending else (",".join(columns) + "\r\n").encode() * (fmt == "csv")
+            except AttributeError as exc:
+                raise bad_request(f"locale {locale!r}: {exc}")
+            await response.prepare(request)
+            while True:
+                submit()
+                await response.write(data)      # waits for the socket to drain
+                if not pending:
+                    break
+                data = await pending.popleft()
+            await response.write_eof()
+        except ConnectionResetError:
+            pass                                # the client hung up mid-stream
+        finally:
+            for future in pending:              # client gone or error: drop chunks not yet started
+                future.cancel()
+        return response
+
+    async def health(request: web.Request) -> web.Response:
+        return web.json_response({"workers": workers, "locales": locales, "columns": app["columns"]})
+
+    app.on_startup.append(start_pool)
+    app.on_cleanup.append(stop_pool)
+    app.router.add_get("/persons", persons)
+    app.router.add_get("/health", health)
+    return app
+
+
+def serve(host: str, port: int, workers: int, locales: list[str], window: int, keepalive: float) -> None:
+    web.run_app(make_app(workers, locales, window), host=host, port=port, print=None, access_log=None,
+                keepalive_timeout=keepalive)
+
+
+# ── Benchmark client ──
+
+async def wait_for_service(target: str, timeout: float = 30.0) -> None:
+    deadline = time.monotonic() + timeout
+    async with ClientSession() as session:
+        while True:
+            try:
+                async with session.get(target + "/health") as resp:
+                    if resp.status == 200:
+                        return
+            except OSError:
+                if time.monotonic() > deadline:
+                    raise
+            await asyncio.sleep(0.05)
+
+
+async def bench(target: str, clients: int, requests: int, count: int, fmt: str, locale: str) -> dict:
+    """``clients`` concurrent clients, each streaming ``requests`` responses over one keep-alive connection."""
+    first_byte, totals = [], []
+
+    async def client(n: int) -> int:
+        rows = 0
+        async with ClientSession(connector=TCPConnector(limit=1), timeout=ClientTimeout(total=None)) as session:
+            for r in range(requests):
+                params = {"count": count, "seed": n * requests + r, "format": fmt, "locale": locale}
+                started = time.perf_counter()
+                async with session.get(target + "/persons", params=params) as resp:
+                    resp.raise_for_status()
+                    seen = False
+                    async for chunk in resp.content.iter_any():
+                        if not seen:
+                            first_byte.append((time.perf_counter() - started) * 1000)
+                            seen = True
+                        rows += chunk.count(b"\n")
+                totals.append((time.perf_counter() - started) * 1000)
+        return rows - requests * (fmt == "csv")
+
+    started = time.perf_counter()
+    rows = sum(await asyncio.gather(*(client(n) for n in range(clients))))
+    seconds = time.perf_counter() - started
+    first_byte.sort()
+    totals.sort()
+    return {
+        "clients": clients,
+        "requests": clients * requests,
+        "rows": rows,
+        "seconds": round(seconds, 3),
+        "rows_per_sec": round(rows / seconds),
+        "first_byte_ms_p50": round(first_byte[len(first_byte) // 2], 1),
+        "response_ms_p50": round(totals[len(totals) // 2], 1),
+        "response_ms_max": round(totals[-1], 1),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Stream generated persons over HTTP from warm generators")
+    parser.add_argument("--host", type=str, default="127.0.0.1", help="Host to bind (default: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=8766, help="Port to bind (default: 8766)")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=multiprocessing.cpu_count(),
+        help="Worker processes (default: CPU count)",
+    )
+    parser.add_argument("--locales", type=str, default="en_US",
+                        help="Comma-separated locales to warm at startup; the first is the default (default: en_US)")
+    parser.add_argument("--window", type=int, default=4, help="Chunks of one response generated ahead (default: 4)")
+    parser.add_argument("--keepalive", type=float, default=75.0, help="Keep-alive timeout in seconds (default: 75)")
+    parser.add_argument("--bench", action="store_true", help="Stream from the service with concurrent clients and report")
+    parser.add_argument("--target", type=str, default=None, help="Service base URL for --bench; starts one if omitted")
+    parser.add_argument("--clients", type=int, default=8, help="Concurrent benchmark clients (default: 8)")
+    parser.add_argument("--requests", type=int, default=4, help="Requests per benchmark client (default: 4)")
+    parser.add_argument("--count", type=int, default=5000, help="Persons per benchmark request (default: 5000)")
+    parser.add_argument("--format", type=str, default="ndjson", choices=sorted(FORMATS), help="Benchmark format (default: ndjson)")
+    parser.add_argument("--json", type=str, default=None, help="Optional path to write the benchmark report as JSON")
+    args = parser.parse_args()
+
+    locales = [locale for locale in args.locales.split(",") if locale]
+    if not args.bench:
+        print(f"Serving persons on http://{args.host}:{args.port}/persons with {args.workers} workers")
+        serve(args.host, args.port, args.workers, locales, args.window, args.keepalive)
+        return
+
+    service = None
+    target = args.target
+    if target is None:
+        target = f"http://{args.host}:{args.port}"
+        # Not a daemon: the service starts its own worker processes.
+        service = multiprocessing.Process(
+            target=serve, args=(args.host, args.port, args.workers, locales, args.window, args.keepalive))
+        service.start()
+        asyncio.run(wait_for_service(target))
+    target = target.rstrip("/")
+
+    print(f"Streaming {args.clients}x{args.requests} requests of {args.count} persons from {target}...")
+    try:
+        report = asyncio.run(bench(target, args.clients, args.requests, args.count, args.format, locales[0]))
+    finally:
+        if service is not None:
+            service.terminate()
+            service.join()
+
+    print(f"{report['rows']} rows in {report['seconds']}s ({report['rows_per_sec']} rows/sec); "
+          f"first byte p50 {report['first_byte_ms_p50']} ms, response p50 {report['response_ms_p50']} ms, "
+          f"max {report['response_ms_max']} ms")
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"Saved report to {args.json}")
+
+
+if __name__ == "__main__":
+    main()
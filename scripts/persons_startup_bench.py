@@ -0,0 +1,108 @@
+"""
+Benchmark the startup time of generate_persons_csv.py.
+
+Each case runs the script in a fresh interpreter, the way a test harness
+calls it, and records wall time from spawn to exit. Reported per case: min,
+median and p95 over ``--runs`` runs, next to the bare interpreter and to
+``from faker import Faker; Faker(locale)`` (what every run used to pay
+before generating anything). ``--help`` and small runs from a snapshot are
+expected to finish within ``--target-ms``, and the exit status is 1 if any of
+them does not. Small runs without a snapshot still import Faker's
+generator and providers (about 60 ms on top of the interpreter), so they
+are reported against the target but do not gate it.
+
+Usage:
+    python scripts/persons_startup_bench.py
+    python scripts/persons_startup_bench.py --runs 50 --locale fr_FR
+    python scripts/persons_startup_bench.py --json bench_output.json
+
+Requirements:
+    pip install faker
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+SCRIPT = Path(__file__).with_name("generate_persons_csv.py")
+
+
+def cases(locale: str, workdir: Path) -> list[tuple[str, list[str], bool | None]]:
+    """``(name, argv, gated)``: True is held to the target, False only compared with it, None neither."""
+    output = str(workdir / "persons.csv")
+    snapshot = str(workdir / "persons.pkl")
+    run = [sys.executable, str(SCRIPT), "--locale", locale, "--output", output]
+    return [
+        ("python (bare interpreter)", [sys.executable, "-c", "pass"], None),
+        ("import faker + Faker(locale)", [sys.executable, "-c", f"from faker import Faker; Faker({locale!r})"], None),
+        ("--help", [sys.executable, str(SCRIPT), "--help"], True),
+        ("--count 10", run + ["--count", "10"], False),
+        ("--count 100", run + ["--count", "100"], False),
+        ("--count 10 --snapshot", run + ["--count", "10", "--snapshot", snapshot], True),
+        ("--count 100 --snapshot", run + ["--count", "100", "--snapshot", snapshot], True),
+        ("--count 1000", run + ["--count", "1000"], None),
+    ]
+
+
+def time_run(argv: list[str]) -> float:
+    started = time.perf_counter()
+    subprocess.run(argv, check=True, stdout=subprocess.DEVNULL)
+    return (time.perf_counter() - started) * 1000
+
+
+def bench(locale: str, runs: int, target_ms: float) -> list[dict]:
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, argv, gated in cases(locale, Path(tmp)):
+            time_run(argv)          # warm the page cache, .pyc files and the snapshot
+            times = sorted(time_run(argv) for _ in range(runs))
+            results.append({
+                "case": name,
+                "min_ms": times[0],
+                "median_ms": statistics.median(times),
+                "p95_ms": times[min(len(times) - 1, int(len(times) * 0.95))],
+                "target_ms": target_ms if gated is not None else None,
+                "gated": bool(gated),
+            })
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark generate_persons_csv.py startup time")
+    parser.add_argument("--runs", type=int, default=20, help="Runs per case (default: 20)")
+    parser.add_argument("--locale", type=str, default="en_US", help="Faker locale (default: en_US)")
+    parser.add_argument("--target-ms", type=float, default=100.0,
+                        help="Median budget for --help and snapshot runs (default: 100)")
+    parser.add_argument("--json", type=str, default=None, help="Optional path to write results as JSON")
+    args = parser.parse_args()
+
+    results = bench(args.locale, args.runs, args.target_ms)
+    print(f"{'case':<32}{'min':>9}{'median':>9}{'p95':>9}")
+    missed = []
+    for r in results:
+        verdict = ""
+        if r["target_ms"] is not None:
+            ok = r["median_ms"] <= r["target_ms"]
+            verdict = "  ok" if ok else f"  over {r['target_ms']:.0f} ms"
+            if not r["gated"]:
+                verdict += " (informational)"
+            elif not ok:
+                missed.append(r["case"])
+        print(f"{r['case']:<32}{r['min_ms']:>7.1f}ms{r['median_ms']:>7.1f}ms{r['p95_ms']:>7.1f}ms{verdict}")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+        print(f"Saved results to {args.json}")
+    if missed:
+        print(f"Over target: {', '.join(missed)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
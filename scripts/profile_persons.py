@@ -0,0 +1,447 @@
+"""
+Profile a persons dataset in one pass with fixed memory, using sketches.
+
+Reads the CSV written by generate_persons_csv.py (or a Parquet file with the
+same columns) and reports, as one compact JSON document:
+
+- null rates for every column (exact counts);
+- distinct counts for ``--distinct`` columns (HyperLogLog, ~0.8% error);
+- the most frequent values of ``--top`` columns (count-min sketch plus a
+  bounded candidate list; counts never under-estimate);
+- quantiles of age and tenure in days, from ``birth_date`` and
+  ``joined_date`` (t-digest).
+
+The file is cut into blocks of whole records (Parquet: row groups) that
+worker processes profile independently; their partial sketches are merged
+as they come back, with only a few blocks in flight, so memory is the size
+of the sketches plus those blocks whatever the row count. Within a block,
+values are counted exactly first and each distinct value is added to the
+sketches once, with its count.
+
+Usage:
+    python scripts/profile_persons.py scripts/sample_persons.csv
+    python scripts/profile_persons.py persons.csv --workers 8 --output profile.json
+    python scripts/profile_persons.py persons.parquet --top country language --topk 20
+    python scripts/generate_persons_csv.py --count 100000 --output /tmp/p.csv && python scripts/profile_persons.py /tmp/p.csv
+
+Requirements:
+    pip install pyarrow     # Parquet input only
+"""
+
+import argparse
+import csv
+import hashlib
+import io
+import json
+import math
+import multiprocessing
+import sys
+import time
+from array import array
+from collections import Counter
+from datetime import date
+from operator import add
+from pathlib import Path
+
+from csv_blocks import BLOCK_SIZE, kilobytes, read_blocks, windowed
+
+
+HLL_PRECISION = 14              # 2**14 one-byte registers: 16 KB, ~0.8% standard error
+CMS_WIDTH = 2048
+CMS_DEPTH = 4
+TDIGEST_COMPRESSION = 100
+DEFAULT_DISTINCT = ["email", "phone", "company", "city"]
+DEFAULT_TOP = ["country", "nationality", "language", "occupation"]
+DEFAULT_TOPK = 10
+QUANTILES = (0.01, 0.05, 0.25, 0.5, 0.75, 0.95, 0.99)
+
+
+def _hash64(value: str) -> int:
+    return int.from_bytes(hashlib.blake2b(value.encode(), digest_size=8).digest(), "little")
+
+
+# ── Sketches ──
+
+class HyperLogLog:
+    """Distinct-count estimate; ``merge`` takes the register-wise maximum."""
+
+    __slots__ = ("p", "registers")
+
+    def __init__(self, p: int = HLL_PRECISION):
+        self.p = p
+        self.registers = bytearray(1 << p)
+
+    def add_all(self, values) -> None:
+        regs = self.registers
+        shift = 64 - self.p
+        mask = (1 << shift) - 1
+        blake2b, from_bytes = hashlib.blake2b, int.from_bytes    # _hash64, inlined for the hot loop
+        for value in values:
+            h = from_bytes(blake2b(value.encode(), digest_size=8).digest(), "little")
+            rank = shift - (h & mask).bit_length() + 1
+            idx = h >> shift
+            if rank > regs[idx]:
+                regs[idx] = rank
+
+    def merge(self, other: "HyperLogLog") -> None:
+        self.registers = bytearray(map(max, self.registers, other.registers))
+
+    def estimate(self) -> float:
+        m = len(self.registers)
+        z = sum(n * 2.0 ** -rank for rank, n in Counter(self.registers).items())
+        estimate = 0.7213 / (1 + 1.079 / m) * m * m / z
+        zeros = self.registers.count(0)
+        if estimate <= 2.5 * m and zeros:
+            estimate = m * math.log(m / zeros)    # linear counting for small cardinalities
+        return estimate
+
+    def error(self) -> float:
+        return 1.04 / math.sqrt(len(self.registers))
+
+
+class CountMinSketch:
+    """Frequency estimates that never under-count; ``merge`` adds the tables."""
+
+    __slots__ = ("width", "depth", "table", "total")
+
+    def __init__(self, width: int = CMS_WIDTH, depth: int = CMS_DEPTH):
+        self.width = width
+        self.depth = depth
+        self.table = array("Q", bytes(8 * width * depth))
+        self.total = 0
+
+    def _cells(self, value: str):
+        h = _hash64(value)
+        h1, h2 = h & 0xFFFFFFFF, (h >> 32) | 1
+        width = self.width
+        return [row * width + (h1 + row * h2) % width for row in range(self.depth)]
+
+    def add(self, value: str, count: int = 1) -> None:
+        table = self.table
+        for cell in self._cells(value):
+            table[cell] += count
+        self.total += count
+
+    def estimate(self, value: str) -> int:
+        table = self.table
+        return min(table[cell] for cell in self._cells(value))
+
+    def merge(self, other: "CountMinSketch") -> None:
+        self.table = array("Q", map(add, self.table, other.table))
+        self.total += other.total
+
+    def error(self) -> float:
+        """Over-count bound as a fraction of the total, with probability 1 - e**-depth."""
+        return math.e / self.width
+
+
+class TopValues:
+    """Heavy hitters: a count-min sketch plus the ``capacity`` values with the highest estimates."""
+
+    __slots__ = ("sketch", "candidates", "capacity")
+
+    def __init__(self, capacity: int):
+        self.sketch = CountMinSketch()
+        self.candidates = {}
+        self.capacity = capacity
+
+    def add_counts(self, counts: Counter) -> None:
+        for value, count in counts.items():
+            self.sketch.add(value, count)
+        for value in counts:
+            self.candidates[value] = 0
+        self._prune()
+
+    def merge(self, other: "TopValues") -> None:
+        self.sketch.merge(other.sketch)
+        self.candidates.update(dict.fromkeys(other.candidates, 0))
+        self._prune()
+
+    def _prune(self) -> None:
+        estimate = self.sketch.estimate
+        scored = {value: estimate(value) for value in self.candidates}
+        if len(scored) > self.capacity:
+            scored = dict(sorted(scored.items(), key=lambda item: -item[1])[:self.capacity])
+        self.candidates = scored
+
+    def top(self, k: int) -> list[tuple[str, int]]:
+        return sorted(self.candidates.items(), key=lambda item: (-item[1], item[0]))[:k]
+
+
+class TDigest:
+    """Merging t-digest (k1 scale function) for quantiles; ``merge`` re-compresses both digests' centroids."""
+
+    __slots__ = ("compression", "centroids", "buffer", "count", "min", "max")
+
+    def __init__(self, compression: int = TDIGEST_COMPRESSION):
+        self.compression = compression
+        self.centroids = []         # [(mean, weight)] sorted by mean
+        self.buffer = []
+        self.count = 0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def add(self, value: float, weight: int = 1) -> None:
+        self.buffer.append((value, weight))
+        self.count += weight
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+        if len(self.buffer) >= self.compression * 5:
+            self._compress()
+
+    def _k(self, q: float) -> float:
+        return self.compression / (2 * math.pi) * math.asin(2 * min(max(q, 0.0), 1.0) - 1)
+
+    def _compress(self) -> None:
+        if not self.buffer:
+            return
+        points = sorted(self.centroids + self.buffer)
+        self.buffer = []
+        total = sum(w for _, w in points)
+        merged = []
+        mean, weight = points[0]
+        before = 0                  # weight of the centroids already emitted
+        k_left = self._k(0.0)
+        for value, w in points[1:]:
+            if self._k((before + weight + w) / total) - k_left <= 1:
+                mean += (value - mean) * w / (weight + w)
+                weight += w
+                continue
+            merged.append((mean, weight))
+            before += weight
+            k_left = self._k(before / total)
+            mean, weight = value, w
+        merged.append((mean, weight))
+        self.centroids = merged
+
+    def merge(self, other: "TDigest") -> None:
+        other._compress()
+        self.buffer.extend(other.centroids)
+        self.count += other.count
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self._compress()
+
+    def quantile(self, q: float) -> float | None:
+        self._compress()
+        if not self.centroids:
+            return None
+        centroids = self.centroids
+        if len(centroids) == 1:
+            return centroids[0][0]
+        target = q * self.count
+        cumulative = 0.0
+        prev_center, prev_mean = 0.0, self.min
+        for mean, weight in centroids:
+            center = cumulative + weight / 2
+            if target < center:
+                span = center - prev_center
+                return prev_mean + (mean - prev_mean) * ((target - prev_center) / span if span else 0)
+            cumulative += weight
+            prev_center, prev_mean = center, mean
+        span = self.count - prev_center
+        return prev_mean + (self.max - prev_mean) * ((target - prev_center) / span if span else 0)
+
+    def mean(self) -> float | None:
+        self._compress()
+        return sum(m * w for m, w in self.centroids) / self.count if self.count else None
+
+
+# ── Profiles ──
+
+class Profile:
+    """Partial or merged sketches for a set of rows."""
+
+    def __init__(self, columns, distinct, top, topk):
+        self.columns = list(columns)
+        self.rows = 0
+        self.nulls = dict.fromkeys(self.columns, 0)
+        self.distinct = {name: HyperLogLog() for name in distinct}
+        self.top = {name: TopValues(max(topk * 8, 64)) for name in top}
+        self.quantiles = {"age": TDigest(), "tenure_days": TDigest()}
+
+    def add_columns(self, data: dict, reference: date) -> None:
+        """Add one block of rows, given column-wise as ``{name: [str, ...]}``."""
+        self.rows += len(next(iter(data.values()), ()))
+        for name, values in data.items():
+            self.nulls[name] += values.count("")
+        for name, sketch in self.distinct.items():
+            sketch.add_all({v for v in data[name] if v})
+        for name, top in self.top.items():
+            counts = Counter(data[name])
+            counts.pop("", None)
+            top.add_counts(counts)
+        if "birth_date" in data:
+            ages = Counter()
+            for born, n in Counter(data["birth_date"]).items():
+                if born:
+                    year, month, day = int(born[:4]), int(born[5:7]), int(born[8:10])
+                    ages[reference.year - year - ((reference.month, reference.day) < (month, day))] += n
+            for age, n in ages.items():
+                self.quantiles["age"].add(age, n)
+        if "joined_date" in data:
+            for joined, n in Counter(data["joined_date"]).items():
+                if joined:
+                    self.quantiles["tenure_days"].add((reference - date.fromisoformat(joined[:10])).days, n)
+
+    def merge(self, other: "Profile") -> None:
+        self.rows += other.rows
+        for name, n in other.nulls.items():
+            self.nulls[name] = self.nulls.get(name, 0) + n
+        for group in ("distinct", "top", "quantiles"):
+            mine = getattr(self, group)
+            for name, sketch in getattr(other, group).items():
+                mine[name].merge(sketch)
+
+    def report(self, topk: int) -> dict:
+        rows = self.rows or 1
+        quantiles = {}
+        for name, digest in self.quantiles.items():
+            if digest.count:
+                quantiles[name] = {"min": digest.min, **{f"p{round(q * 100):02d}": round(digest.quantile(q), 1)
+                                                         for q in QUANTILES},
+                                   "max": digest.max, "mean": round(digest.mean(), 2)}
+        return {
+            "rows": self.rows,
+            "null_rate": {name: round(n / rows, 6) for name, n in self.nulls.items()},
+            "distinct": {name: round(sketch.estimate()) for name, sketch in self.distinct.items()},
+            "top": {name: [[value, count] for value, count in top.top(topk)] for name, top in self.top.items()},
+            "quantiles": quantiles,
+            "error": {
+                "distinct_relative": round(HyperLogLog().error(), 4),
+                "top_overcount": math.ceil(self.rows * CountMinSketch().error()),
+            },
+        }
+
+
+# ── Reading ──
+
+def _csv_job(job) -> Profile:
+    block, header, distinct, top, topk, reference = job
+    rows = [row for row in csv.reader(io.StringIO(block.decode("utf-8"))) if row]
+    width = len(header)
+    columns = list(zip(*(row if len(row) == width else (row + [""] * width)[:width] for row in rows)))
+    data = {name: list(values) for name, values in zip(header, columns)} if rows else {name: [] for name in header}
+    profile = Profile(header, distinct, top, topk)
+    profile.add_columns(data, reference)
+    return profile
+
+
+def _text(value) -> str:
+    if value is None:
+        return ""
+    if isinstance(value, str):
+        return value
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    return value.isoformat() if hasattr(value, "isoformat") else str(value)
+
+
+def _parquet_job(job) -> Profile:
+    import pyarrow.parquet as pq
+
+    path, group, header, distinct, top, topk, reference = job
+    table = pq.ParquetFile(path).read_row_group(group, columns=header).to_pydict()
+    data = {name: [_text(v) for v in table[name]] for name in header}
+    profile = Profile(header, distinct, top, topk)
+    profile.add_columns(data, reference)
+    return profile
+
+
+def _jobs(path: str, distinct, top, topk, reference, block_size):
+    """The dataset's columns and a generator of (worker function, job) pairs, one per block or row group."""
+    if path.endswith(".parquet"):
+        try:
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise SystemExit("Parquet input needs pyarrow: pip install pyarrow") from None
+        parquet = pq.ParquetFile(path)
+        header = parquet.schema_arrow.names
+        _check(header, distinct, top)
+        return header, ((_parquet_job, (path, g, header, distinct, top, topk, reference))
+                        for g in range(parquet.num_row_groups))
+
+    f = sys.stdin.buffer if path == "-" else open(path, "rb")
+    header = next(csv.reader([f.readline().decode("utf-8")]))
+    _check(header, distinct, top)
+    blocks = read_blocks(f, block_size)
+
+    def jobs():
+        try:
+            for block, _ in blocks:
+                yield _csv_job, (block, header, distinct, top, topk, reference)
+        finally:
+            if f is not sys.stdin.buffer:
+                f.close()
+    return header, jobs()
+
+
+def _check(header, distinct, top) -> None:
+    missing = [name for name in dict.fromkeys(list(distinct) + list(top)) if name not in header]
+    if missing:
+        raise SystemExit(f"no column(s) {', '.join(missing)} in the dataset (columns: {', '.join(header)})")
+
+
+def _run(task):
+    fn, job = task
+    return fn(job)
+
+
+def profile(path: str, workers: int, distinct=DEFAULT_DISTINCT, top=DEFAULT_TOP, topk=DEFAULT_TOPK,
+            reference: date | None = None, block_size=BLOCK_SIZE) -> dict:
+    """Stream ``path`` once and return its profile as a JSON-ready dict."""
+    started = time.perf_counter()
+    reference = reference or date.today()
+    header, tasks = _jobs(str(path), list(distinct), list(top), topk, reference, block_size)
+    total = Profile(header, distinct, top, topk)
+    if workers <= 1:
+        partials = map(_run, tasks)
+        for partial in partials:
+            total.merge(partial)
+    else:
+        with multiprocessing.Pool(workers) as pool:
+            for partial in windowed(pool, _run, tasks, workers * 2):
+                total.merge(partial)
+    result = {"source": str(path), "reference_date": reference.isoformat(), **total.report(topk)}
+    result["seconds"] = round(time.perf_counter() - started, 3)
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="One-pass sketch profile of a persons CSV or Parquet file")
+    parser.add_argument("input", help="Persons CSV (or - for stdin) or .parquet file")
+    parser.add_argument("--distinct", nargs="+", default=DEFAULT_DISTINCT,
+                        help=f"Columns to count distinct values of (default: {' '.join(DEFAULT_DISTINCT)})")
+    parser.add_argument("--top", nargs="+", default=DEFAULT_TOP,
+                        help=f"Columns to list the most frequent values of (default: {' '.join(DEFAULT_TOP)})")
+    parser.add_argument("--topk", type=int, default=DEFAULT_TOPK, help=f"Values per --top column (default: {DEFAULT_TOPK})")
+    parser.add_argument("--reference-date", type=date.fromisoformat, default=None,
+                        help="Date ages and tenure are computed at (default: today)")
+    parser.add_argument("--block-size", type=kilobytes, default=BLOCK_SIZE >> 10,
+                        help=f"KB of CSV per task (default: {BLOCK_SIZE >> 10})")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=multiprocessing.cpu_count(),
+        help="Worker processes (default: CPU count)",
+    )
+    parser.add_argument("--output", type=str, default=None, help="Write the JSON profile here instead of stdout")
+    parser.add_argument("--indent", type=int, default=None, help="Pretty-print the JSON with this indent")
+    args = parser.parse_args()
+
+    result = profile(args.input, args.workers, args.distinct, args.top, args.topk, args.reference_date,
+                     args.block_size << 10)
+    separators = (",", ":") if args.indent is None else None
+    text = json.dumps(result, indent=args.indent, separators=separators, ensure_ascii=False)
+    if args.output:
+        Path(args.output).parent.mkdir(parents=True, exist_ok=True)
+        Path(args.output).write_text(text + "\n", encoding="utf-8")
+        print(f"Profiled {result['rows']} rows in {result['seconds']} s -> {args.output}", file=sys.stderr)
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
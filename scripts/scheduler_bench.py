@@ -0,0 +1,449 @@
+"""
+Benchmark a scheduler engine for one-time and recurring scheduled messages.
+
+Schedules are derived from generated persons: every person is mapped to an IANA
+timezone and gets one-time, daily or weekly sends at a local time of day
+(DST-aware). The schedules are loaded into a hierarchical timing wheel (with a
+heap fallback for far-future triggers) or a plain binary heap, then a
+deterministic simulated clock is advanced tick by tick over the horizon, so
+days of scheduler activity replay in seconds.
+
+Reported per size: load throughput, trigger throughput, trigger lateness
+percentiles (simulated time), the slowest single tick (wall time) and memory
+per schedule.
+
+Usage:
+    python scripts/scheduler_bench.py
+    python scripts/scheduler_bench.py --sizes 100000 --horizon-hours 24
+    python scripts/scheduler_bench.py --engine heap --sizes 1000000
+    python scripts/scheduler_bench.py --tick-ms 100 --pause-fraction 0.1 --json bench_output.json
+
+Requirements:
+    pip install faker
+"""
+
+import argparse
+import heapq
+import json
+import random
+import resource
+import time
+import zlib
+from array import array
+from datetime import date, datetime, time as dt_time, timezone
+from zoneinfo import ZoneInfo
+
+from generate_persons_csv import generate_persons
+
+
+TIMEZONES = [
+    "Africa/Addis_Ababa",
+    "Africa/Nairobi",
+    "Africa/Lagos",
+    "Africa/Cairo",
+    "Africa/Johannesburg",
+    "Europe/London",
+    "Europe/Berlin",
+    "Europe/Moscow",
+    "Asia/Dubai",
+    "Asia/Kolkata",
+    "Asia/Singapore",
+    "Asia/Tokyo",
+    "Australia/Sydney",
+    "America/New_York",
+    "America/Chicago",
+    "America/Denver",
+    "America/Los_Angeles",
+    "America/Sao_Paulo",
+    "Pacific/Auckland",
+    "UTC",
+]
+
+ONCE, DAILY, WEEKLY = 0, 1, 2
+KIND_WEIGHTS = {ONCE: 0.5, DAILY: 0.3, WEEKLY: 0.2}
+STEP_DAYS = {DAILY: 1, WEEKLY: 7}
+
+ACTIVE, PAUSED, PARKED, CATCHUP, DONE = 0, 1, 2, 3, 4
+
+EPOCH_START = datetime(2026, 3, 27, tzinfo=timezone.utc)  # spans the EU DST switch
+
+
+def person_timezone(person: dict) -> int:
+    key = f"{person['email']}|{person['country']}".encode("utf-8")
+    return zlib.crc32(key) % len(TIMEZONES)
+
+
+class SimClock:
+    def __init__(self, start_ms: int, tick_ms: int):
+        self.start_ms = start_ms
+        self.tick_ms = tick_ms
+        self.tick = 0
+
+    @property
+    def now_ms(self) -> int:
+        return self.start_ms + self.tick * self.tick_ms
+
+    def due_tick(self, due_ms: int) -> int:
+        return max(0, -(-(due_ms - self.start_ms) // self.tick_ms))
+
+
+class ScheduleTable:
+    """Struct-of-arrays schedule store; engines only hold integer ids."""
+
+    def __init__(self):
+        self.due_ms = array("q")
+        self.local_day = array("i")
+        self.minute = array("H")
+        self.tz = array("B")
+        self.kind = array("B")
+        self.state = array("B")
+        self.zones = [ZoneInfo(name) for name in TIMEZONES]
+        self._utc_cache: dict[tuple[int, int, int], int] = {}
+
+    def __len__(self) -> int:
+        return len(self.due_ms)
+
+    def local_to_utc_ms(self, tz: int, day: int, minute: int) -> int:
+        key = (tz, day, minute)
+        cached = self._utc_cache.get(key)
+        if cached is None:
+            local = datetime.combine(
+                date.fromordinal(day), dt_time(minute // 60, minute % 60), tzinfo=self.zones[tz]
+            )
+            cached = self._utc_cache[key] = int(local.timestamp()) * 1000
+        return cached
+
+    def add(self, due_ms: int, day: int, minute: int, tz: int, kind: int) -> int:
+        self.due_ms.append(due_ms)
+        self.local_day.append(day)
+        self.minute.append(minute)
+        self.tz.append(tz)
+        self.kind.append(kind)
+        self.state.append(ACTIVE)
+        return len(self.due_ms) - 1
+
+    def advance(self, sid: int, after_ms: int) -> int | None:
+        kind = self.kind[sid]
+        if kind == ONCE:
+            return None
+        step = STEP_DAYS[kind]
+        day = self.local_day[sid] + step
+        due = self.local_to_utc_ms(self.tz[sid], day, self.minute[sid])
+        while due <= after_ms:
+            day += step
+            due = self.local_to_utc_ms(self.tz[sid], day, self.minute[sid])
+        self.local_day[sid] = day
+        self.due_ms[sid] = due
+        return due
+
+    def nbytes(self) -> int:
+        columns = (self.due_ms, self.local_day, self.minute, self.tz, self.kind, self.state)
+        return sum(col.itemsize * len(col) for col in columns)
+
+
+class TimingWheel:
+    """Hierarchical timing wheel with absolute slot indexing and a heap for overflow."""
+
+    name = "wheel"
+
+    def __init__(self, clock: SimClock, level_bits: tuple[int, ...] = (8, 6, 6)):
+        self.clock = clock
+        self.bits = level_bits
+        self.shifts = []
+        shift = 0
+        for bits in level_bits:
+            self.shifts.append(shift)
+            shift += bits
+        self.span = 1 << shift
+        self.levels = [[array("q") for _ in range(1 << bits)] for bits in level_bits]
+        self.overflow: list[int] = []
+        self.size = 0
+
+    def insert(self, sid: int, due_tick: int) -> None:
+        # the current tick's slot has already been popped, so the earliest we can fire is the next tick
+        self._place(sid, max(due_tick, self.clock.tick + 1))
+
+    def _place(self, sid: int, due_tick: int) -> None:
+        delta = due_tick - self.clock.tick
+        self.size += 1
+        if delta >= self.span:
+            heapq.heappush(self.overflow, (due_tick << 32) | sid)
+            return
+        for level, (bits, shift) in enumerate(zip(self.bits, self.shifts)):
+            if delta < 1 << (shift + bits):
+                self.levels[level][(due_tick >> shift) & ((1 << bits) - 1)].append(sid)
+                return
+
+    def _cascade(self, level: int, table: ScheduleTable) -> None:
+        slot_index = (self.clock.tick >> self.shifts[level]) & ((1 << self.bits[level]) - 1)
+        slot = self.levels[level][slot_index]
+        if not slot:
+            return
+        self.levels[level][slot_index] = array("q")
+        self.size -= len(slot)
+        due_tick = self.clock.due_tick
+        due_ms = table.due_ms
+        for sid in slot:
+            self._place(sid, due_tick(due_ms[sid]))
+
+    def _drain_overflow(self) -> None:
+        horizon = self.clock.tick + self.span
+        overflow = self.overflow
+        while overflow and (overflow[0] >> 32) < horizon:
+            packed = heapq.heappop(overflow)
+            self.size -= 1
+            self._place(packed & 0xFFFFFFFF, packed >> 32)
+
+    def pop_due(self, table: ScheduleTable) -> array:
+        tick = self.clock.tick
+        if tick & ((1 << self.bits[0]) - 1) == 0:
+            for level in range(len(self.bits) - 1, 0, -1):
+                if tick & ((1 << self.shifts[level]) - 1) == 0:
+                    self._cascade(level, table)
+            self._drain_overflow()
+        slots = self.levels[0]
+        index = tick & ((1 << self.bits[0]) - 1)
+        fired = slots[index]
+        if fired:
+            slots[index] = array("q")
+            self.size -= len(fired)
+        return fired
+
+    def nbytes(self) -> int:
+        buckets = sum(slot.buffer_info()[1] * slot.itemsize for level in self.levels for slot in level)
+        return buckets + len(self.overflow) * 8
+
+
+class HeapScheduler:
+    """Reference engine: a single binary heap of packed (due_tick, id) keys."""
+
+    name = "heap"
+
+    def __init__(self, clock: SimClock):
+        self.clock = clock
+        self.heap: list[int] = []
+
+    @property
+    def size(self) -> int:
+        return len(self.heap)
+
+    def insert(self, sid: int, due_tick: int) -> None:
+        heapq.heappush(self.heap, (max(due_tick, self.clock.tick + 1) << 32) | sid)
+
+    def pop_due(self, table: ScheduleTable) -> array:
+        heap = self.heap
+        limit = (self.clock.tick + 1) << 32
+        fired = array("q")
+        while heap and heap[0] < limit:
+            fired.append(heapq.heappop(heap) & 0xFFFFFFFF)
+        return fired
+
+    def nbytes(self) -> int:
+        return len(self.heap) * 8
+
+
+ENGINES = {"wheel": TimingWheel, "heap": HeapScheduler}
+
+
+def build_schedules(count: int, persons: list[dict], clock: SimClock, rng: random.Random,
+                    horizon_ms: int) -> ScheduleTable:
+    table = ScheduleTable()
+    start_day = EPOCH_START.date().toordinal()
+    kinds = list(KIND_WEIGHTS)
+    weights = list(KIND_WEIGHTS.values())
+    person_tz = [person_timezone(p) for p in persons]
+    n_persons = len(persons)
+
+    for i in range(count):
+        tz = person_tz[i % n_persons]
+        kind = rng.choices(kinds, weights)[0]
+        if kind == ONCE:
+            # one-time sends are picked to the millisecond; some lie beyond the wheel's horizon
+            due = clock.start_ms + int(rng.random() * horizon_ms * 1.5)
+            table.add(due, 0, 0, tz, ONCE)
+            continue
+        # recurring sends cluster in local business hours, on the quarter hour
+        minute = min(23 * 60 + 45, max(0, int(rng.gauss(10 * 60, 150)) // 15 * 15))
+        day = start_day + (rng.randrange(7) if kind == WEEKLY else 0)
+        due = table.local_to_utc_ms(tz, day, minute)
+        if due < clock.start_ms:
+            day += STEP_DAYS[kind]
+            due = table.local_to_utc_ms(tz, day, minute)
+        table.add(due, day, minute, tz, kind)
+    return table
+
+
+def percentile(sorted_values: list[int], pct: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(round(pct / 100 * (len(sorted_values) - 1))))
+    return float(sorted_values[index])
+
+
+def lateness_percentiles(histogram: dict[int, int], total: int) -> dict[str, float]:
+    points = {"p50": 50, "p99": 99, "p999": 99.9, "max": 100}
+    result = {}
+    if not total:
+        return {name: 0.0 for name in points}
+    ordered = sorted(histogram.items())
+    for name, pct in points.items():
+        target = max(1, int(total * pct / 100 + 0.5))
+        running = 0
+        for value, n in ordered:
+            running += n
+            if running >= target:
+                result[name] = float(value)
+                break
+    return result
+
+
+def rss_bytes() -> int:
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * resource.getpagesize()
+    except OSError:
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+def run(size: int, engine_name: str, persons: list[dict], args: argparse.Namespace) -> dict:
+    rng = random.Random(args.seed)
+    horizon_ms = args.horizon_hours * 3_600_000
+    clock = SimClock(int(EPOCH_START.timestamp()) * 1000, args.tick_ms)
+
+    rss_before = rss_bytes()
+    started = time.perf_counter()
+    table = build_schedules(size, persons, clock, rng, horizon_ms)
+    engine = ENGINES[engine_name](clock)
+    due_tick = clock.due_tick
+    for sid, due in enumerate(table.due_ms):
+        engine.insert(sid, due_tick(due))
+    load_seconds = time.perf_counter() - started
+    rss_after = rss_bytes()
+
+    paused = rng.sample(range(size), int(size * args.pause_fraction))
+    for sid in paused:
+        table.state[sid] = PAUSED
+    resume_tick = clock.due_tick(clock.start_ms + horizon_ms // 2)
+
+    fired = skipped = caught_up = 0
+    lateness: dict[int, int] = {}
+    slowest_tick = 0.0
+    total_ticks = clock.due_tick(clock.start_ms + horizon_ms)
+    state, due_ms = table.state, table.due_ms
+
+    started = time.perf_counter()
+    for _ in range(total_ticks):
+        clock.tick += 1
+        tick_started = time.perf_counter()
+        now_ms = clock.now_ms
+        for sid in engine.pop_due(table):
+            if state[sid] == PAUSED:
+                state[sid] = PARKED
+                skipped += 1
+                continue
+            if state[sid] == CATCHUP:
+                # a one-time send missed while paused; its lateness is the pause, not the scheduler
+                state[sid] = DONE
+                caught_up += 1
+                continue
+            late = now_ms - due_ms[sid]
+            lateness[late] = lateness.get(late, 0) + 1
+            fired += 1
+            nxt = table.advance(sid, now_ms)
+            if nxt is None:
+                state[sid] = DONE
+            else:
+                engine.insert(sid, due_tick(nxt))
+        if clock.tick == resume_tick:
+            for sid in paused:
+                if state[sid] == PARKED:
+                    # missed one-time sends go out right away, recurring ones resume at the next occurrence
+                    nxt = table.advance(sid, now_ms)
+                    if nxt is None:
+                        state[sid] = CATCHUP
+                        engine.insert(sid, due_tick(now_ms))
+                        continue
+                    engine.insert(sid, due_tick(nxt))
+                state[sid] = ACTIVE
+        slowest_tick = max(slowest_tick, time.perf_counter() - tick_started)
+    run_seconds = time.perf_counter() - started
+
+    return {
+        "engine": engine_name,
+        "schedules": size,
+        "tick_ms": args.tick_ms,
+        "horizon_hours": args.horizon_hours,
+        "load_per_sec": round(size / load_seconds),
+        "load_seconds": round(load_seconds, 3),
+        "simulated_ticks": total_ticks,
+        "run_seconds": round(run_seconds, 3),
+        "triggers_fired": fired,
+        "triggers_skipped_paused": skipped,
+        "triggers_caught_up": caught_up,
+        "triggers_per_sec": round(fired / run_seconds) if run_seconds else 0,
+        "lateness_ms": lateness_percentiles(lateness, fired),
+        "slowest_tick_ms": round(slowest_tick * 1000, 3),
+        "pending": engine.size,
+        "structure_bytes_per_schedule": round((table.nbytes() + engine.nbytes()) / size, 1),
+        "rss_bytes_per_schedule": round((rss_after - rss_before) / size, 1),
+    }
+
+
+def print_result(result: dict) -> None:
+    late = result["lateness_ms"]
+    print(
+        f"  {result['engine']:<5} {result['schedules']:>11,} schedules | "
+        f"load {result['load_per_sec']:>9,}/s | fire {result['triggers_per_sec']:>9,}/s | "
+        f"fired {result['triggers_fired']:,} (+{result['triggers_skipped_paused']:,} paused)"
+    )
+    print(
+        f"        lateness p50={late['p50']:.0f}ms p99={late['p99']:.0f}ms max={late['max']:.0f}ms | "
+        f"slowest tick {result['slowest_tick_ms']}ms | "
+        f"{result['structure_bytes_per_schedule']} B/schedule (rss {result['rss_bytes_per_schedule']} B)"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark timing-wheel vs heap schedulers on simulated time")
+    parser.add_argument(
+        "--sizes",
+        type=str,
+        default="1000000,10000000",
+        help="Comma-separated schedule counts to benchmark (default: 1000000,10000000)",
+    )
+    parser.add_argument(
+        "--engine",
+        choices=["wheel", "heap", "both"],
+        default="both",
+        help="Scheduler engine to benchmark (default: both)",
+    )
+    parser.add_argument("--tick-ms", type=int, default=1000, help="Wheel tick / clock resolution (default: 1000)")
+    parser.add_argument("--horizon-hours", type=int, default=48, help="Simulated time to replay (default: 48)")
+    parser.add_argument("--persons", type=int, default=1000, help="Generated persons to derive timezones from (default: 1000)")
+    parser.add_argument("--locale", type=str, default="en_US", help="Faker locale (default: en_US)")
+    parser.add_argument("--pause-fraction", type=float, default=0.05, help="Share of schedules paused, resumed mid-run (default: 0.05)")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed for schedule generation (default: 42)")
+    parser.add_argument("--json", type=str, default=None, help="Optional path to write results as JSON")
+    args = parser.parse_args()
+
+    sizes = [int(size) for size in args.sizes.split(",") if size]
+    engines = ["wheel", "heap"] if args.engine == "both" else [args.engine]
+
+    print(f"Generating {args.persons} persons with locale '{args.locale}'...")
+    persons = generate_persons(args.persons, args.locale)
+
+    results = []
+    for size in sizes:
+        for engine_name in engines:
+            result = run(size, engine_name, persons, args)
+            print_result(result)
+            results.append(result)
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+        print(f"Saved results to {args.json}")
+
+
+if __name__ == "__main__":
+    main()
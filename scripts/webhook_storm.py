@@ -0,0 +1,471 @@
+"""
+Generate a storm of delivery-status webhook callbacks (message.status.*) and
+fire them at a webhook receiver, without touching real providers.
+
+Every generated person becomes a recipient of a synthetic group send. For each
+message the provider's lifecycle is simulated (sent -> delivered/failed ->
+read) with per-provider payload shapes, message ID formats, failure rates and
+delay distributions. Callbacks are replayed open-loop on the simulated
+timeline (compressed by --time-scale, capped by --rate) over a pooled
+keep-alive aiohttp connector. Latency is measured from each callback's
+intended send time, so a receiver that falls behind shows up in the tail.
+
+Read receipts trail delivery by minutes (a 10-minute median for email), so
+a run ends in a long, sparse tail. The reported callbacks/sec is the
+sustained rate: completions are bucketed per second, and the rate is taken
+over the busy seconds (at least a tenth of the peak second); the peak second
+and the average over the whole run are reported beside it. --read-delay-cap
+clips read delays on the simulated timeline to shorten the tail.
+
+Unless --target is given, a bundled local receiver is started in a child
+process; it parses each payload the way a real receiver would and returns
+provider-appropriate acknowledgements.
+
+Usage:
+    python scripts/webhook_storm.py
+    python scripts/webhook_storm.py --messages 50000 --rate 5000 --connections 64
+    python scripts/webhook_storm.py --providers twilio,whatsapp --time-scale 600
+    python scripts/webhook_storm.py --read-delay-cap 120
+    python scripts/webhook_storm.py --serve --port 8765
+    python scripts/webhook_storm.py --target http://localhost:8765 --json bench_output.json
+
+Requirements:
+    pip install faker aiohttp
+"""
+
+import argparse
+import asyncio
+import heapq
+import json
+import math
+import multiprocessing
+import random
+import time
+import zlib
+from collections import Counter
+from typing import Iterator
+from urllib.parse import urlencode
+
+from aiohttp import ClientSession, ClientTimeout, TCPConnector, web
+
+from generate_persons_csv import generate_persons
+
+
+# Per-provider lifecycle: failure probability, read probability and lognormal
+# (median seconds, sigma) delays from send to delivery/failure and to read.
+PROVIDERS = {
+    "twilio": {"channel": "sms", "fail": 0.04, "read": 0.0, "deliver": (4.0, 0.8), "read_after": None},
+    "africastalking": {"channel": "sms", "fail": 0.06, "read": 0.0, "deliver": (6.0, 1.0), "read_after": None},
+    "whatsapp": {"channel": "whatsapp", "fail": 0.02, "read": 0.7, "deliver": (1.5, 0.6), "read_after": (90.0, 1.5)},
+    # Messenger never reports failures: an undelivered message simply gets no receipt
+    "messenger": {"channel": "messenger", "fail": 0.01, "read": 0.6, "deliver": (1.0, 0.5), "read_after": (120.0, 1.5),
+                  "silent": {"failed"}},
+    "sendgrid": {"channel": "email", "fail": 0.03, "read": 0.25, "deliver": (8.0, 1.0), "read_after": (600.0, 1.2)},
+}
+
+TWILIO_ERRORS = ["30003", "30005", "30006", "30007", "30008"]
+AT_FAILURES = ["InsufficientCredit", "AbsentSubscriber", "UserInBlackList", "DeliveryFailure"]
+WHATSAPP_ERRORS = [(131026, "Message undeliverable"), (131047, "Re-engagement message"), (131051, "Unsupported message type")]
+SENDGRID_BOUNCES = ["550 5.1.1 The email account that you tried to reach does not exist", "552 5.2.2 Mailbox full"]
+
+
+class Callback:
+    __slots__ = ("at", "provider", "status", "message_id", "person", "seq")
+
+    def __init__(self, at: float, provider: str, status: str, message_id: str, person: dict, seq: int):
+        self.at = at
+        self.provider = provider
+        self.status = status
+        self.message_id = message_id
+        self.person = person
+        self.seq = seq
+
+    def __lt__(self, other: "Callback") -> bool:
+        return (self.at, self.seq) < (other.at, other.seq)
+
+
+def message_id(provider: str, rng: random.Random) -> str:
+    if provider == "twilio":
+        return f"SM{rng.getrandbits(128):032x}"
+    if provider == "africastalking":
+        return f"ATXid_{rng.getrandbits(128):032x}"
+    if provider == "whatsapp":
+        return f"wamid.HBgL{rng.getrandbits(192):048X}"
+    if provider == "messenger":
+        return f"m_{rng.getrandbits(256):064x}"
+    return f"{rng.getrandbits(96):024x}.filterdrecv-{rng.randrange(100):02d}-1"
+
+
+def lognormal(rng: random.Random, median: float, sigma: float) -> float:
+    return rng.lognormvariate(math.log(median), sigma)
+
+
+def callback_timeline(persons: list[dict], messages: int, providers: list[str], dispatch_rate: float,
+                      seed: int, read_delay_cap: float = 0.0) -> Iterator[Callback]:
+    """Yield callbacks in timeline order while only holding in-flight messages in memory.
+
+    ``read_delay_cap`` (simulated seconds, 0 for none) clips the delay from delivery to read.
+    """
+    rng = random.Random(seed)
+    pending: list[Callback] = []
+    seq = 0
+
+    for i in range(messages):
+        sent_at = i / dispatch_rate
+        while pending and pending[0].at <= sent_at:
+            yield heapq.heappop(pending)
+
+        provider = providers[i % len(providers)]
+        profile = PROVIDERS[provider]
+        person = persons[i % len(persons)]
+        mid = message_id(provider, rng)
+
+        events = [(sent_at + rng.uniform(0.05, 0.4), "sent")]
+        settled_at = sent_at + lognormal(rng, *profile["deliver"])
+        if rng.random() < profile["fail"]:
+            events.append((settled_at, "failed"))
+        else:
+            events.append((settled_at, "delivered"))
+            if profile["read_after"] and rng.random() < profile["read"]:
+                read_after = lognormal(rng, *profile["read_after"])
+                if read_delay_cap:
+                    read_after = min(read_after, read_delay_cap)
+                events.append((settled_at + read_after, "read"))
+
+        for at, status in events:
+            if status in profile.get("silent", ()):
+                continue
+            seq += 1
+            heapq.heappush(pending, Callback(at, provider, status, mid, person, seq))
+
+    while pending:
+        yield heapq.heappop(pending)
+
+
+def build_request(cb: Callback, rng: random.Random) -> tuple[str, bytes, str]:
+    """Return (path, body, content type) in the shape the provider really sends."""
+    person, status = cb.person, cb.status
+    epoch = int(1_767_225_600 + cb.at)
+
+    if cb.provider == "twilio":
+        fields = {
+            "MessageSid": cb.message_id,
+            "SmsSid": cb.message_id,
+            "AccountSid": "AC" + cb.message_id[2:],
+            "MessagingServiceSid": "MG" + cb.message_id[2:],
+            "From": "+15005550006",
+            "To": person["phone"],
+            "ApiVersion": "2010-04-01",
+            "SmsStatus": "undelivered" if status == "failed" else status,
+            "MessageStatus": "undelivered" if status == "failed" else status,
+        }
+        if status == "failed":
+            fields["ErrorCode"] = rng.choice(TWILIO_ERRORS)
+        return "/webhooks/twilio", urlencode(fields).encode(), "application/x-www-form-urlencoded"
+
+    if cb.provider == "africastalking":
+        fields = {
+            "id": cb.message_id,
+            "phoneNumber": person["phone"],
+            "networkCode": "63902",
+            "status": {"sent": "Sent", "delivered": "Success", "failed": "Failed"}[status],
+            "retryCount": "0",
+        }
+        if status == "failed":
+            fields["failureReason"] = rng.choice(AT_FAILURES)
+        return "/webhooks/africastalking", urlencode(fields).encode(), "application/x-www-form-urlencoded"
+
+    if cb.provider == "whatsapp":
+        entry = {
+            "id": cb.message_id,
+            "status": status,
+            "timestamp": str(epoch),
+            "recipient_id": "".join(ch for ch in person["phone"] if ch.isdigit()),
+            "conversation": {"id": f"{rng.getrandbits(64):016x}", "origin": {"type": "marketing"}},
+            "pricing": {"billable": True, "pricing_model": "CBP", "category": "marketing"},
+        }
+        if status == "failed":
+            code, title = rng.choice(WHATSAPP_ERRORS)
+            entry["errors"] = [{"code": code, "title": title}]
+        payload = {
+            "object": "whatsapp_business_account",
+            "entry": [{
+                "id": "102290129340398",
+                "changes": [{
+                    "field": "messages",
+                    "value": {
+                        "messaging_product": "whatsapp",
+                        "metadata": {"display_phone_number": "15550783881", "phone_number_id": "106540352242922"},
+                        "statuses": [entry],
+                    },
+                }],
+            }],
+        }
+        return "/webhooks/whatsapp", json.dumps(payload).encode(), "application/json"
+
+    if cb.provider == "messenger":
+        event = {"sender": {"id": "106540352242922"}, "recipient": {"id": f"{zlib.crc32(person['email'].encode()):016d}"},
+                 "timestamp": epoch * 1000}
+        if status == "sent":
+            event["message"] = {"mid": cb.message_id, "is_echo": True, "app_id": 1517776481860111}
+        elif status == "read":
+            event["sender"], event["recipient"] = event["recipient"], event["sender"]
+            event["read"] = {"watermark": epoch * 1000}
+        else:
+            event["sender"], event["recipient"] = event["recipient"], event["sender"]
+            event["delivery"] = {"mids": [cb.message_id], "watermark": epoch * 1000}
+        payload = {"object": "page", "entry": [{"id": "106540352242922", "time": epoch * 1000, "messaging": [event]}]}
+        return "/webhooks/messenger", json.dumps(payload).encode(), "application/json"
+
+    event_name = {"sent": "processed", "delivered": "delivered", "failed": "bounce", "read": "open"}[status]
+    event = {
+        "email": person["email"],
+        "timestamp": epoch,
+        "event": event_name,
+        "sg_event_id": f"{rng.getrandbits(128):032x}",
+        "sg_message_id": cb.message_id,
+        "smtp-id": f"<{cb.message_id}@ismtpd0001p1lon1.sendgrid.net>",
+        "category": ["group-message"],
+    }
+    if status == "failed":
+        event["reason"] = rng.choice(SENDGRID_BOUNCES)
+        event["type"] = "bounce"
+    return "/webhooks/sendgrid", json.dumps([event]).encode(), "application/json"
+
+
+# ── Local receiver stand-in ──
+
+def make_receiver(delay_ms: float) -> web.Application:
+    stats: Counter = Counter()
+
+    async def receive(request: web.Request) -> web.Response:
+        provider = request.match_info["provider"]
+        if request.content_type == "application/x-www-form-urlencoded":
+            form = await request.post()
+            status = form.get("MessageStatus") or form.get("status")
+            stats[f"{provider}.{str(status).lower()}"] += 1
+        else:
+            payload = await request.json()
+            if provider == "whatsapp":
+                for entry in payload["entry"]:
+                    for change in entry["changes"]:
+                        for st in change["value"].get("statuses", []):
+                            stats[f"whatsapp.{st['status']}"] += 1
+            elif provider == "messenger":
+                for entry in payload["entry"]:
+                    for event in entry["messaging"]:
+                        kind = "read" if "read" in event else "delivered" if "delivery" in event else "sent"
+                        stats[f"messenger.{kind}"] += 1
+            else:
+                for event in payload:
+                    stats[f"{provider}.{event['event']}"] += 1
+        stats["total"] += 1
+        if delay_ms:
+            await asyncio.sleep(delay_ms / 1000)
+        if provider == "twilio":
+            return web.Response(text="<Response/>", content_type="text/xml")
+        if provider == "africastalking":
+            return web.Response(status=200)
+        return web.json_response({"success": True})
+
+    async def report(request: web.Request) -> web.Response:
+        return web.json_response(dict(stats))
+
+    app = web.Application()
+    app.router.add_post("/webhooks/{provider}", receive)
+    app.router.add_get("/stats", report)
+    return app
+
+
+def serve(host: str, port: int, delay_ms: float) -> None:
+    web.run_app(make_receiver(delay_ms), host=host, port=port, print=None, access_log=None)
+
+
+# ── Storm client ──
+
+def percentiles(values: list[float]) -> dict[str, float]:
+    if not values:
+        return {}
+    ordered = sorted(values)
+    last = len(ordered) - 1
+    points = {"p50": 50, "p90": 90, "p99": 99, "p999": 99.9}
+    result = {name: round(ordered[min(last, int(pct / 100 * last + 0.5))] * 1000, 3) for name, pct in points.items()}
+    result["max"] = round(ordered[-1] * 1000, 3)
+    return result
+
+
+def throughput(completions: list[float], elapsed: float) -> dict[str, float]:
+    """Sustained, peak and average callbacks/sec from completion times (seconds since the start).
+
+    Completions are counted per second; seconds with at least a tenth of the peak count are busy,
+    and the sustained rate is taken over those, so an idle tail of late read receipts does not
+    dilute it.
+    """
+    if not completions:
+        return {"callbacks_per_sec": 0, "peak_callbacks_per_sec": 0, "average_callbacks_per_sec": 0,
+                "busy_seconds": 0}
+    buckets = Counter(int(t) for t in completions)
+    peak = max(buckets.values())
+    busy = [n for n in buckets.values() if n * 10 >= peak]
+    return {
+        "callbacks_per_sec": round(sum(busy) / len(busy), 1),
+        "peak_callbacks_per_sec": peak,
+        "average_callbacks_per_sec": round(len(completions) / elapsed, 1) if elapsed else 0,
+        "busy_seconds": len(busy),
+    }
+
+
+async def storm(target: str, timeline: Iterator[Callback], args: argparse.Namespace) -> dict:
+    rng = random.Random(args.seed + 1)
+    queue: asyncio.Queue = asyncio.Queue(maxsize=args.connections * 4)
+    latencies: list[float] = []
+    service: list[float] = []
+    completions: list[float] = []
+    sent: Counter = Counter()
+    errors: Counter = Counter()
+    loop = asyncio.get_running_loop()
+    min_gap = 1.0 / args.rate if args.rate else 0.0
+
+    async def produce(start: float) -> None:
+        next_slot = start
+        for cb in timeline:
+            due = max(start + cb.at / args.time_scale, next_slot)
+            next_slot = due + min_gap
+            await queue.put((due, cb))
+        for _ in range(args.connections):
+            await queue.put(None)
+
+    async def consume(session: ClientSession) -> None:
+        while True:
+            item = await queue.get()
+            if item is None:
+                return
+            due, cb = item
+            wait = due - loop.time()
+            if wait > 0:
+                await asyncio.sleep(wait)
+            path, body, content_type = build_request(cb, rng)
+            began = loop.time()
+            try:
+                async with session.post(target + path, data=body, headers={"Content-Type": content_type}) as resp:
+                    await resp.read()
+                    if resp.status >= 400:
+                        errors[f"http_{resp.status}"] += 1
+                        continue
+            except Exception as exc:  # noqa: BLE001 - count every transport failure, keep storming
+                errors[type(exc).__name__] += 1
+                continue
+            finished = loop.time()
+            latencies.append(finished - due)
+            service.append(finished - began)
+            completions.append(finished - start)
+            sent[f"{cb.provider}.{cb.status}"] += 1
+
+    connector = TCPConnector(limit=args.connections, keepalive_timeout=30, ttl_dns_cache=300)
+    async with ClientSession(connector=connector, timeout=ClientTimeout(total=30)) as session:
+        start = loop.time() + 0.05
+        started = time.perf_counter()
+        await asyncio.gather(produce(start), *(consume(session) for _ in range(args.connections)))
+        elapsed = time.perf_counter() - started
+        async with session.get(target + "/stats") as resp:
+            receiver_stats = await resp.json() if resp.status == 200 else {}
+
+    delivered = sum(sent.values())
+    return {
+        "target": target,
+        "callbacks_sent": delivered,
+        "errors": dict(errors),
+        "seconds": round(elapsed, 3),
+        **throughput(completions, elapsed),
+        "latency_ms": percentiles(latencies),
+        "service_time_ms": percentiles(service),
+        "by_status": dict(sorted(sent.items())),
+        "receiver": receiver_stats,
+    }
+
+
+async def wait_for_receiver(target: str, timeout: float = 10.0) -> None:
+    deadline = time.monotonic() + timeout
+    async with ClientSession() as session:
+        while True:
+            try:
+                async with session.get(target + "/stats") as resp:
+                    if resp.status == 200:
+                        return
+            except OSError:
+                if time.monotonic() > deadline:
+                    raise
+            await asyncio.sleep(0.05)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Fire a storm of delivery-status webhooks at a receiver")
+    parser.add_argument("--messages", type=int, default=20000, help="Messages in the synthetic group send (default: 20000)")
+    parser.add_argument("--providers", type=str, default=",".join(PROVIDERS), help="Comma-separated providers (default: all)")
+    parser.add_argument("--dispatch-rate", type=float, default=1000.0, help="Simulated group-send rate in messages/sec (default: 1000)")
+    parser.add_argument("--time-scale", type=float, default=100.0, help="Replay the simulated timeline N times faster (default: 100)")
+    parser.add_argument("--read-delay-cap", type=float, default=0.0,
+                        help="Cap on simulated seconds from delivery to read, 0 for none (default: 0)")
+    parser.add_argument("--rate", type=float, default=0.0, help="Cap on callbacks/sec sent, 0 for no cap (default: 0)")
+    parser.add_argument("--connections", type=int, default=32, help="Pooled keep-alive connections (default: 32)")
+    parser.add_argument("--persons", type=int, default=1000, help="Generated persons used as recipients (default: 1000)")
+    parser.add_argument("--locale", type=str, default="en_US", help="Faker locale (default: en_US)")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed for the timeline (default: 42)")
+    parser.add_argument("--target", type=str, default=None, help="Receiver base URL; starts the bundled receiver if omitted")
+    parser.add_argument("--serve", action="store_true", help="Only run the bundled receiver")
+    parser.add_argument("--host", type=str, default="127.0.0.1", help="Bundled receiver host (default: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=8765, help="Bundled receiver port (default: 8765)")
+    parser.add_argument("--receiver-delay-ms", type=float, default=0.0, help="Simulated processing time per callback in the bundled receiver")
+    parser.add_argument("--json", type=str, default=None, help="Optional path to write the report as JSON")
+    args = parser.parse_args()
+
+    if args.serve:
+        print(f"Receiving webhooks on http://{args.host}:{args.port}/webhooks/<provider>")
+        serve(args.host, args.port, args.receiver_delay_ms)
+        return
+
+    providers = [p for p in args.providers.split(",") if p]
+    unknown = sorted(set(providers) - set(PROVIDERS))
+    if unknown:
+        parser.error(f"unknown providers: {', '.join(unknown)}")
+
+    receiver = None
+    target = args.target
+    if target is None:
+        target = f"http://{args.host}:{args.port}"
+        receiver = multiprocessing.Process(target=serve, args=(args.host, args.port, args.receiver_delay_ms), daemon=True)
+        receiver.start()
+        asyncio.run(wait_for_receiver(target))
+    target = target.rstrip("/")
+
+    print(f"Generating {args.persons} persons with locale '{args.locale}'...")
+    persons = generate_persons(args.persons, args.locale)
+    timeline = callback_timeline(persons, args.messages, providers, args.dispatch_rate, args.seed,
+                                 args.read_delay_cap)
+
+    print(f"Storming {target} with callbacks for {args.messages} messages over {args.connections} connections...")
+    try:
+        report = asyncio.run(storm(target, timeline, args))
+    finally:
+        if receiver is not None:
+            receiver.terminate()
+            receiver.join()
+
+    latency = report["latency_ms"]
+    print(f"Sent {report['callbacks_sent']} callbacks in {report['seconds']}s: "
+          f"{report['callbacks_per_sec']} callbacks/sec sustained over {report['busy_seconds']} busy seconds, "
+          f"peak {report['peak_callbacks_per_sec']}, average {report['average_callbacks_per_sec']}; "
+          f"errors: {report['errors'] or 'none'}")
+    if latency:
+        print(f"Latency ms  p50={latency['p50']}  p90={latency['p90']}  p99={latency['p99']}  "
+              f"p999={latency['p999']}  max={latency['max']}")
+    print(f"Receiver counted {report['receiver'].get('total', 0)} callbacks")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"Saved report to {args.json}")
+
+
+if __name__ == "__main__":
+    main()
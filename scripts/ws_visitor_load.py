@@ -0,0 +1,366 @@
+"""
+Load-test the realtime visitor chat flow with thousands of concurrent WebSocket
+visitors built from generated persons.
+
+Each person becomes a visitor session: it opens a socket, then loops
+visitor_typing -> visitor_message frames with exponential think time and
+lognormal message sizes, waiting for the broker's ack before thinking again.
+Sessions drop their socket at random (--drop-rate) and reconnect with jittered
+exponential backoff, the way the chat widget does after a network blip.
+
+Unless --target is given, a minimal broker stand-in runs in a child process. It
+mimics the ws-connect / ws-visitor-message / push flow from
+docs/realtime/02-VISITOR-CHAT-FLOW.md: acks every message with a
+conversation_id and, for a share of them, pushes a conversation:message agent
+reply back after a short delay.
+
+Reported: connection-setup latency, message RTT (send -> ack) percentiles,
+reconnects, agent pushes received and client/broker memory per connection.
+
+Usage:
+    python scripts/ws_visitor_load.py
+    python scripts/ws_visitor_load.py --visitors 20000 --ramp-rate 2000 --duration 60
+    python scripts/ws_visitor_load.py --think-ms 500 --drop-rate 0.02 --json bench_output.json
+    python scripts/ws_visitor_load.py --serve --port 8766
+    python scripts/ws_visitor_load.py --target ws://localhost:8766/ws
+
+Requirements:
+    pip install faker aiohttp
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import multiprocessing
+import random
+import resource
+import time
+import uuid
+import zlib
+
+from aiohttp import ClientSession, ClientTimeout, TCPConnector, WSMsgType, web
+
+from generate_persons_csv import generate_persons
+
+
+def rss_bytes() -> int:
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * resource.getpagesize()
+    except OSError:
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+def raise_fd_limit() -> int:
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    if soft < hard:
+        resource.setrlimit(resource.RLIMIT_NOFILE, (hard, hard))
+    return resource.getrlimit(resource.RLIMIT_NOFILE)[0]
+
+
+# ── Broker stand-in ──
+
+def make_broker(agent_reply: float, agent_delay_ms: float) -> web.Application:
+    stats = {"connected": 0, "peak_connected": 0, "messages": 0, "pushes": 0, "baseline_rss": rss_bytes(), "peak_rss": 0}
+
+    async def agent_reply_later(ws: web.WebSocketResponse, conversation_id: str, content: str) -> None:
+        await asyncio.sleep(agent_delay_ms / 1000)
+        if ws.closed:
+            return
+        await ws.send_json({
+            "type": "conversation:message",
+            "data": {
+                "conversation_id": conversation_id,
+                "message_id": str(uuid.uuid4()),
+                "sender_type": "agent",
+                "content": f"Thanks, looking into: {content[:40]}",
+                "created_at": time.time(),
+            },
+        })
+        stats["pushes"] += 1
+
+    async def connect(request: web.Request) -> web.WebSocketResponse:
+        visitor_id = request.query.get("visitor_id", "")
+        ws = web.WebSocketResponse(heartbeat=30, max_msg_size=1 << 20)
+        await ws.prepare(request)
+        stats["connected"] += 1
+        if stats["connected"] > stats["peak_connected"]:
+            stats["peak_connected"] = stats["connected"]
+            stats["peak_rss"] = max(stats["peak_rss"], rss_bytes())
+        conversation_id = None
+        rng = random.Random(zlib.crc32(visitor_id.encode()))
+        try:
+            async for msg in ws:
+                if msg.type != WSMsgType.TEXT:
+                    continue
+                frame = json.loads(msg.data)
+                action = frame.get("action")
+                if action == "visitor_message":
+                    stats["messages"] += 1
+                    if conversation_id is None:
+                        conversation_id = str(uuid.uuid4())
+                    await ws.send_json({
+                        "type": "ack",
+                        "message_id": str(uuid.uuid4()),
+                        "conversation_id": conversation_id,
+                        "client_ref": frame.get("client_ref"),
+                        "created_at": time.time(),
+                    })
+                    if rng.random() < agent_reply:
+                        asyncio.ensure_future(agent_reply_later(ws, conversation_id, frame.get("content", "")))
+                elif action == "ping":
+                    await ws.send_json({"type": "pong"})
+        finally:
+            stats["connected"] -= 1
+        return ws
+
+    async def report(request: web.Request) -> web.Response:
+        return web.json_response(stats)
+
+    app = web.Application()
+    app.router.add_get("/ws", connect)
+    app.router.add_get("/stats", report)
+    return app
+
+
+def serve(host: str, port: int, agent_reply: float, agent_delay_ms: float) -> None:
+    raise_fd_limit()
+    web.run_app(make_broker(agent_reply, agent_delay_ms), host=host, port=port, print=None,
+                access_log=None, backlog=4096)
+
+
+# ── Visitor sessions ──
+
+class Stats:
+    def __init__(self):
+        self.connect_latency: list[float] = []
+        self.rtt: list[float] = []
+        self.connect_errors = 0
+        self.reconnects = 0
+        self.messages = 0
+        self.pushes = 0
+        self.open_sockets = 0
+        self.peak_sockets = 0
+        self.peak_rss = 0
+
+    def opened(self) -> None:
+        self.open_sockets += 1
+        if self.open_sockets > self.peak_sockets:
+            self.peak_sockets = self.open_sockets
+            # sampling RSS on every new peak is cheap enough and catches the high-water mark
+            self.peak_rss = max(self.peak_rss, rss_bytes())
+
+
+def message_text(rng: random.Random, person: dict, mean_chars: float) -> str:
+    size = max(1, min(4000, int(rng.lognormvariate(math.log(mean_chars), 0.8))))
+    base = f"Hi, this is {person['first_name']} from {person['city']}. {person['bio']} "
+    return (base * (size // len(base) + 1))[:size]
+
+
+async def visitor(session: ClientSession, target: str, person: dict, index: int, deadline: float,
+                  stats: Stats, args: argparse.Namespace) -> None:
+    rng = random.Random(args.seed + index)
+    visitor_id = f"vs_{zlib.crc32(person['email'].encode()):08x}{index:06x}"
+    url = f"{target}?visitor_id={visitor_id}&endpoint_id={args.endpoint_id}"
+    loop = asyncio.get_running_loop()
+    attempt = 0
+    seq = 0
+
+    while loop.time() < deadline:
+        began = loop.time()
+        try:
+            ws = await session.ws_connect(url, heartbeat=None, autoping=True)
+        except Exception:  # noqa: BLE001 - connection failures are a measured outcome
+            stats.connect_errors += 1
+            attempt += 1
+            await asyncio.sleep(min(30.0, 0.5 * 2 ** attempt) * rng.uniform(0.5, 1.0))
+            continue
+        stats.connect_latency.append(loop.time() - began)
+        stats.opened()
+        attempt = 0
+        try:
+            while loop.time() < deadline:
+                await asyncio.sleep(rng.expovariate(1000 / args.think_ms))
+                if loop.time() >= deadline:
+                    break
+                if rng.random() < args.drop_rate:
+                    stats.reconnects += 1
+                    break
+                seq += 1
+                ref = f"{visitor_id}:{seq}"
+                await ws.send_json({"action": "visitor_typing", "typing": True})
+                sent = loop.time()
+                await ws.send_json({
+                    "action": "visitor_message",
+                    "content": message_text(rng, person, args.message_chars),
+                    "content_type": "text",
+                    "email": person["email"],
+                    "client_ref": ref,
+                })
+                async for msg in ws:
+                    if msg.type != WSMsgType.TEXT:
+                        break
+                    frame = json.loads(msg.data)
+                    if frame.get("type") == "conversation:message":
+                        stats.pushes += 1
+                    elif frame.get("type") == "ack" and frame.get("client_ref") == ref:
+                        stats.rtt.append(loop.time() - sent)
+                        stats.messages += 1
+                        break
+                else:
+                    stats.reconnects += 1
+                    break
+        except Exception:  # noqa: BLE001 - a dropped socket just reconnects
+            stats.reconnects += 1
+        finally:
+            stats.open_sockets -= 1
+            await ws.close()
+
+
+def percentiles(values: list[float]) -> dict[str, float]:
+    if not values:
+        return {}
+    ordered = sorted(values)
+    last = len(ordered) - 1
+    points = {"p50": 50, "p90": 90, "p99": 99, "p999": 99.9}
+    result = {name: round(ordered[min(last, int(pct / 100 * last + 0.5))] * 1000, 3) for name, pct in points.items()}
+    result["max"] = round(ordered[-1] * 1000, 3)
+    return result
+
+
+async def run_load(target: str, persons: list[dict], args: argparse.Namespace) -> dict:
+    stats = Stats()
+    loop = asyncio.get_running_loop()
+    baseline_rss = rss_bytes()
+    connector = TCPConnector(limit=0, force_close=False)
+    timeout = ClientTimeout(total=None, sock_connect=30)
+
+    async with ClientSession(connector=connector, timeout=timeout) as session:
+        deadline = loop.time() + args.visitors / args.ramp_rate + args.duration
+        started = time.perf_counter()
+        tasks = []
+        for i in range(args.visitors):
+            person = persons[i % len(persons)]
+            tasks.append(asyncio.ensure_future(visitor(session, target, person, i, deadline, stats, args)))
+            if (i + 1) % max(1, int(args.ramp_rate / 100)) == 0:
+                await asyncio.sleep(0.01)
+        await asyncio.gather(*tasks)
+        elapsed = time.perf_counter() - started
+
+        broker = {}
+        stats_url = target.replace("ws://", "http://").replace("wss://", "https://").rsplit("/", 1)[0] + "/stats"
+        try:
+            async with session.get(stats_url) as resp:
+                if resp.status == 200:
+                    broker = await resp.json()
+        except Exception:  # noqa: BLE001 - a foreign target may not expose /stats
+            pass
+
+    peak = max(1, stats.peak_sockets)
+    report = {
+        "target": target,
+        "visitors": args.visitors,
+        "seconds": round(elapsed, 3),
+        "peak_open_sockets": stats.peak_sockets,
+        "connect_errors": stats.connect_errors,
+        "reconnects": stats.reconnects,
+        "messages_acked": stats.messages,
+        "messages_per_sec": round(stats.messages / elapsed, 1) if elapsed else 0,
+        "agent_pushes_received": stats.pushes,
+        "connect_latency_ms": percentiles(stats.connect_latency),
+        "message_rtt_ms": percentiles(stats.rtt),
+        "client_bytes_per_connection": round((stats.peak_rss - baseline_rss) / peak),
+    }
+    if broker.get("peak_connected"):
+        report["broker_bytes_per_connection"] = round(
+            (broker["peak_rss"] - broker["baseline_rss"]) / broker["peak_connected"])
+        report["broker"] = broker
+    return report
+
+
+async def wait_for_broker(target: str, timeout: float = 10.0) -> None:
+    stats_url = target.replace("ws://", "http://").rsplit("/", 1)[0] + "/stats"
+    deadline = time.monotonic() + timeout
+    async with ClientSession() as session:
+        while True:
+            try:
+                async with session.get(stats_url) as resp:
+                    if resp.status == 200:
+                        return
+            except OSError:
+                if time.monotonic() > deadline:
+                    raise
+            await asyncio.sleep(0.05)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="WebSocket visitor-chat load client")
+    parser.add_argument("--visitors", type=int, default=2000, help="Concurrent visitor sessions (default: 2000)")
+    parser.add_argument("--ramp-rate", type=float, default=1000.0, help="New sessions opened per second (default: 1000)")
+    parser.add_argument("--duration", type=float, default=20.0, help="Seconds to hold sessions after ramp-up (default: 20)")
+    parser.add_argument("--think-ms", type=float, default=2000.0, help="Mean visitor think time between messages (default: 2000)")
+    parser.add_argument("--message-chars", type=float, default=80.0, help="Median message length in characters (default: 80)")
+    parser.add_argument("--drop-rate", type=float, default=0.01, help="Chance a session drops and reconnects before each message (default: 0.01)")
+    parser.add_argument("--endpoint-id", type=str, default="chat-endpoint-load-test", help="Chat endpoint id sent on connect")
+    parser.add_argument("--persons", type=int, default=1000, help="Generated persons used as visitors (default: 1000)")
+    parser.add_argument("--locale", type=str, default="en_US", help="Faker locale (default: en_US)")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed for visitor behavior (default: 42)")
+    parser.add_argument("--target", type=str, default=None, help="Broker WebSocket URL; starts the bundled broker if omitted")
+    parser.add_argument("--serve", action="store_true", help="Only run the bundled broker")
+    parser.add_argument("--host", type=str, default="127.0.0.1", help="Bundled broker host (default: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=8766, help="Bundled broker port (default: 8766)")
+    parser.add_argument("--agent-reply", type=float, default=0.3, help="Share of messages the broker answers with an agent push (default: 0.3)")
+    parser.add_argument("--agent-delay-ms", type=float, default=250.0, help="Delay before the broker's agent push (default: 250)")
+    parser.add_argument("--json", type=str, default=None, help="Optional path to write the report as JSON")
+    args = parser.parse_args()
+
+    if args.serve:
+        print(f"Accepting visitors on ws://{args.host}:{args.port}/ws")
+        serve(args.host, args.port, args.agent_reply, args.agent_delay_ms)
+        return
+
+    fd_limit = raise_fd_limit()
+    if fd_limit < args.visitors + 64:
+        print(f"Warning: open file limit is {fd_limit}, below the {args.visitors} sockets requested")
+
+    broker = None
+    target = args.target
+    if target is None:
+        target = f"ws://{args.host}:{args.port}/ws"
+        broker = multiprocessing.Process(
+            target=serve, args=(args.host, args.port, args.agent_reply, args.agent_delay_ms), daemon=True)
+        broker.start()
+        asyncio.run(wait_for_broker(target))
+
+    print(f"Generating {args.persons} persons with locale '{args.locale}'...")
+    persons = generate_persons(args.persons, args.locale)
+
+    print(f"Opening {args.visitors} visitor sessions against {target}...")
+    try:
+        report = asyncio.run(run_load(target, persons, args))
+    finally:
+        if broker is not None:
+            broker.terminate()
+            broker.join()
+
+    setup, rtt = report["connect_latency_ms"], report["message_rtt_ms"]
+    print(f"Peak {report['peak_open_sockets']} open sockets, {report['connect_errors']} connect errors, "
+          f"{report['reconnects']} reconnects")
+    if setup:
+        print(f"Connect ms  p50={setup['p50']}  p99={setup['p99']}  max={setup['max']}")
+    if rtt:
+        print(f"RTT ms      p50={rtt['p50']}  p90={rtt['p90']}  p99={rtt['p99']}  max={rtt['max']}")
+    print(f"{report['messages_acked']} messages acked ({report['messages_per_sec']}/sec), "
+          f"{report['agent_pushes_received']} agent pushes received")
+    print(f"Memory per connection: client {report['client_bytes_per_connection']} B"
+          + (f", broker {report['broker_bytes_per_connection']} B" if "broker_bytes_per_connection" in report else ""))
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"Saved report to {args.json}")
+
+
+if __name__ == "__main__":
+    main()